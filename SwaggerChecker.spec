@@ -1,11 +1,14 @@
 # -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_data_files
 
+# Construction en répertoire (onedir) : contrairement à un exécutable unique (onefile), rien n'est
+# extrait dans un répertoire temporaire à chaque lancement.
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('config/projet_validation_rules.json', 'config'), ('C:\\Users\\lucas\\innovation_enedis\\swagger-validator\\venv\\Lib\\site-packages\\openapi_spec_validator\\resources\\schemas\\v3.1\\schema.json', 'openapi_spec_validator/resources/schemas/v3.1')],
+    datas=[('config/projet_validation_rules.json', 'config')] + collect_data_files('openapi_spec_validator'),
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -19,16 +22,14 @@ pyz = PYZ(a.pure)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='SwaggerChecker',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
     upx_exclude=[],
-    runtime_tmpdir=None,
     console=True,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -36,3 +37,13 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='SwaggerChecker',
+)
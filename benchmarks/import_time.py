@@ -0,0 +1,64 @@
+"""
+Mesure le coût des imports au démarrage avec `python -X importtime`.
+
+    python -m benchmarks.import_time                                   # src.cli.command_line
+    python -m benchmarks.import_time src.validators.projet.projet_rules_validator --top 15
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Modules coûteux que la ligne de commande ne doit importer qu'au premier besoin.
+HEAVY_MODULES = ("tkinter", "yaml", "jsonschema", "openapi_spec_validator", "referencing", "multiprocessing")
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+def import_times(code):
+    """
+    Exécute du code dans un interpréteur neuf avec `-X importtime`.
+
+    Args:
+        code (str): Code exécuté, par exemple "import src.cli.command_line".
+
+    Returns:
+        dict: Module importé -> (temps propre, temps cumulé) en microsecondes, dans l'ordre de la fin de
+        leur import. Les modules importés avant `code` (démarrage de l'interpréteur, `site`) en font partie.
+    """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=_ROOT, capture_output=True,
+                               text=True, check=True)
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        if own.strip().isdigit():
+            times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+def heavy_imports(times):
+    """
+    Args:
+        times (dict): Résultat de `import_times`.
+
+    Returns:
+        list: Les paquets de `HEAVY_MODULES` importés.
+    """
+    return sorted({name.split(".")[0] for name in times} & set(HEAVY_MODULES))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Coût des imports d'un module de SwaggerChecker.")
+    parser.add_argument("module", nargs="?", default="src.cli.command_line", help="Module à importer.")
+    parser.add_argument("--top", type=int, default=10, help="Nombre de modules les plus coûteux affichés.")
+    args = parser.parse_args(argv)
+
+    times = import_times(f"import {args.module}")
+    print(f"{args.module} : {times[args.module][1] / 1000:.1f} ms (cumulé)")
+    for name, (own, _) in sorted(times.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f"  {own / 1000:>8.1f} ms  {name}")
+    heavy = heavy_imports(times)
+    print("Modules lourds importés : " + (", ".join(heavy) if heavy else "aucun"))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
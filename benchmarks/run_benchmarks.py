@@ -0,0 +1,197 @@
+"""
+Mesure le temps et la mémoire de chaque validateur sur des documents générés de tailles croissantes.
+
+    python -m benchmarks.run_benchmarks                       # toutes les tailles
+    python -m benchmarks.run_benchmarks --sizes 10 1000       # tailles choisies
+    python -m benchmarks.run_benchmarks --save benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --compare benchmarks/baseline.json
+
+Avec `--compare`, les mesures dépassant celles de la référence de plus de `--threshold` sont
+signalées et le code de sortie vaut 1.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.spec_generator import generate_spec, write_spec
+from src.utils.swagger_loader import load_swagger_document
+from src.validators.openapi.openapi_validator import OpenAPIValidator
+from src.validators.projet.compiled_rules import CompiledRules
+from src.validators.projet.headers.header_validator import HeaderValidator
+from src.validators.projet.info.info_validator import InfoValidator
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator, default_rules_config_path
+from src.validators.projet.query_params.query_param_validator import QueryParamValidator
+from src.validators.projet.reserved_keywords.reserved_header_validator import ReservedHeaderValidator
+from src.validators.projet.reserved_keywords.reserved_path_validator import ReservedPathValidator
+from src.validators.projet.reserved_keywords.reserved_query_param_validator import ReservedQueryParamValidator
+from src.validators.projet.reserved_keywords.special_character_validator import SpecialCharacterValidator
+from src.validators.projet.responses.response_validator import ResponseValidator
+
+SIZES = (10, 1000, 10000, 50000)
+# Au-delà, le chargement YAML (PyYAML en Python pur) et la validation OpenAPI (jsonschema, plus d'une
+# heure à 50 000 opérations avec le suivi des allocations) ne sont pas mesurés : ils dominent la durée du banc.
+YAML_MAX_OPERATIONS = 10000
+OPENAPI_MAX_OPERATIONS = 10000
+# Écarts absolus en dessous desquels une différence est considérée comme du bruit de mesure.
+NOISE_SECONDS = 0.005
+NOISE_MIB = 0.5
+
+def benchmark_cases(rules):
+    """
+    Retourne les cas mesurés : chaque cas reçoit le document chargé et les fichiers JSON et YAML.
+
+    Args:
+        rules (CompiledRules): Les règles du projet.
+
+    Returns:
+        list: Tuples (nom, fonction(document, chemins)).
+    """
+    return [
+        ("load_swagger.json", lambda document, paths: load_swagger_document(paths["json"])),
+        ("load_swagger.yaml", lambda document, paths: load_swagger_document(paths["yaml"])),
+        ("openapi", lambda document, paths: list(OpenAPIValidator(document, None).iter_records())),
+        ("projet.info", lambda document, paths: list(InfoValidator(document, None).iter_findings())),
+        ("projet.reserved_path", lambda document, paths:
+            ReservedPathValidator(document, None, rules.reserved_paths).validate_reserved_paths()),
+        ("projet.reserved_header", lambda document, paths:
+            ReservedHeaderValidator(document, None, rules.reserved_headers).validate_reserved_headers()),
+        ("projet.reserved_query_parameter", lambda document, paths:
+            ReservedQueryParamValidator(document, None, rules.reserved_query_parameters).validate_reserved_query_parameters()),
+        ("projet.header", lambda document, paths: HeaderValidator(document, None, rules).validate_headers()),
+        ("projet.query_parameter", lambda document, paths:
+            QueryParamValidator(document, None, rules).validate_query_parameters()),
+        ("projet.response", lambda document, paths: ResponseValidator(document, None, rules).validate_responses()),
+        ("projet.special_character", lambda document, paths:
+            SpecialCharacterValidator(document, None, rules.special_characters).validate_all_values()),
+        ("projet.all", lambda document, paths: ProjetRulesValidator(document, None, rules=rules).validate()),
+    ]
+
+def measure(function, repeat, setup=lambda: None):
+    """
+    Mesure une fonction : meilleur temps sur `repeat` exécutions, puis pic de mémoire sur une exécution.
+
+    Args:
+        function: Fonction à mesurer, appelée avec le résultat de `setup`.
+        repeat (int): Nombre d'exécutions chronométrées.
+        setup: Fonction sans argument appelée (hors mesure) avant chaque exécution.
+
+    Returns:
+        dict: `seconds` (meilleur temps) et `peak_mib` (pic des allocations Python pendant l'exécution).
+    """
+    best = None
+    for _ in range(repeat):
+        argument = setup()
+        started = time.perf_counter()
+        function(argument)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    argument = setup()
+    tracemalloc.start()
+    try:
+        function(argument)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": round(best, 6), "peak_mib": round(peak / (1024 * 1024), 3)}
+
+def run(sizes=SIZES, repeat=3, seed=0, rules=None, log=None, cases=None):
+    """
+    Exécute tous les cas pour chaque taille de document.
+
+    Args:
+        sizes (list): Nombres d'opérations des documents générés.
+        repeat (int): Nombre d'exécutions chronométrées par cas (une seule à partir de 10 000 opérations).
+        seed (int): Graine du générateur de documents.
+        rules (dict, optional): Règles du projet (par défaut, `config/projet_validation_rules.json`).
+        log (optional): Flux où écrire chaque mesure au fur et à mesure.
+        cases (list, optional): Noms des cas à mesurer (par défaut, tous).
+
+    Returns:
+        dict: `{"meta": {...}, "results": {taille: {cas: mesure}}}`.
+    """
+    if rules is None:
+        rules = ProjetRulesValidator.load_validation_rules(default_rules_config_path())
+    compiled = CompiledRules(rules)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            spec = generate_spec(size, seed=seed, violation_rate=0.05, rules=rules)
+            paths = {"json": os.path.join(directory, f"spec{size}.json"), "yaml": os.path.join(directory, f"spec{size}.yaml")}
+            write_spec(spec, paths["json"])
+            if size <= YAML_MAX_OPERATIONS:
+                write_spec(spec, paths["yaml"])
+            del spec
+
+            results[str(size)] = size_results = {}
+            for name, case in benchmark_cases(compiled):
+                if (cases and name not in cases) or (name == "load_swagger.yaml" and size > YAML_MAX_OPERATIONS) \
+                        or (name == "openapi" and size > OPENAPI_MAX_OPERATIONS):
+                    continue
+                # Un document neuf par exécution : les index calculés à la demande (texte, positions) font
+                # partie du coût mesuré.
+                size_results[name] = measure(lambda document: case(document, paths), repeat if size < 10000 else 1,
+                                             lambda: load_swagger_document(paths["json"]))
+                if log is not None:
+                    log.write(f"{size:>7} {name:<32} {size_results[name]['seconds']:>10.4f} s "
+                              f"{size_results[name]['peak_mib']:>10.2f} MiB\n")
+                    log.flush()
+    return {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(), "seed": seed},
+        "results": results,
+    }
+
+def compare(current, baseline, threshold=1.5):
+    """
+    Compare des mesures à une référence.
+
+    Args:
+        current (dict): Résultat de `run`.
+        baseline (dict): Résultat de référence (même format).
+        threshold (float): Rapport au-delà duquel une mesure est une régression.
+
+    Returns:
+        list: Les régressions, sous forme de messages.
+    """
+    regressions = []
+    for size, cases in current["results"].items():
+        for name, measurement in cases.items():
+            reference = baseline.get("results", {}).get(size, {}).get(name)
+            if reference is None:
+                continue
+            for key, unit, noise in (("seconds", "s", NOISE_SECONDS), ("peak_mib", "MiB", NOISE_MIB)):
+                value, expected = measurement[key], reference[key]
+                if value > expected * threshold and value - expected > noise:
+                    regressions.append(f"{name} ({size} opérations) : {value:.4f} {unit} au lieu de {expected:.4f} {unit}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc de mesure des validateurs sur des documents générés.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="Nombres d'opérations.")
+    parser.add_argument("--repeat", type=int, default=3, help="Exécutions chronométrées par cas.")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du générateur.")
+    parser.add_argument("--cases", nargs="+", default=None, help="Cas à mesurer, par exemple 'openapi projet.all'.")
+    parser.add_argument("--save", default=None, help="Enregistre les mesures dans ce fichier (référence).")
+    parser.add_argument("--compare", default=None, help="Compare les mesures à ce fichier de référence.")
+    parser.add_argument("--threshold", type=float, default=1.5, help="Rapport signalé comme régression.")
+    args = parser.parse_args(argv)
+
+    current = run(args.sizes, args.repeat, args.seed, log=sys.stdout, cases=args.cases)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(current, file, indent=2)
+            file.write("\n")
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            regressions = compare(current, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"RÉGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+import json
+import random
+import yaml
+
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator, default_rules_config_path
+
+# Violations introduites dans une opération, avec la règle du projet qu'elles déclenchent.
+VIOLATIONS = (
+    "missing_header",       # header.missing
+    "header_type",          # header.type
+    "reserved_path",        # reserved.path
+    "reserved_header",      # reserved.header
+    "reserved_query",       # reserved.query_parameter
+    "special_character",    # special_character
+    "response_type",        # response.type
+)
+
+# Nombre de composants `parameters` partagés pour les paramètres de requête additionnels
+_SHARED_PARAMETERS = 50
+
+def _component_name(method, header_name):
+    return method.capitalize() + ''.join(part.capitalize() for part in header_name.split('-'))
+
+def _header_parameter(rule):
+    schema = {"type": rule.get("type", "string")}
+    example = rule.get("x-example", rule.get("example"))
+    if example is not None:
+        schema["example"] = example
+    return {
+        "name": rule["name"],
+        "in": "header",
+        "required": bool(rule.get("required")),
+        "description": rule.get("description", ""),
+        "schema": schema,
+    }
+
+def _nested_schemas(depth):
+    """
+    Schémas `Item0` ... `Item{depth}` : chacun référence le suivant par la propriété `child`.
+    """
+    schemas = {}
+    for level in range(depth + 1):
+        properties = {"id": {"type": "integer"}, "label": {"type": "string"}}
+        if level < depth:
+            properties["child"] = {"$ref": f"#/components/schemas/Item{level + 1}"}
+        schemas[f"Item{level}"] = {"type": "object", "properties": properties}
+    return schemas
+
+def generate_spec(operations=10, seed=0, parameters=2, ref_fanout=0.5, nesting_depth=2, violation_rate=0.0,
+                  rules=None):
+    """
+    Génère un document OpenAPI 3.1 synthétique et déterministe.
+
+    Les opérations (GET et POST, deux par chemin) portent les en-têtes et les réponses attendus par
+    les règles du projet, si bien qu'un document sans violation ne déclenche aucune règle du projet.
+    Seul `basePath`, exigé par les règles du projet, n'est pas autorisé par la norme OpenAPI 3.1.
+
+    Args:
+        operations (int): Nombre d'opérations.
+        seed (int): Graine du générateur pseudo-aléatoire ; une même graine produit le même document.
+        parameters (int): Nombre de paramètres de requête additionnels par opération.
+        ref_fanout (float): Proportion (0 à 1) des paramètres et réponses définis par `$ref` vers un
+            composant partagé plutôt qu'en ligne.
+        nesting_depth (int): Profondeur de la chaîne de schémas référencés par la réponse 200.
+        violation_rate (float): Proportion (0 à 1) des opérations contenant une violation (voir `VIOLATIONS`).
+        rules (dict, optional): Règles du projet (par défaut, `config/projet_validation_rules.json`).
+
+    Returns:
+        dict: Le document généré.
+    """
+    if rules is None:
+        rules = ProjetRulesValidator.load_validation_rules(default_rules_config_path())
+    rng = random.Random(seed)
+
+    components = {
+        "parameters": {},
+        "schemas": _nested_schemas(nesting_depth),
+        "responses": {},
+    }
+    components["schemas"]["Error"] = {
+        "type": "object",
+        "properties": {"error": {"type": "string"}, "error_description": {"type": "string"}},
+        "required": ["error", "error_description"],
+    }
+    for index in range(_SHARED_PARAMETERS):
+        components["parameters"][f"Filter{index}"] = {
+            "name": f"filter{index}", "in": "query", "required": False, "schema": {"type": "string"},
+        }
+    components["responses"]["Error"] = {
+        "description": "Erreur",
+        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Error"}}},
+    }
+
+    method_rules = {}
+    for method in ("get", "post"):
+        method_rules[method] = rules.get(method.upper(), {})
+        for rule in method_rules[method].get("headers", []):
+            components["parameters"][_component_name(method, rule["name"])] = _header_parameter(rule)
+
+    def build_response(response_rule):
+        expected = response_rule["format"]
+        if expected.get("properties"):
+            if rng.random() < ref_fanout:
+                return {"$ref": "#/components/responses/Error"}
+            schema = {"$ref": "#/components/schemas/Error"}
+        else:
+            schema = {"type": expected.get("type", "object"),
+                      "properties": {"data": {"$ref": "#/components/schemas/Item0"}}}
+        return {"description": "Réponse", "content": {"application/json": {"schema": schema}}}
+
+    paths = {}
+    for index in range(operations):
+        method = ("get", "post")[index % 2]
+        violation = rng.choice(VIOLATIONS) if rng.random() < violation_rate else None
+        path = f"/api/v1/resource{index // 2}"
+        if violation == "reserved_path":
+            path = f"/api/v1/admin/resource{index // 2}"
+
+        operation_parameters = []
+        for rule in method_rules[method].get("headers", []):
+            if violation == "missing_header" and rule["name"] == "Authorization":
+                continue
+            if violation == "header_type" and rule["name"] == "Accept":
+                operation_parameters.append(dict(_header_parameter(rule), schema={"type": "integer"}))
+            elif rng.random() < ref_fanout:
+                operation_parameters.append({"$ref": f"#/components/parameters/{_component_name(method, rule['name'])}"})
+            else:
+                operation_parameters.append(_header_parameter(rule))
+        for position in range(parameters):
+            shared = rng.randrange(_SHARED_PARAMETERS)
+            if rng.random() < ref_fanout:
+                operation_parameters.append({"$ref": f"#/components/parameters/Filter{shared}"})
+            else:
+                operation_parameters.append({"name": f"field{position}", "in": "query", "required": False,
+                                             "schema": {"type": "string"}})
+        if violation == "reserved_header":
+            operation_parameters.append({"name": "toto", "in": "header", "schema": {"type": "string"}})
+        if violation == "reserved_query":
+            operation_parameters.append({"name": "john", "in": "query", "schema": {"type": "string"}})
+
+        responses = {str(response["response_code"]): build_response(response)
+                     for response in method_rules[method].get("responses", [])}
+        if not responses:
+            responses["200"] = {"description": "Réponse"}
+        if violation == "response_type" and "200" in responses:
+            responses["200"] = {"description": "Réponse", "content": {"application/json": {"schema": {"type": "array"}}}}
+
+        summary = f"Opération {index}"
+        if violation == "special_character":
+            summary += " ~ brouillon"
+        paths.setdefault(path, {})[method] = {
+            "operationId": f"{method}Resource{index}",
+            "summary": summary,
+            "parameters": operation_parameters,
+            "responses": responses,
+        }
+
+    return {
+        "openapi": "3.1.0",
+        "info": {"title": "synthetic", "version": "v1", "description": f"{operations} opérations générées"},
+        "basePath": "/synthetic/v1",
+        "paths": paths,
+        "components": components,
+    }
+
+def write_spec(spec, file_path):
+    """
+    Écrit un document généré en JSON ou en YAML, selon l'extension du fichier.
+
+    Args:
+        spec (dict): Le document.
+        file_path (str): Fichier à écrire (`.json`, `.yaml` ou `.yml`).
+    """
+    with open(file_path, 'w', encoding='utf-8') as file:
+        if file_path.endswith(('.yaml', '.yml')):
+            yaml.dump(spec, file, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper), allow_unicode=True, sort_keys=False)
+        else:
+            json.dump(spec, file, ensure_ascii=False, indent=2)
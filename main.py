@@ -1,4 +1,4 @@
-from src.gui.user_interface import UserInterface
+import sys
 
 def main():
     """
@@ -9,12 +9,22 @@ def main():
     La boucle principale est responsable de maintenir l'application active,
     en attente des interactions de l'utilisateur.
 
+    Si des arguments sont fournis (par exemple `main.py check specs/ --jobs 8`),
+    la ligne de commande sans interface graphique est exécutée à la place.
+
     Fonctionnement:
     ---------------
     1. Crée une instance de `UserInterface`, qui configure et affiche l'interface graphique.
     2. Appelle `app.mainloop()` pour démarrer la boucle principale Tkinter,
        permettant à l'utilisateur d'interagir avec l'application.
     """
+    if len(sys.argv) > 1:
+        from src.cli.command_line import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+
+    # tkinter et l'interface ne sont importés que pour le mode graphique : la ligne de commande n'en dépend pas.
+    from src.gui.user_interface import UserInterface
+
     app = UserInterface()
     
     app.mainloop()
@@ -24,4 +34,6 @@ if __name__ == "__main__":
     Vérifie si le script est exécuté directement (et non importé comme un module).
     Si oui, appelle la fonction `main()` pour démarrer l'application.
     """
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_namespace_packages
 
 setup(
     name="swagger-validator",
@@ -6,16 +6,20 @@ setup(
     description="A Python project to validate Swagger (OpenAPI) specifications and ensure they meet project-specific rules.",
     author="Votre Nom",
     author_email="votre.email@example.com",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
+    # Les modules s'importent sous la forme `src.<...>` (paquets sans __init__.py) ; le fichier des règles
+    # est installé à côté de `src`, là où `default_rules_config_path` le cherche.
+    packages=find_namespace_packages(include=["src", "src.*", "config"]),
+    package_data={"config": ["*.json"]},
+    py_modules=["main"],
     install_requires=[
         "openapi-spec-validator",
         "PyYAML",
-        "tkinter"  # Note: tkinter is part of the standard library, no need to install separately
+        # tkinter fait partie de la bibliothèque standard : il ne s'installe pas avec pip.
     ],
     entry_points={
         "console_scripts": [
             "swagger-validator=main:main",
+            "swaggerchecker=src.cli.command_line:main",
         ],
     },
     classifiers=[
@@ -0,0 +1,196 @@
+import glob
+import hashlib
+import os
+import time
+
+from src.utils.parse_cache import ParseCache
+from src.utils.swagger_loader import load_swagger_document
+from src.validators.openapi.openapi_validator import OpenAPIValidator
+from src.validators.projet.compiled_rules import CompiledRules
+from src.validators.projet.incremental_cache import IncrementalCache
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator
+
+SPEC_EXTENSIONS = ('.json', '.yaml', '.yml')
+
+# Règles du projet, répertoire du cache incrémental, points d'observation, validation OpenAPI, nombre de
+# processus entre lesquels répartir les chemins d'un fichier et cache d'analyse, reçus une seule fois par
+# chaque processus de travail (voir `_init_worker`).
+_worker_rules = None
+_worker_cache_dir = None
+_worker_hooks = None
+_worker_openapi = True
+_worker_path_jobs = 1
+_worker_parse_cache = None
+
+def discover_specs(targets):
+    """
+    Recherche les fichiers Swagger à valider.
+
+    Args:
+        targets (list): Répertoires (parcourus récursivement), motifs glob ou chemins de fichiers.
+
+    Returns:
+        list: Chemins des fichiers `.json`, `.yaml` et `.yml` trouvés, sans doublons, dans un ordre stable.
+    """
+    found = []
+    for target in targets:
+        if os.path.isdir(target):
+            for root, dirs, files in os.walk(target):
+                dirs.sort()
+                found.extend(os.path.join(root, name) for name in sorted(files) if name.lower().endswith(SPEC_EXTENSIONS))
+        elif glob.has_magic(target):
+            found.extend(path for path in sorted(glob.glob(target, recursive=True))
+                         if os.path.isfile(path) and path.lower().endswith(SPEC_EXTENSIONS))
+        elif os.path.isfile(target):
+            found.append(target)
+    return list(dict.fromkeys(found))
+
+def _init_worker(rules, cache_dir=None, hooks=None, openapi=True, path_jobs=1, parse_cache_dir=None):
+    """
+    Initialise un processus de travail avec les règles du projet, transmises une seule fois.
+
+    Args:
+        rules (dict | CompiledRules): Règles de validation du projet (compilées une seule fois par processus si
+            elles ne le sont pas déjà).
+        cache_dir (str, optional): Répertoire des caches incrémentaux (un fichier par Swagger).
+        hooks (ValidationHooks, optional): Points d'observation des validations (validation dans le processus courant uniquement).
+        openapi (bool): Valider aussi les fichiers contre la norme OpenAPI.
+        path_jobs (int): Nombre de processus entre lesquels répartir les chemins de chaque fichier (voir
+            `ProjetRulesValidator.iter_findings`).
+        parse_cache_dir (str, optional): Répertoire du cache d'analyse (voir `ParseCache`), partagé par les processus.
+    """
+    global _worker_rules, _worker_cache_dir, _worker_hooks, _worker_openapi, _worker_path_jobs, _worker_parse_cache
+    _worker_rules = CompiledRules.coerce(rules)
+    _worker_cache_dir = cache_dir
+    _worker_hooks = hooks
+    _worker_openapi = openapi
+    _worker_path_jobs = path_jobs
+    _worker_parse_cache = ParseCache(parse_cache_dir) if parse_cache_dir else None
+
+def cache_path_for(cache_dir, file_path):
+    """
+    Retourne le fichier du cache incrémental associé à un fichier Swagger.
+
+    Args:
+        cache_dir (str): Répertoire des caches.
+        file_path (str): Chemin du fichier Swagger.
+
+    Returns:
+        str: Le chemin du fichier de cache.
+    """
+    name = hashlib.sha256(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f"{name}.json")
+
+def check_spec(file_path):
+    """
+    Valide un fichier Swagger contre la norme OpenAPI et les règles du projet.
+
+    Args:
+        file_path (str): Chemin du fichier Swagger.
+
+    Returns:
+        dict: Résultat sérialisable en JSON (`file`, `valid`, puis `openapi` et `projet`, ou `error` si le
+        fichier n'a pas pu être chargé ou si les règles du projet ont échoué sur ce fichier ; sans validation
+        OpenAPI, `openapi` est absent).
+    """
+    try:
+        document = _load(file_path)
+    except ValueError as e:
+        return {"file": file_path, "valid": False, "error": str(e)}
+
+    openapi_errors = validate_openapi(document, _worker_hooks) if _worker_openapi else None
+    cache = None
+    if _worker_cache_dir:
+        cache = IncrementalCache(cache_path_for(_worker_cache_dir, file_path), context=_worker_rules.source)
+    projet_validator = ProjetRulesValidator(document, None, rules=_worker_rules, hooks=_worker_hooks)
+    try:
+        projet_errors = list(projet_validator.iter_errors(cache, _worker_path_jobs))
+    except Exception as e:
+        # Une erreur inattendue des règles du projet n'interrompt pas la validation des autres fichiers.
+        return {"file": file_path, "valid": False, "error": f"Erreur lors de la validation des règles du projet: {str(e)}"}
+    if cache is not None:
+        cache.save()
+
+    return build_record(file_path, openapi_errors, projet_errors)
+
+def _load(file_path):
+    """
+    Charge un fichier Swagger ; le chargement est compté comme un validateur ("load_swagger") lorsque
+    les validations sont observées.
+    """
+    if _worker_hooks is None:
+        return load_swagger_document(file_path, _worker_parse_cache)
+    _worker_hooks.validator_started("load_swagger")
+    started = time.perf_counter()
+    try:
+        return load_swagger_document(file_path, _worker_parse_cache)
+    finally:
+        _worker_hooks.validator_finished("load_swagger", time.perf_counter() - started)
+
+def validate_openapi(document, hooks=None):
+    """
+    Valide un document contre la norme OpenAPI.
+
+    Args:
+        document (SpecDocument): Le document à valider.
+        hooks (ValidationHooks, optional): Points d'observation de la validation.
+
+    Returns:
+        list: Les messages d'erreur OpenAPI (une erreur inattendue du validateur est rapportée comme une erreur).
+    """
+    try:
+        return list(OpenAPIValidator(document, None, hooks).iter_errors())
+    except Exception as e:
+        return [f"Erreur lors de la validation OpenAPI: {str(e)}"]
+
+def build_record(file_path, openapi_errors, projet_errors):
+    """
+    Construit le résultat sérialisable en JSON de la validation d'un fichier.
+
+    Args:
+        file_path (str): Chemin du fichier Swagger.
+        openapi_errors (list): Messages d'erreur OpenAPI, ou None si le fichier n'a pas été validé contre la norme OpenAPI.
+        projet_errors (list): Messages d'erreur des règles du projet.
+
+    Returns:
+        dict: Le résultat (`file`, `valid`, `openapi` et `projet`).
+    """
+    record = {"file": file_path, "valid": not openapi_errors and not projet_errors}
+    if openapi_errors is not None:
+        record["openapi"] = {"valid": not openapi_errors, "errors": openapi_errors}
+    record["projet"] = {"valid": not projet_errors, "errors": projet_errors}
+    return record
+
+def check_specs(files, rules, jobs=1, cache_dir=None, hooks=None, openapi=True, parse_cache_dir=None):
+    """
+    Valide une liste de fichiers Swagger, en parallèle sur un pool de processus si `jobs` > 1. Un fichier
+    seul est validé dans le processus courant, ses chemins étant répartis entre `jobs` processus.
+
+    Args:
+        files (list): Chemins des fichiers Swagger.
+        rules (dict | CompiledRules): Règles de validation du projet, transmises à chaque processus via son initialiseur.
+        jobs (int): Nombre de processus de travail.
+        cache_dir (str, optional): Répertoire des caches incrémentaux ; sans répertoire, tout est réévalué.
+        hooks (ValidationHooks, optional): Points d'observation des validations ; les fichiers sont alors
+            validés dans le processus courant, quel que soit `jobs`, pour que les mesures y soient collectées.
+        openapi (bool): Valider aussi les fichiers contre la norme OpenAPI ; sans elle, ni jsonschema ni
+            openapi_spec_validator ne sont importés.
+        parse_cache_dir (str, optional): Répertoire du cache d'analyse : un fichier dont le contenu a déjà été
+            analysé n'est pas réanalysé.
+
+    Yields:
+        dict: Le résultat de `check_spec` pour chaque fichier, dans l'ordre de `files`, dès qu'il est disponible.
+    """
+    if jobs <= 1 or len(files) <= 1 or hooks is not None:
+        _init_worker(rules, cache_dir, hooks, openapi, path_jobs=jobs if len(files) == 1 else 1,
+                     parse_cache_dir=parse_cache_dir)
+        for file_path in files:
+            yield check_spec(file_path)
+        return
+
+    # multiprocessing n'est importé que pour une validation en parallèle.
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(files) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(rules, cache_dir, None, openapi, 1, parse_cache_dir)) as executor:
+        yield from executor.map(check_spec, files, chunksize=chunksize)
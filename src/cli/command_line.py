@@ -0,0 +1,259 @@
+import argparse
+import contextlib
+import json
+import os
+import sys
+
+from src.cli.batch_checker import check_specs, discover_specs
+from src.utils.instrumentation import ValidationStats, profile_to
+from src.utils.parse_cache import default_cache_dir
+from src.validators.projet.projet_rules_validator import default_rules_config_path
+from src.validators.projet.rule_registry import get_compiled_rules
+
+EXIT_OK = 0
+EXIT_NOT_CONFORM = 1
+EXIT_USAGE = 2
+
+def build_parser():
+    """
+    Construit l'analyseur des arguments de la ligne de commande.
+
+    Returns:
+        argparse.ArgumentParser: L'analyseur des sous-commandes.
+    """
+    parser = argparse.ArgumentParser(prog="swaggerchecker", description="Validation des fichiers Swagger sans interface graphique.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    check = subparsers.add_parser("check", help="Valide des fichiers Swagger et écrit un résultat JSON par ligne.")
+    check.add_argument("targets", nargs="+", help="Répertoires, motifs glob ou fichiers .json/.yaml/.yml.")
+    check.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Nombre de processus de validation (pour un seul fichier, ses chemins sont répartis entre les processus).")
+    check.add_argument("--rules", default=None, help="Fichier JSON des règles du projet.")
+    check.add_argument("--cache-dir", default=None, help="Répertoire du cache incrémental : seules les opérations modifiées sont réévaluées.")
+    check.add_argument("--parse-cache", default=None, metavar="REPERTOIRE",
+                       help="Répertoire du cache d'analyse des Swagger, indexé par l'empreinte de leur contenu "
+                            "(par défaut $SWAGGERCHECKER_CACHE_DIR/parse ou le cache de l'utilisateur).")
+    check.add_argument("--no-parse-cache", action="store_true",
+                       help="Analyse chaque Swagger sans lire ni écrire le cache d'analyse.")
+    check.add_argument("--watch", action="store_true",
+                       help="Revalide les fichiers à chaque modification d'un fichier ou des règles (Ctrl+C pour arrêter).")
+    check.add_argument("--skip-openapi", action="store_true",
+                       help="Ne valide que les règles du projet (démarrage plus rapide, sans la validation OpenAPI).")
+    check.add_argument("--profile", action="store_true",
+                       help="Affiche sur la sortie d'erreur le temps, les éléments visités et les constats de chaque "
+                            "validateur, du plus lent au plus rapide (validation dans un seul processus).")
+    check.add_argument("--profile-output", default=None, metavar="FICHIER",
+                       help="Enregistre un profil cProfile de la validation dans ce fichier (validation dans un seul processus).")
+    check.set_defaults(handler=run_check)
+
+    diff = subparsers.add_parser("diff", help="Compare deux versions d'un Swagger et signale les changements cassants.")
+    diff.add_argument("old", help="Ancienne version du Swagger.")
+    diff.add_argument("new", help="Nouvelle version du Swagger.")
+    diff.add_argument("--json", action="store_true", help="Écrit le résultat sous forme d'un objet JSON.")
+    diff.set_defaults(handler=run_diff)
+
+    serve = subparsers.add_parser("serve", help="Démarre le service de validation local (règles et validateurs gardés en mémoire).")
+    serve.add_argument("--host", default=None, help="Adresse d'écoute (machine locale uniquement, 127.0.0.1 par défaut).")
+    serve.add_argument("--port", type=int, default=None, help="Port d'écoute (8765 par défaut).")
+    serve.add_argument("--socket", default=None, help="Socket unix à utiliser à la place de --host et --port.")
+    serve.add_argument("--rules", default=None, help="Fichier JSON des règles du projet.")
+    serve.set_defaults(handler=run_serve)
+
+    client = subparsers.add_parser("client", help="Valide des fichiers Swagger avec le service de validation local.")
+    client.add_argument("targets", nargs="+", help="Répertoires, motifs glob ou fichiers .json/.yaml/.yml.")
+    client.add_argument("--host", default=None, help="Adresse du service (127.0.0.1 par défaut).")
+    client.add_argument("--port", type=int, default=None, help="Port du service (8765 par défaut).")
+    client.add_argument("--socket", default=None, help="Socket unix du service.")
+    client.set_defaults(handler=run_client)
+    return parser
+
+def run_check(args, out):
+    """
+    Exécute la sous-commande `check`.
+
+    Args:
+        args (argparse.Namespace): Arguments de la commande.
+        out: Flux de sortie des résultats JSONL.
+
+    Returns:
+        int: Code de sortie (0 si tous les fichiers sont conformes, 1 sinon, 2 si aucun fichier n'est trouvé).
+    """
+    files = discover_specs(args.targets)
+    if not files:
+        print("Aucun fichier Swagger trouvé.", file=sys.stderr)
+        return EXIT_USAGE
+
+    if args.watch:
+        return run_watch(files, args.rules or default_rules_config_path(), out)
+
+    # Les règles compilées sont transmises telles quelles aux processus de travail, qui n'ont pas à les recompiler.
+    rules = get_compiled_rules(args.rules or default_rules_config_path())
+    stats = ValidationStats() if args.profile else None
+    jobs = 1 if args.profile_output else max(1, args.jobs)
+    parse_cache_dir = None if args.no_parse_cache else args.parse_cache or default_cache_dir()
+    exit_code = EXIT_OK
+    with profile_to(args.profile_output) if args.profile_output else contextlib.nullcontext():
+        for record in check_specs(files, rules, jobs=jobs, cache_dir=args.cache_dir, hooks=stats,
+                                  openapi=not args.skip_openapi, parse_cache_dir=parse_cache_dir):
+            if not record["valid"]:
+                exit_code = EXIT_NOT_CONFORM
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+    if stats is not None:
+        print(stats.format_report(), file=sys.stderr)
+    return exit_code
+
+def run_watch(files, rules_path, out, watcher=None):
+    """
+    Exécute la sous-commande `check` en mode `--watch` : un résultat JSON est écrit pour chaque fichier,
+    puis de nouveau à chaque modification de son contenu ou de celui des règles.
+
+    Args:
+        files (list): Chemins des fichiers Swagger.
+        rules_path (str): Chemin du fichier JSON des règles du projet.
+        out: Flux de sortie des résultats JSONL.
+        watcher (FileWatcher, optional): Surveillance à utiliser (par défaut, les fichiers et les règles).
+
+    Returns:
+        int: Code de sortie d'après le dernier résultat de chaque fichier, à l'arrêt de la surveillance.
+    """
+    from src.cli.watch import watch_specs
+
+    valid = {}
+    try:
+        for record in watch_specs(files, rules_path, watcher):
+            valid[record["file"]] = record["valid"]
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+    except KeyboardInterrupt:
+        pass
+    return EXIT_OK if all(valid.values()) else EXIT_NOT_CONFORM
+
+def run_diff(args, out):
+    """
+    Exécute la sous-commande `diff` : un changement par ligne (préfixé de `[cassant]` ou `[compatible]`),
+    puis un résumé ; avec `--json`, un seul objet JSON.
+
+    Args:
+        args (argparse.Namespace): Arguments de la commande.
+        out: Flux de sortie du résultat.
+
+    Returns:
+        int: Code de sortie (0 sans changement cassant, 1 sinon, 2 si un fichier ne peut pas être chargé).
+    """
+    from src.cli.spec_diff import diff_specs
+    from src.utils.swagger_loader import load_swagger_document
+
+    try:
+        old, new = load_swagger_document(args.old), load_swagger_document(args.new)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_USAGE
+
+    result = diff_specs(old.data, new.data)
+    breaking = result.breaking
+    if args.json:
+        out.write(json.dumps({
+            "old": args.old,
+            "new": args.new,
+            "breaking": bool(breaking),
+            "unchanged": result.unchanged,
+            "changes": [change.to_dict() for change in result.changes],
+        }, ensure_ascii=False) + "\n")
+    else:
+        for change in result.changes:
+            out.write(f"[{'cassant' if change.breaking else 'compatible'}] {change.render()}\n")
+        out.write(f"{len(result.changes)} changement(s) dont {len(breaking)} cassant(s) ; "
+                  f"{result.unchanged} opération(s) inchangée(s).\n")
+    out.flush()
+    return EXIT_NOT_CONFORM if breaking else EXIT_OK
+
+def _service_address(args):
+    """
+    Retourne l'adresse et le port du service, avec leurs valeurs par défaut.
+
+    Args:
+        args (argparse.Namespace): Arguments de la commande `serve` ou `client`.
+
+    Returns:
+        tuple: (adresse, port).
+    """
+    from src.cli.validation_service import DEFAULT_HOST, DEFAULT_PORT
+
+    return (args.host if args.host is not None else DEFAULT_HOST,
+            args.port if args.port is not None else DEFAULT_PORT)
+
+def run_serve(args, out):
+    """
+    Exécute la sous-commande `serve` jusqu'à son interruption (Ctrl+C).
+
+    Args:
+        args (argparse.Namespace): Arguments de la commande.
+        out: Flux de sortie (non utilisé : les messages du service sont écrits sur la sortie d'erreur).
+
+    Returns:
+        int: Code de sortie (2 si le service ne peut pas démarrer).
+    """
+    from src.cli.validation_service import ValidationService, create_server
+
+    try:
+        service = ValidationService(args.rules or default_rules_config_path())
+        server = create_server(service, *_service_address(args), args.socket)
+    except (OSError, ValueError) as e:
+        print(f"Impossible de démarrer le service : {e}", file=sys.stderr)
+        return EXIT_USAGE
+    address = args.socket or "http://{}:{}".format(*server.server_address[:2])
+    print(f"Service de validation à l'écoute sur {address}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return EXIT_OK
+
+def run_client(args, out):
+    """
+    Exécute la sous-commande `client` : les fichiers sont envoyés au service en une seule requête et
+    chaque résultat est écrit comme une ligne JSON, comme pour `check`.
+
+    Args:
+        args (argparse.Namespace): Arguments de la commande.
+        out: Flux de sortie des résultats JSONL.
+
+    Returns:
+        int: Code de sortie (0 si tous les fichiers sont conformes, 1 sinon, 2 si aucun fichier n'est
+        trouvé ou si le service ne peut pas être joint).
+    """
+    from src.cli.validation_service import request_check
+
+    files = discover_specs(args.targets)
+    if not files:
+        print("Aucun fichier Swagger trouvé.", file=sys.stderr)
+        return EXIT_USAGE
+    try:
+        records = request_check(files, *_service_address(args), args.socket)
+    except (OSError, RuntimeError) as e:
+        print(f"Échec de la validation par le service : {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    exit_code = EXIT_OK
+    for record in records:
+        if not record["valid"]:
+            exit_code = EXIT_NOT_CONFORM
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    out.flush()
+    return exit_code
+
+def main(argv=None, out=None):
+    """
+    Point d'entrée de la ligne de commande.
+
+    Args:
+        argv (list, optional): Arguments (par défaut `sys.argv[1:]`).
+        out (optional): Flux de sortie (par défaut `sys.stdout`).
+
+    Returns:
+        int: Code de sortie.
+    """
+    args = build_parser().parse_args(argv)
+    return args.handler(args, out or sys.stdout)
@@ -0,0 +1,390 @@
+from src.validators.projet.operation_walker import OperationWalker
+
+# Nature du changement -> (cassant pour les clients, modèle du message). Les champs disponibles sont
+# `method` et `path` (opération), `name` (paramètre, code de réponse, type de contenu ou champ),
+# `location` (position du paramètre), `code` (code de la réponse), `before` et `after`.
+CHANGES = {
+    "path.removed": (True, "Le chemin {path} a été supprimé."),
+    "path.added": (False, "Le chemin {path} a été ajouté."),
+    "operation.removed": (True, "L'opération {method} {path} a été supprimée."),
+    "operation.added": (False, "L'opération {method} {path} a été ajoutée."),
+    "operation.changed": (False, "L'opération {method} {path} a été modifiée sans incidence sur les clients "
+                                 "(documentation, exemples...)."),
+
+    "parameter.removed": (True, "Le paramètre '{name}' ({location}) a été supprimé de {method} {path}."),
+    "parameter.added_required": (True, "Le paramètre obligatoire '{name}' ({location}) a été ajouté à {method} {path}."),
+    "parameter.added": (False, "Le paramètre facultatif '{name}' ({location}) a été ajouté à {method} {path}."),
+    "parameter.now_required": (True, "Le paramètre '{name}' ({location}) de {method} {path} est devenu obligatoire."),
+    "parameter.now_optional": (False, "Le paramètre '{name}' ({location}) de {method} {path} est devenu facultatif."),
+    "parameter.type_changed": (True, "Le type du paramètre '{name}' ({location}) de {method} {path} est passé "
+                                     "de '{before}' à '{after}'."),
+
+    "request_body.added_required": (True, "Un corps de requête obligatoire a été ajouté à {method} {path}."),
+    "request_body.now_required": (True, "Le corps de la requête de {method} {path} est devenu obligatoire."),
+    "request_body.removed": (True, "Le corps de la requête de {method} {path} a été supprimé."),
+    "request_body.media_type_removed": (True, "Le type de contenu '{name}' du corps de la requête de {method} {path} "
+                                              "n'est plus accepté."),
+    "request_body.type_changed": (True, "Le type de '{name}' dans le corps de la requête de {method} {path} est passé "
+                                        "de '{before}' à '{after}'."),
+    "request_body.property_added_required": (True, "Le champ obligatoire '{name}' a été ajouté au corps de la requête "
+                                                   "de {method} {path}."),
+    "request_body.property_added": (False, "Le champ '{name}' a été ajouté au corps de la requête de {method} {path}."),
+    "request_body.property_now_required": (True, "Le champ '{name}' du corps de la requête de {method} {path} "
+                                                 "est devenu obligatoire."),
+    "request_body.property_removed": (False, "Le champ '{name}' a été supprimé du corps de la requête de {method} {path}."),
+
+    "response.removed": (True, "La réponse '{code}' de {method} {path} a été supprimée."),
+    "response.added": (False, "La réponse '{code}' a été ajoutée à {method} {path}."),
+    "response.media_type_removed": (True, "Le type de contenu '{name}' de la réponse '{code}' de {method} {path} "
+                                          "a été supprimé."),
+    "response.type_changed": (True, "Le type de '{name}' dans la réponse '{code}' de {method} {path} est passé "
+                                    "de '{before}' à '{after}'."),
+    "response.property_removed": (True, "Le champ '{name}' a été supprimé de la réponse '{code}' de {method} {path}."),
+    "response.property_added": (False, "Le champ '{name}' a été ajouté à la réponse '{code}' de {method} {path}."),
+}
+
+# Nom donné à la racine d'un schéma dans les messages
+_ROOT = "(racine)"
+
+
+class Change:
+    """
+    Changement entre deux versions d'un Swagger, sous forme compacte ; le message n'est produit que
+    par `render()`.
+    """
+
+    __slots__ = ('kind', 'method', 'path', 'name', 'location', 'code', 'before', 'after')
+
+    def __init__(self, kind, method=None, path=None, name=None, location=None, code=None, before=None, after=None):
+        """
+        Args:
+            kind (str): Nature du changement, clé de `CHANGES`.
+            method (str, optional): Méthode HTTP en majuscules.
+            path (str, optional): Chemin d'API.
+            name (str, optional): Paramètre, type de contenu ou champ concerné.
+            location (str, optional): Position du paramètre (`in`).
+            code (str, optional): Code de la réponse concernée.
+            before: Valeur dans l'ancienne version.
+            after: Valeur dans la nouvelle version.
+        """
+        self.kind = kind
+        self.method = method
+        self.path = path
+        self.name = name
+        self.location = location
+        self.code = code
+        self.before = before
+        self.after = after
+
+    @property
+    def breaking(self):
+        """bool: True si le changement peut casser les clients existants."""
+        return CHANGES[self.kind][0]
+
+    def render(self):
+        """
+        Returns:
+            str: Le message du changement.
+        """
+        return CHANGES[self.kind][1].format(method=self.method, path=self.path, name=self.name, location=self.location,
+                                            code=self.code, before=self.before, after=self.after)
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: Le changement sous une forme sérialisable en JSON (`kind`, `breaking`, `method`, `path`, `message`).
+        """
+        return {"kind": self.kind, "breaking": self.breaking, "method": self.method, "path": self.path,
+                "message": self.render()}
+
+    def __repr__(self):
+        return f"Change({self.kind!r}, {self.method!r}, {self.path!r}, {self.name!r})"
+
+
+class SpecDiff:
+    """
+    Résultat de la comparaison de deux versions d'un Swagger.
+
+    Attributes:
+        changes (list): Les changements (`Change`), dans l'ordre de l'ancienne version puis des ajouts.
+        unchanged (int): Nombre d'opérations identiques, écartées sans comparaison détaillée.
+        compared (int): Nombre d'opérations présentes dans les deux versions mais différentes.
+    """
+
+    def __init__(self, changes, unchanged, compared):
+        self.changes = changes
+        self.unchanged = unchanged
+        self.compared = compared
+
+    @property
+    def breaking(self):
+        """list: Les changements cassants."""
+        return [change for change in self.changes if change.breaking]
+
+
+class _Side:
+    """
+    Opérations d'une version du Swagger, indexées par (méthode en majuscules, chemin).
+    """
+
+    def __init__(self, swagger_dict):
+        self.paths = {}
+        self.operations = {}
+        for path, path_item, operations in OperationWalker().iter_operations(swagger_dict):
+            self.paths[path] = path_item
+            for operation in operations:
+                self.operations[operation.key] = operation
+        # Tout ce qui n'est pas sous `paths` : composants, définitions...
+        self.shared = {key: value for key, value in swagger_dict.items() if key != 'paths'}
+
+
+class _Identity:
+    """
+    Détermine si une opération est identique dans les deux versions, y compris les composants qu'elle
+    référence.
+
+    Le contenu est comparé par l'égalité des dictionnaires (en C, indépendante de l'ordre des clés), qui
+    s'arrête à la première différence : c'est la forme canonique de l'opération. Les dépendances (`$ref`)
+    ne sont examinées que si les sections partagées (`components`, `definitions`...) diffèrent, et chaque
+    composant n'est comparé qu'une fois.
+    """
+
+    def __init__(self, old, new):
+        self._shared_equal = old.shared == new.shared
+        self._components = {}
+
+    def same(self, old, new):
+        """
+        Args:
+            old (Operation): L'opération dans l'ancienne version.
+            new (Operation): La même opération dans la nouvelle version.
+
+        Returns:
+            bool: True si l'opération, les paramètres communs de son chemin et ses composants sont identiques.
+        """
+        if old.data != new.data or old.path_item.get('parameters') != new.path_item.get('parameters'):
+            return False
+        if self._shared_equal:
+            return True
+        value = [old.path_item.get('parameters'), old.data]
+        return all(self._same_component(ref, old, new) for ref in old.resolver.dependencies(value))
+
+    def _same_component(self, ref, old, new):
+        same = self._components.get(ref)
+        if same is None:
+            reference = {'$ref': ref}
+            same = self._components[ref] = old.resolve(reference) == new.resolve(reference)
+        return same
+
+
+def diff_specs(old_dict, new_dict):
+    """
+    Compare deux versions d'un Swagger et classe chaque changement comme cassant ou non pour les clients.
+
+    Les opérations sont appariées par (méthode, chemin) dans un dictionnaire ; les opérations identiques
+    (voir `_Identity`) sont écartées sans autre comparaison. Seules les autres sont comparées
+    structurellement (paramètres, corps de la requête, réponses et leurs schémas). La comparaison d'un
+    même couple de schémas (par exemple un composant partagé) est mémorisée et n'est faite qu'une fois.
+
+    Args:
+        old_dict (dict): L'ancienne version du Swagger.
+        new_dict (dict): La nouvelle version du Swagger.
+
+    Returns:
+        SpecDiff: Les changements trouvés.
+    """
+    old, new = _Side(old_dict), _Side(new_dict)
+    identity = _Identity(old, new)
+    comparator = _Comparator()
+    changes = []
+    unchanged = compared = 0
+
+    for path in old.paths:
+        if path not in new.paths:
+            changes.append(Change("path.removed", path=path))
+    for key, operation in old.operations.items():
+        if operation.path not in new.paths:
+            continue
+        counterpart = new.operations.get(key)
+        if counterpart is None:
+            changes.append(Change("operation.removed", *key))
+        elif identity.same(operation, counterpart):
+            unchanged += 1
+        else:
+            compared += 1
+            found = comparator.compare_operations(operation, counterpart)
+            changes.extend(found or [Change("operation.changed", *key)])
+
+    for path in new.paths:
+        if path not in old.paths:
+            changes.append(Change("path.added", path=path))
+    for key, operation in new.operations.items():
+        if operation.path in old.paths and key not in old.operations:
+            changes.append(Change("operation.added", *key))
+    return SpecDiff(changes, unchanged, compared)
+
+
+def _parameters(operation):
+    """
+    Paramètres effectifs d'une opération (voir `Operation.parameter_index`) indexés par (position, nom en
+    minuscules).
+    """
+    return {(location, name): entry.parameter
+            for location, by_name in operation.parameter_index.items() for name, entry in by_name.items()}
+
+def _schema_type(schema):
+    return schema.get('type') if isinstance(schema, dict) else None
+
+def _content(resolver, value):
+    """Schémas par type de contenu d'un corps de requête ou d'une réponse déjà résolus."""
+    content = value.get('content') if isinstance(value, dict) else None
+    if not isinstance(content, dict):
+        return {}
+    return {media_type: resolver.resolve(media.get('schema')) if isinstance(media, dict) else None
+            for media_type, media in content.items()}
+
+
+class _Comparator:
+    """
+    Comparaison structurelle de deux opérations, avec mémorisation des comparaisons de schémas.
+    """
+
+    def __init__(self):
+        self._schemas = {}
+
+    def compare_operations(self, old, new):
+        """
+        Args:
+            old (Operation): L'opération dans l'ancienne version.
+            new (Operation): La même opération dans la nouvelle version.
+
+        Returns:
+            list: Les changements structurels trouvés (vide si seuls des détails sans incidence ont changé).
+        """
+        method, path = new.key
+        changes = []
+        self._compare_parameters(old, new, changes)
+        self._compare_request_body(old, new, changes)
+        self._compare_responses(old, new, changes)
+        for change in changes:
+            change.method, change.path = method, path
+        return changes
+
+    def _compare_parameters(self, old, new, changes):
+        old_parameters, new_parameters = _parameters(old), _parameters(new)
+        for key, parameter in old_parameters.items():
+            counterpart = new_parameters.get(key)
+            name, location = parameter['name'], key[0]
+            if counterpart is None:
+                changes.append(Change("parameter.removed", name=name, location=location))
+                continue
+            was_required, is_required = bool(parameter.get('required')), bool(counterpart.get('required'))
+            if is_required and not was_required:
+                changes.append(Change("parameter.now_required", name=name, location=location))
+            elif was_required and not is_required:
+                changes.append(Change("parameter.now_optional", name=name, location=location))
+            before = _schema_type(old.resolve(parameter.get('schema'))) or parameter.get('type')
+            after = _schema_type(new.resolve(counterpart.get('schema'))) or counterpart.get('type')
+            if before != after:
+                changes.append(Change("parameter.type_changed", name=name, location=location, before=before, after=after))
+        for key, parameter in new_parameters.items():
+            if key not in old_parameters:
+                kind = "parameter.added_required" if parameter.get('required') else "parameter.added"
+                changes.append(Change(kind, name=parameter['name'], location=key[0]))
+
+    def _compare_request_body(self, old, new, changes):
+        old_body, new_body = old.resolve(old.data.get('requestBody')), new.resolve(new.data.get('requestBody'))
+        if not isinstance(new_body, dict):
+            if isinstance(old_body, dict):
+                changes.append(Change("request_body.removed"))
+            return
+        if not isinstance(old_body, dict):
+            if new_body.get('required'):
+                changes.append(Change("request_body.added_required"))
+            return
+        if new_body.get('required') and not old_body.get('required'):
+            changes.append(Change("request_body.now_required"))
+        old_content, new_content = _content(old.resolver, old_body), _content(new.resolver, new_body)
+        for media_type, schema in old_content.items():
+            if media_type not in new_content:
+                changes.append(Change("request_body.media_type_removed", name=media_type))
+            else:
+                changes.extend(self._schema_changes("request_body", old.resolver, schema, new.resolver, new_content[media_type]))
+
+    def _compare_responses(self, old, new, changes):
+        old_responses, new_responses = old.data.get('responses'), new.data.get('responses')
+        old_responses = old_responses if isinstance(old_responses, dict) else {}
+        new_responses = {str(code): response for code, response in new_responses.items()} \
+            if isinstance(new_responses, dict) else {}
+        old_codes = set()
+        for code, response in old_responses.items():
+            code = str(code)
+            old_codes.add(code)
+            if code not in new_responses:
+                changes.append(Change("response.removed", code=code))
+                continue
+            old_content = _content(old.resolver, old.resolve(response))
+            new_content = _content(new.resolver, new.resolve(new_responses[code]))
+            for media_type, schema in old_content.items():
+                if media_type not in new_content:
+                    changes.append(Change("response.media_type_removed", name=media_type, code=code))
+                    continue
+                for change in self._schema_changes("response", old.resolver, schema, new.resolver, new_content[media_type]):
+                    change.code = code
+                    changes.append(change)
+        for code in new_responses:
+            if code not in old_codes:
+                changes.append(Change("response.added", code=code))
+
+    def _schema_changes(self, section, old_resolver, old_schema, new_resolver, new_schema):
+        """
+        Compare deux schémas (types, propriétés et éléments des tableaux, récursivement).
+
+        Le résultat d'un couple de schémas est mémorisé : un composant partagé par de nombreuses opérations
+        n'est comparé qu'une fois. De nouveaux objets `Change` sont retournés à chaque appel.
+
+        Args:
+            section (str): "request_body" ou "response" ; un champ supprimé n'est cassant que dans une réponse,
+                un champ obligatoire ajouté, ou devenu obligatoire, ne l'est que dans un corps de requête.
+
+        Returns:
+            list: Les changements, sans méthode ni chemin.
+        """
+        key = (section, id(old_schema), id(new_schema))
+        found = self._schemas.get(key)
+        if found is None:
+            found = self._schemas[key] = []
+            pending = [(_ROOT, old_schema, new_schema)]
+            visited = set()
+            while pending:
+                name, old_value, new_value = pending.pop()
+                old_value, new_value = old_resolver.resolve(old_value), new_resolver.resolve(new_value)
+                if (id(old_value), id(new_value)) in visited or not isinstance(old_value, dict) \
+                        or not isinstance(new_value, dict):
+                    continue
+                visited.add((id(old_value), id(new_value)))
+                before, after = _schema_type(old_value), _schema_type(new_value)
+                if before != after:
+                    found.append((f"{section}.type_changed", name, before, after))
+                    continue
+                prefix = "" if name == _ROOT else f"{name}."
+                old_properties, new_properties = old_value.get('properties'), new_value.get('properties')
+                old_properties = old_properties if isinstance(old_properties, dict) else {}
+                new_properties = new_properties if isinstance(new_properties, dict) else {}
+                old_required = old_value.get('required') if isinstance(old_value.get('required'), list) else []
+                required = new_value.get('required') if isinstance(new_value.get('required'), list) else []
+                for prop in old_properties:
+                    if prop not in new_properties:
+                        found.append((f"{section}.property_removed", prefix + str(prop), None, None))
+                for prop in new_properties:
+                    if prop not in old_properties:
+                        kind = f"{section}.property_added_required" if section == "request_body" and prop in required \
+                            else f"{section}.property_added"
+                        found.append((kind, prefix + str(prop), None, None))
+                    elif section == "request_body" and prop in required and prop not in old_required:
+                        found.append(("request_body.property_now_required", prefix + str(prop), None, None))
+                for prop in reversed([prop for prop in old_properties if prop in new_properties]):
+                    pending.append((prefix + str(prop), old_properties[prop], new_properties[prop]))
+                if 'items' in old_value and 'items' in new_value:
+                    pending.append((f"{name}[]", old_value['items'], new_value['items']))
+        return [Change(kind, name=name, before=before, after=after) for kind, name, before, after in found]
@@ -0,0 +1,294 @@
+import http.client
+import ipaddress
+import json
+import os
+import socket
+import socketserver
+import stat
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.cli.batch_checker import build_record
+from src.utils.swagger_loader import parse_swagger_bytes
+from src.validators.openapi.openapi_validator import OpenAPIValidator
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator
+from src.validators.projet.rule_registry import get_compiled_rules
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Taille maximale du corps d'une requête
+MAX_REQUEST_SIZE = 64 * 1024 * 1024
+
+
+class ValidationService:
+    """
+    État partagé par toutes les requêtes du service : règles du projet compilées et validateurs
+    OpenAPI préparés (méta-schémas compilés) dès le démarrage.
+
+    Les règles sont obtenues à chaque requête depuis le registre du processus (`get_compiled_rules`) :
+    elles ne sont recompilées que si leur fichier a été modifié, et un service démarré voit ainsi les
+    règles modifiées.
+
+    Attributes:
+        rules_path (str): Chemin du fichier JSON des règles du projet.
+    """
+
+    def __init__(self, rules_path):
+        """
+        Charge les règles du projet et prépare les validateurs OpenAPI.
+
+        Args:
+            rules_path (str): Chemin du fichier JSON des règles du projet.
+
+        Raises:
+            FileNotFoundError: Si le fichier des règles n'est pas trouvé.
+        """
+        from src.validators.openapi.spec_validator_cache import get_spec_validator_class
+
+        self.rules_path = rules_path
+        get_compiled_rules(rules_path)
+        for version in ("3.0", "3.1"):
+            get_spec_validator_class(version)
+
+    @property
+    def rules(self):
+        """
+        Les règles compilées, rechargées si leur fichier a été modifié.
+
+        Raises:
+            RuntimeError: Si le fichier des règles est devenu illisible.
+        """
+        try:
+            return get_compiled_rules(self.rules_path)
+        except (OSError, ValueError) as e:
+            raise RuntimeError(f"Règles du projet illisibles ({self.rules_path}) : {str(e)}")
+
+    def check(self, name, content, rules=None):
+        """
+        Valide le contenu d'un fichier Swagger.
+
+        Args:
+            name (str): Nom du fichier, repris dans le résultat.
+            content (bytes): Contenu du fichier (JSON ou YAML).
+            rules (CompiledRules, optional): Règles du projet (par défaut, `rules`).
+
+        Returns:
+            dict: Le résultat au format de `check_spec`, dont chaque section contient aussi `findings`, la
+            liste structurée des erreurs (`OpenAPIError.to_dict` et `Finding.to_dict`). Une erreur inattendue
+            des règles du projet (par exemple sur un Swagger de structure inhabituelle) est rapportée comme
+            une erreur du fichier (`error`).
+        """
+        try:
+            document = parse_swagger_bytes(content, name)
+        except ValueError as e:
+            return {"file": name, "valid": False, "error": str(e)}
+
+        try:
+            openapi_findings = [record.to_dict() for record in OpenAPIValidator(document, None).iter_records()]
+            openapi_errors = [finding["text"] for finding in openapi_findings]
+        except Exception as e:
+            openapi_findings = []
+            openapi_errors = [f"Erreur lors de la validation OpenAPI: {str(e)}"]
+        try:
+            projet_findings = [finding.to_dict(document)
+                               for finding in ProjetRulesValidator(document, None, rules=rules or self.rules).iter_findings()]
+        except Exception as e:
+            return {"file": name, "valid": False, "error": f"Erreur lors de la validation des règles du projet: {str(e)}"}
+
+        record = build_record(name, openapi_errors, [finding["message"] for finding in projet_findings])
+        record["openapi"]["findings"] = openapi_findings
+        record["projet"]["findings"] = projet_findings
+        return record
+
+    def check_request(self, payload):
+        """
+        Valide les fichiers d'une requête `/check`.
+
+        Args:
+            payload (dict): `{"specs": [{"name": ..., "content": ...}, ...]}`, ou un seul fichier
+                `{"name": ..., "content": ...}`.
+
+        Raises:
+            ValueError: Si la requête est mal formée.
+            RuntimeError: Si le fichier des règles est devenu illisible.
+
+        Returns:
+            list: Le résultat de `check` pour chaque fichier, dans l'ordre de la requête.
+        """
+        specs = payload.get("specs") if isinstance(payload, dict) and "specs" in payload else [payload]
+        if not isinstance(specs, list):
+            raise ValueError("'specs' doit être une liste.")
+        # Mêmes règles pour tous les fichiers d'une requête
+        rules = self.rules
+        results = []
+        for spec in specs:
+            if not isinstance(spec, dict) or not isinstance(spec.get("content"), str):
+                raise ValueError("Chaque fichier doit avoir un contenu ('content') de type texte.")
+            name = spec.get("name") or "<spec>"
+            results.append(self.check(str(name), spec["content"].encode('utf-8'), rules))
+        return results
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """
+    Requêtes du service : `GET /health` et `POST /check` (JSON en entrée et en sortie).
+    """
+
+    server_version = "SwaggerChecker"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", "rules": self.server.service.rules_path})
+        else:
+            self._send_json(404, {"error": f"Ressource inconnue : {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/check":
+            self._send_json(404, {"error": f"Ressource inconnue : {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._send_json(411, {"error": "En-tête Content-Length manquant."})
+            return
+        if length > MAX_REQUEST_SIZE:
+            self.close_connection = True
+            self._send_json(413, {"error": f"Requête trop volumineuse (maximum {MAX_REQUEST_SIZE} octets)."})
+            return
+        try:
+            results = self.server.service.check_request(json.loads(self.rfile.read(length)))
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except RuntimeError as e:
+            self._send_json(500, {"error": str(e)})
+            return
+        self._send_json(200, {"results": results})
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Pas d'adresse distante sur une socket unix
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _check_loopback(host):
+    """
+    Vérifie que le service n'est exposé que sur la machine locale.
+
+    Raises:
+        ValueError: Si `host` n'est pas une adresse de bouclage.
+    """
+    if host == "localhost":
+        return
+    try:
+        loopback = ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        loopback = False
+    if not loopback:
+        raise ValueError(f"Le service n'écoute que sur la machine locale (adresse refusée : {host}).")
+
+def create_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None):
+    """
+    Crée le serveur HTTP du service, à l'écoute sur une adresse locale ou sur une socket unix.
+
+    Args:
+        service (ValidationService): L'état partagé du service.
+        host (str): Adresse d'écoute (adresse de bouclage uniquement).
+        port (int): Port d'écoute (0 pour un port libre quelconque).
+        socket_path (str, optional): Socket unix à utiliser à la place de `host` et `port`.
+
+    Raises:
+        ValueError: Si `host` n'est pas une adresse locale, ou si `socket_path` désigne un fichier existant
+            qui n'est pas une socket (une socket laissée par un service précédent est remplacée).
+
+    Returns:
+        socketserver.BaseServer: Le serveur, à démarrer avec `serve_forever()`.
+    """
+    if socket_path:
+        try:
+            mode = os.lstat(socket_path).st_mode
+        except FileNotFoundError:
+            mode = None
+        if mode is not None:
+            if not stat.S_ISSOCK(mode):
+                raise ValueError(f"{socket_path} existe et n'est pas une socket : il n'est pas remplacé.")
+            os.unlink(socket_path)
+        server = _UnixServer(socket_path, _RequestHandler)
+        os.chmod(socket_path, 0o600)
+    else:
+        _check_loopback(host)
+        server = _TCPServer((host, port), _RequestHandler)
+    server.service = service
+    return server
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """
+    Connexion HTTP sur une socket unix.
+    """
+
+    def __init__(self, socket_path, timeout):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+def request_check(files, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, timeout=300):
+    """
+    Envoie des fichiers Swagger au service de validation en une seule requête.
+
+    Args:
+        files (list): Chemins des fichiers Swagger.
+        host (str): Adresse du service.
+        port (int): Port du service.
+        socket_path (str, optional): Socket unix du service, à la place de `host` et `port`.
+        timeout (float): Délai maximal de la requête, en secondes.
+
+    Raises:
+        OSError: Si le service ne peut pas être joint.
+        RuntimeError: Si le service refuse la requête.
+
+    Returns:
+        list: Le résultat de chaque fichier, dans l'ordre de `files`.
+    """
+    specs = []
+    for file_path in files:
+        with open(file_path, 'rb') as file:
+            specs.append({"name": file_path, "content": file.read().decode('utf-8', errors='replace')})
+    body = json.dumps({"specs": specs}, ensure_ascii=False).encode('utf-8')
+
+    if socket_path:
+        connection = _UnixHTTPConnection(socket_path, timeout)
+    else:
+        connection = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        connection.request("POST", "/check", body, {"Content-Type": "application/json; charset=utf-8"})
+        response = connection.getresponse()
+        payload = json.loads(response.read())
+    finally:
+        connection.close()
+    if response.status != 200:
+        raise RuntimeError(payload.get("error", f"Erreur HTTP {response.status}"))
+    return payload["results"]
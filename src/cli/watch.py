@@ -0,0 +1,166 @@
+import hashlib
+import os
+
+from src.cli.batch_checker import build_record, validate_openapi
+from src.utils.file_watcher import FileWatcher
+from src.utils.swagger_loader import parse_swagger_bytes
+from src.validators.projet.incremental_cache import IncrementalCache
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator
+from src.validators.projet.rule_registry import get_compiled_rules
+
+class WatchSession:
+    """
+    Validation répétée d'un fichier Swagger pendant sa modification.
+
+    La session conserve le dernier document chargé, ses erreurs OpenAPI, les règles compilées et un
+    `IncrementalCache` en mémoire. À chaque modification signalée, seul ce qui a changé est refait :
+
+    - le Swagger est lu une seule fois par modification et n'est de nouveau analysé que si l'empreinte
+      de son contenu a changé ; la validation OpenAPI est alors refaite et seules les opérations
+      modifiées sont réévaluées par les règles du projet ;
+    - les règles du projet sont obtenues du registre du processus (`get_compiled_rules`), qui ne les
+      recompile que si le contenu de leur fichier a changé ; si seules les règles ont changé, les erreurs OpenAPI sont reprises telles quelles et
+      seules les règles du projet sont réévaluées.
+
+    Attributes:
+        spec_path (str): Chemin absolu du fichier Swagger.
+        rules_path (str): Chemin absolu du fichier des règles du projet.
+        document (SpecDocument): Le dernier document chargé, ou None s'il n'a pas pu l'être.
+    """
+
+    def __init__(self, spec_path, rules_path):
+        """
+        Initialise la session ; rien n'est lu avant le premier `refresh()`.
+
+        Args:
+            spec_path (str): Chemin du fichier Swagger.
+            rules_path (str): Chemin du fichier JSON des règles du projet.
+        """
+        self.spec_path = os.path.abspath(spec_path)
+        self.rules_path = os.path.abspath(rules_path)
+        self.document = None
+        self._display_path = spec_path
+        self._spec_digest = None
+        self._rules_digest = None
+        self._spec_error = None
+        self._rules_error = None
+        self._rules = None
+        self._cache = None
+        self._openapi_errors = None
+
+    def refresh(self, changed_paths=None):
+        """
+        Revalide le Swagger après une modification.
+
+        Args:
+            changed_paths (set, optional): Fichiers signalés comme modifiés (chemins absolus) ; par défaut,
+                le Swagger et les règles sont tous deux vérifiés.
+
+        Returns:
+            dict: Le résultat au format de `check_spec`, complété par `changed` (fichiers dont le contenu a
+            changé), ou None si aucun contenu n'a réellement changé.
+        """
+        changed = []
+        if changed_paths is None or self.rules_path in changed_paths:
+            if self._reload_rules():
+                changed.append(self.rules_path)
+        if changed_paths is None or self.spec_path in changed_paths:
+            if self._reload_spec():
+                changed.append(self.spec_path)
+        if not changed:
+            return None
+
+        error = self._spec_error or self._rules_error
+        if error is not None:
+            record = {"file": self._display_path, "valid": False, "error": error}
+        else:
+            if self._openapi_errors is None:
+                self._openapi_errors = validate_openapi(self.document)
+            projet_errors = list(ProjetRulesValidator(self.document, None, rules=self._rules).iter_errors(self._cache))
+            self._cache.save()
+            record = build_record(self._display_path, self._openapi_errors, projet_errors)
+        record["changed"] = changed
+        return record
+
+    def _reload_spec(self):
+        """
+        Recharge le Swagger si son contenu a changé. Le fichier n'est lu qu'une fois : l'empreinte est
+        calculée sur les octets lus, qui sont ensuite analysés.
+
+        Returns:
+            bool: True si le contenu a changé.
+        """
+        try:
+            with open(self.spec_path, 'rb') as file:
+                raw = file.read()
+        except OSError as e:
+            raw, error = None, f"Failed to load Swagger file: {str(e)}"
+        digest = hashlib.sha256(raw).hexdigest() if raw is not None else None
+        if digest is not None and digest == self._spec_digest:
+            return False
+        self._spec_digest = digest
+        self._openapi_errors = None
+        self.document = None
+        if raw is None:
+            self._spec_error = error
+            return True
+        try:
+            self.document = parse_swagger_bytes(raw, self.spec_path)
+            self._spec_error = None
+        except ValueError as e:
+            self._spec_error = str(e)
+        return True
+
+    def _reload_rules(self):
+        """
+        Recharge les règles du projet si leur contenu a changé. Un fichier illisible (par exemple en
+        cours d'enregistrement) est signalé jusqu'à sa correction ; les dernières règles valides sont
+        conservées, avec leurs résultats mémorisés.
+
+        Returns:
+            bool: True si les règles, ou l'erreur signalée, ont changé.
+        """
+        rules, error = self._rules, None
+        try:
+            rules = get_compiled_rules(self.rules_path)
+        except FileNotFoundError as e:
+            error = str(e)
+        except (OSError, ValueError) as e:
+            error = f"Failed to load validation rules: {str(e)}"
+        if rules is self._rules and error == self._rules_error:
+            return False
+        if rules is not self._rules:
+            self._cache = IncrementalCache(context=rules.source)
+        self._rules, self._rules_error = rules, error
+        return True
+
+
+def watch_specs(files, rules_path, watcher=None):
+    """
+    Valide des fichiers Swagger, puis de nouveau à chaque modification d'un fichier ou des règles du projet.
+
+    Args:
+        files (list): Chemins des fichiers Swagger.
+        rules_path (str): Chemin du fichier JSON des règles du projet.
+        watcher (FileWatcher, optional): Surveillance à utiliser (par défaut, les fichiers et les règles) ;
+            elle est fermée à la fin de la surveillance.
+
+    Yields:
+        dict: Le résultat de chaque validation (voir `WatchSession.refresh`), d'abord pour tous les
+        fichiers puis pour chaque fichier dont le contenu, ou celui des règles, a changé.
+    """
+    sessions = [WatchSession(file_path, rules_path) for file_path in files]
+    watcher = watcher or FileWatcher(list(files) + [rules_path])
+    with watcher:
+        for session in sessions:
+            yield session.refresh()
+        while True:
+            changed = watcher.wait()
+            if not changed:
+                # `stop()` a été appelé
+                return
+            for session in sessions:
+                if session.spec_path in changed or session.rules_path in changed:
+                    record = session.refresh(changed)
+                    if record is not None:
+                        yield record
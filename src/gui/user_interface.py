@@ -1,10 +1,23 @@
 import tkinter as tk
 import os
-from tkinter import filedialog, messagebox, scrolledtext
+import queue
+import time
+from tkinter import filedialog, messagebox, scrolledtext, ttk
 
-from src.validators.openapi.openapi_validator import OpenAPIValidator
-from src.validators.projet.projet_rules_validator import ProjetRulesValidator
-from src.utils.swagger_loader import load_swagger
+from src.gui.validation_worker import (
+    CANCELLED, DONE, FAILED, FINDING, OPENAPI_SECTION, PROJET_SECTION, SECTION_DONE, WATCH_RESULT,
+    ValidationWorker, WatchWorker,
+)
+from src.validators.projet.incremental_cache import IncrementalCache
+from src.validators.projet.projet_rules_validator import default_rules_config_path
+from src.validators.projet.rule_registry import get_compiled_rules
+from src.utils.parse_cache import get_default_parse_cache
+from src.utils.swagger_loader import load_swagger_document
+
+# Intervalle (ms) entre deux lectures des résultats du thread de validation
+POLL_INTERVAL_MS = 50
+# Nombre maximal de résultats affichés à chaque lecture, pour ne pas bloquer la boucle Tk
+MAX_MESSAGES_PER_POLL = 200
 
 class UserInterface(tk.Tk):
     """
@@ -16,16 +29,31 @@ class UserInterface(tk.Tk):
 
     Attributs:
     ----------
-    swagger_dict : dict
-        Contient le fichier Swagger chargé sous forme de dictionnaire.
+    swagger_document : SpecDocument
+        Contient le fichier Swagger chargé (dictionnaire, texte brut et index des positions),
+        partagé par tous les validateurs.
     swagger_file_path : str
         Chemin vers le fichier Swagger importé.
-    swagger_text : str
-        Contenu du fichier Swagger sous forme de chaîne de caractères.
+    incremental_cache : IncrementalCache
+        Résultats des règles du projet par opération, réutilisés lors des validations suivantes.
+    project_rules : CompiledRules
+        Règles du projet utilisées par la dernière validation, rechargées si le fichier de règles est modifié.
+    validation_worker : ValidationWorker
+        Thread de la validation en cours, ou None.
+    watch_worker : WatchWorker
+        Thread du mode surveillance, ou None.
     upload_button : tk.Button
         Bouton pour importer le fichier Swagger.
     validate_button : tk.Button
         Bouton pour valider le fichier Swagger.
+    cancel_button : tk.Button
+        Bouton pour annuler la validation en cours.
+    watch_checkbox : tk.Checkbutton
+        Case à cocher du mode surveillance.
+    progress_bar : ttk.Progressbar
+        Indicateur d'activité pendant la validation.
+    status_label : tk.Label
+        Statut de la validation (nombre d'erreurs trouvées, fin, annulation).
     result_text : scrolledtext.ScrolledText
         Zone de texte défilante pour afficher les résultats de la validation.
     
@@ -36,8 +64,15 @@ class UserInterface(tk.Tk):
         charge le contenu et le convertit en dictionnaire.
     
     validate_swagger():
-        Valide le fichier Swagger importé contre les normes OpenAPI et les règles du projet.
-        Affiche les résultats de la validation dans la zone de texte.
+        Valide le fichier Swagger importé contre les normes OpenAPI et les règles du projet, dans un
+        thread séparé. Affiche les résultats de la validation dans la zone de texte au fur et à mesure.
+
+    cancel_validation():
+        Annule la validation en cours.
+
+    toggle_watch():
+        Active ou désactive le mode surveillance : le fichier Swagger est revalidé à chaque
+        enregistrement (ou modification des règles du projet) et les résultats sont remplacés.
     """
 
     def __init__(self):
@@ -49,9 +84,13 @@ class UserInterface(tk.Tk):
         # Configurer la fenêtre principale
         self.title("Swagger Validator")
         self.geometry("1000x1000")
-        self.swagger_dict = None
+        self.swagger_document = None
         self.swagger_file_path = None
-        self.swagger_text = None
+        self.incremental_cache = None
+        self.project_rules = None
+        self.validation_worker = None
+        self.watch_worker = None
+        self._finding_counts = {}
 
         # Bouton pour importer le fichier Swagger
         self.upload_button = tk.Button(self, text="Importer Swagger", command=self.upload_file, height=2, width=20)
@@ -61,6 +100,21 @@ class UserInterface(tk.Tk):
         self.validate_button = tk.Button(self, text="Valider", command=self.validate_swagger, height=2, width=20)
         self.validate_button.pack(pady=10)
 
+        # Bouton pour annuler la validation en cours
+        self.cancel_button = tk.Button(self, text="Annuler", command=self.cancel_validation, height=2, width=20, state=tk.DISABLED)
+        self.cancel_button.pack(pady=10)
+
+        # Mode surveillance : revalidation à chaque enregistrement du fichier
+        self.watch_var = tk.BooleanVar(value=False)
+        self.watch_checkbox = tk.Checkbutton(self, text="Surveiller les modifications", variable=self.watch_var, command=self.toggle_watch)
+        self.watch_checkbox.pack(pady=5)
+
+        # Progression de la validation
+        self.progress_bar = ttk.Progressbar(self, mode="indeterminate", length=300)
+        self.progress_bar.pack(pady=5)
+        self.status_label = tk.Label(self, text="")
+        self.status_label.pack(pady=5)
+
         # Zone de texte pour afficher les résultats
         self.result_text = scrolledtext.ScrolledText(self, wrap=tk.WORD, height=30, width=120)
         self.result_text.pack(pady=10)
@@ -74,16 +128,17 @@ class UserInterface(tk.Tk):
         Ouvre une boîte de dialogue pour sélectionner un fichier Swagger.
 
         Cette méthode charge le fichier Swagger sélectionné, que ce soit en JSON ou en YAML,
-        et le convertit en dictionnaire. Le contenu du fichier est également stocké en tant que
-        chaîne de caractères pour un accès facile lors de la validation.
+        et le convertit en dictionnaire. Le fichier n'est lu qu'une fois : le `SpecDocument` obtenu
+        conserve aussi le contenu brut et l'index des positions utilisés lors de la validation. Un fichier
+        déjà analysé (même contenu) est relu depuis le cache d'analyse de l'utilisateur.
         """
+        if self.watch_worker is not None:
+            self.stop_watch()
         self.swagger_file_path = filedialog.askopenfilename(filetypes=[("JSON Files", "*.json"), ("YAML Files", "*.yaml"), ("YML Files", "*.yml")])
         if self.swagger_file_path:
             try:
-                with open(self.swagger_file_path, 'r') as file:
-                    self.swagger_text = file.read()
-                    self.swagger_dict = load_swagger(self.swagger_file_path)
-                    swagger_name = os.path.basename(self.swagger_file_path)
+                self.swagger_document = load_swagger_document(self.swagger_file_path, get_default_parse_cache())
+                swagger_name = os.path.basename(self.swagger_file_path)
                 self.result_text.insert(tk.END, f"Fichier importé avec succès: {swagger_name}\n\n", "success")
             except Exception as e:
                 messagebox.showerror("Erreur", f"Impossible de charger le fichier Swagger : {str(e)}")
@@ -92,40 +147,205 @@ class UserInterface(tk.Tk):
         """
         Valide le fichier Swagger importé contre les normes OpenAPI et les règles du projet.
 
-        Cette méthode utilise les classes `OpenAPIValidator` et `ProjetRulesValidator` pour vérifier
-        la conformité du fichier Swagger aux normes OpenAPI et aux règles spécifiques du projet.
-        Les résultats de la validation sont affichés dans la zone de texte. Les messages d'erreur
-        sont affichés en rouge, et les messages de succès en vert. Un double retour à la ligne est ajouté
-        entre chaque erreur pour une meilleure lisibilité.
+        La validation (classes `OpenAPIValidator` et `ProjetRulesValidator`) est exécutée dans un
+        `ValidationWorker` ; l'interface reste réactive et les erreurs sont affichées au fur et à mesure
+        par `_poll_results`. Les messages d'erreur sont affichés en rouge, et les messages de succès en
+        vert. Un double retour à la ligne est ajouté entre chaque erreur pour une meilleure lisibilité.
         """
-        if not self.swagger_dict:
+        if self.swagger_document is None:
             messagebox.showwarning("Attention", "Veuillez d'abord importer un Swagger.")
             return
+        if self.validation_worker is not None or self.watch_worker is not None:
+            return
 
         self.result_text.delete(1.0, tk.END)  # Effacer le texte précédent
 
-        # Validation OpenAPI
-        openapi_validator = OpenAPIValidator(self.swagger_dict, self.swagger_text)
-        openapi_valid, openapi_message = openapi_validator.validate()
+        # Les règles ne sont relues et recompilées que si le fichier a changé depuis la validation précédente ;
+        # elles sont alors prises en compte sans redémarrer l'application, et les résultats mémorisés sont invalidés.
+        try:
+            rules = get_compiled_rules(default_rules_config_path())
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Erreur", f"Impossible de charger les règles du projet : {str(e)}")
+            return
+        if self.incremental_cache is None or rules is not self.project_rules:
+            if self.project_rules is not None:
+                self.result_text.insert(tk.END, "Règles du projet rechargées.\n\n", "success")
+            self.incremental_cache = IncrementalCache(context=rules.source)
+            self.project_rules = rules
+
+        self._finding_counts = {OPENAPI_SECTION: 0, PROJET_SECTION: 0}
+        self.validation_worker = ValidationWorker(self.swagger_document, rules, self.incremental_cache)
+        self._set_running(True)
+        self.validation_worker.start()
+        self.after(POLL_INTERVAL_MS, self._poll_results)
+
+    def cancel_validation(self):
+        """
+        Annule la validation en cours.
+        """
+        if self.validation_worker is not None:
+            self.status_label.config(text="Annulation en cours...")
+            self.validation_worker.cancel()
 
-        if openapi_valid:
-            self.result_text.insert(tk.END, "Le swagger est conforme aux normes OpenAPI.\n\n", "success")
+    def _set_running(self, running):
+        """
+        Met à jour les boutons, la barre de progression et le statut au début et à la fin d'une validation.
+        """
+        self.upload_button.config(state=tk.DISABLED if running else tk.NORMAL)
+        self.validate_button.config(state=tk.DISABLED if running or self.watch_worker is not None else tk.NORMAL)
+        self.cancel_button.config(state=tk.NORMAL if running else tk.DISABLED)
+        if running:
+            self.status_label.config(text="Validation en cours...")
+            self.progress_bar.start(10)
         else:
-            self.result_text.insert(tk.END, f"Erreur OpenAPI :\n{openapi_message}\n\n", "error")
+            self.progress_bar.stop()
+
+    def _poll_results(self):
+        """
+        Affiche les résultats publiés par le thread de validation, par lots de `MAX_MESSAGES_PER_POLL`,
+        puis se replanifie avec `after()` tant que la validation n'est pas terminée.
+        """
+        worker = self.validation_worker
+        if worker is None:
+            return
+        for _ in range(MAX_MESSAGES_PER_POLL):
+            try:
+                message = worker.results.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == FINDING:
+                self._show_finding(message[1], message[2])
+            elif message[0] == SECTION_DONE:
+                self._show_section_result(message[1], message[2])
+            else:
+                self._finish_validation(message)
+                return
 
-        # Validation des règles du projet
-        project_validator = ProjetRulesValidator(self.swagger_dict, self.swagger_text)
-        project_valid, project_message = project_validator.validate()
+        found = sum(self._finding_counts.values())
+        self.status_label.config(text=f"Validation en cours... {found} erreur(s) trouvée(s)")
+        self.after(POLL_INTERVAL_MS, self._poll_results)
 
-        if project_valid:
-            self.result_text.insert(tk.END, "Le Swagger est conforme aux normes du Projet.\n", "success")
+    def _show_finding(self, section, text):
+        """
+        Affiche une erreur, précédée de l'en-tête de sa section pour la première erreur.
+        """
+        count = self._finding_counts[section]
+        self._finding_counts[section] = count + 1
+        if section == OPENAPI_SECTION:
+            if count == 0:
+                self.result_text.insert(tk.END, "Erreur OpenAPI :\n", "error")
+            self.result_text.insert(tk.END, f"{text}\n", "error")
         else:
+            if count == 0:
+                self.result_text.insert(tk.END, "Erreur, le swagger n'est pas conforme aux normes du projet :\n ", "error")
             # Ajout d'un double retour chariot entre chaque erreur
-            formatted_message = "\n\n".join(project_message.split("\n"))
-            self.result_text.insert(tk.END, f"Erreur, le swagger n'est pas conforme aux normes du projet :\n {formatted_message}\n", "error")
+            separator = "\n\n" if count else ""
+            self.result_text.insert(tk.END, separator + "\n\n".join(text.split("\n")), "error")
+
+    def _show_section_result(self, section, valid):
+        """
+        Termine l'affichage d'une section : message de succès, ou fin de la liste des erreurs.
+        """
+        if section == OPENAPI_SECTION:
+            if valid:
+                self.result_text.insert(tk.END, "Le swagger est conforme aux normes OpenAPI.\n\n", "success")
+            else:
+                self.result_text.insert(tk.END, "\n", "error")
+        elif valid:
+            self.result_text.insert(tk.END, "Le Swagger est conforme aux normes du Projet.\n", "success")
+        else:
+            self.result_text.insert(tk.END, "\n", "error")
+
+    def _finish_validation(self, message):
+        """
+        Traite le dernier message du thread de validation (`DONE`, `CANCELLED` ou `FAILED`).
+        """
+        self.validation_worker = None
+        self._set_running(False)
+        if message[0] == DONE:
+            self.status_label.config(text="Validation terminée.")
+            if message[1] and message[2]:
+                messagebox.showinfo("Validation", "Swagger est valide selon les normes OpenAPI et les règles du projet.")
+        elif message[0] == CANCELLED:
+            self.status_label.config(text="Validation annulée.")
+            self.result_text.insert(tk.END, "\nValidation annulée.\n", "error")
+        else:
+            self.status_label.config(text="Validation interrompue.")
+            messagebox.showerror("Erreur", f"Erreur lors de la validation : {message[1]}")
+
+    def toggle_watch(self):
+        """
+        Active ou désactive le mode surveillance selon l'état de la case à cocher.
+        """
+        if not self.watch_var.get():
+            self.stop_watch()
+            return
+        if self.swagger_file_path is None or self.swagger_document is None:
+            self.watch_var.set(False)
+            messagebox.showwarning("Attention", "Veuillez d'abord importer un Swagger.")
+            return
+        if self.validation_worker is not None:
+            self.validation_worker.cancel()
 
-        if openapi_valid and project_valid:
-            messagebox.showinfo("Validation", "Swagger est valide selon les normes OpenAPI et les règles du projet.")
+        self.watch_worker = WatchWorker(self.swagger_file_path, default_rules_config_path())
+        self.validate_button.config(state=tk.DISABLED)
+        self.status_label.config(text="Surveillance en cours...")
+        self.watch_worker.start()
+        self.after(POLL_INTERVAL_MS, self._poll_watch)
+
+    def stop_watch(self):
+        """
+        Arrête le mode surveillance.
+        """
+        if self.watch_worker is not None:
+            self.watch_worker.stop()
+            self.watch_worker = None
+        self.watch_var.set(False)
+        if self.validation_worker is None:
+            self.validate_button.config(state=tk.NORMAL)
+            self.status_label.config(text="Surveillance arrêtée.")
+
+    def _poll_watch(self):
+        """
+        Affiche le dernier résultat publié par le thread de surveillance, puis se replanifie avec `after()`.
+        """
+        worker = self.watch_worker
+        if worker is None:
+            return
+        latest = None
+        while True:
+            try:
+                message = worker.results.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == FAILED:
+                self.stop_watch()
+                messagebox.showerror("Erreur", f"Erreur lors de la surveillance : {message[1]}")
+                return
+            latest = message
+        if latest is not None and latest[0] == WATCH_RESULT:
+            self._show_watch_record(latest[1], latest[2])
+        self.after(POLL_INTERVAL_MS, self._poll_watch)
+
+    def _show_watch_record(self, record, document):
+        """
+        Remplace les résultats affichés par ceux d'une nouvelle validation du mode surveillance, en
+        conservant la position de défilement.
+        """
+        if document is not None:
+            self.swagger_document = document
+        scroll_position = self.result_text.yview()[0]
+        self.result_text.delete(1.0, tk.END)
+        if "error" in record:
+            self.result_text.insert(tk.END, f"{record['error']}\n", "error")
+        else:
+            self._finding_counts = {OPENAPI_SECTION: 0, PROJET_SECTION: 0}
+            for section in (OPENAPI_SECTION, PROJET_SECTION):
+                for text in record[section]["errors"]:
+                    self._show_finding(section, text)
+                self._show_section_result(section, record[section]["valid"])
+        self.result_text.yview_moveto(scroll_position)
+        self.status_label.config(text=f"Surveillance en cours... dernière validation à {time.strftime('%H:%M:%S')}")
 
 if __name__ == "__main__":
     app = UserInterface()
@@ -0,0 +1,180 @@
+import queue
+import threading
+
+from src.cli.watch import WatchSession
+from src.utils.file_watcher import FileWatcher
+from src.utils.instrumentation import ValidationHooks
+from src.validators.openapi.openapi_validator import MAX_DETAILED_ERRORS, OpenAPIValidator
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator
+
+# Messages transmis par le thread de validation à l'interface
+FINDING = "finding"            # (FINDING, section, texte)
+SECTION_DONE = "section_done"  # (SECTION_DONE, section, valide)
+DONE = "done"                  # (DONE, openapi_valide, projet_valide)
+CANCELLED = "cancelled"        # (CANCELLED,)
+FAILED = "failed"              # (FAILED, message)
+WATCH_RESULT = "watch_result"  # (WATCH_RESULT, résultat, document)
+
+OPENAPI_SECTION = "openapi"
+PROJET_SECTION = "projet"
+
+
+class ValidationCancelled(Exception):
+    """
+    Levée dans le thread de validation lorsque l'utilisateur a annulé la validation.
+    """
+
+
+class CancellationHooks(ValidationHooks):
+    """
+    Points d'observation qui interrompent la validation dès qu'elle est annulée : au début de chaque
+    validateur et à chaque opération parcourue, même si aucune erreur n'est trouvée.
+    """
+
+    def __init__(self, cancelled):
+        """
+        :param cancelled: L'évènement (`threading.Event`) positionné par l'annulation.
+        """
+        self.cancelled = cancelled
+
+    def check(self):
+        """
+        :raises ValidationCancelled: Si la validation a été annulée.
+        """
+        if self.cancelled.is_set():
+            raise ValidationCancelled()
+
+    def validator_started(self, name):
+        self.check()
+
+    def operation_visited(self, operation):
+        self.check()
+
+
+class ValidationWorker(threading.Thread):
+    """
+    Thread exécutant la validation OpenAPI puis celle des règles du projet hors du thread Tk.
+
+    Chaque erreur est publiée dans la file `results` dès qu'elle est trouvée ; l'interface la vide
+    périodiquement (`after()`), ce qui lui permet d'afficher les premières erreurs avant la fin de la
+    validation et de rester réactive. `cancel()` interrompt la validation avant l'erreur suivante, au
+    début du validateur suivant ou à l'opération suivante (voir `CancellationHooks`).
+    """
+
+    def __init__(self, document, rules, incremental_cache=None):
+        """
+        Initialise le thread de validation.
+
+        :param document: Le `SpecDocument` à valider.
+        :param rules: Les règles du projet (`CompiledRules` ou dictionnaire).
+        :param incremental_cache: (optionnel) `IncrementalCache` des règles du projet, enregistré en fin de validation.
+        """
+        super().__init__(name="swagger-validation", daemon=True)
+        self.document = document
+        self.cancelled = threading.Event()
+        self.hooks = CancellationHooks(self.cancelled)
+        self.project_validator = ProjetRulesValidator(document, None, rules=rules, hooks=self.hooks)
+        self.incremental_cache = incremental_cache
+        self.results = queue.Queue()
+
+    def cancel(self):
+        """
+        Demande l'arrêt de la validation ; un message `CANCELLED` est publié dès qu'elle s'interrompt.
+        """
+        self.cancelled.set()
+
+    def run(self):
+        try:
+            openapi_valid = self._validate_openapi()
+            project_valid = self._validate_project()
+            self.results.put((DONE, openapi_valid, project_valid))
+        except ValidationCancelled:
+            self.results.put((CANCELLED,))
+        except Exception as e:
+            self.results.put((FAILED, str(e)))
+
+    def _publish(self, section, message):
+        self.results.put((FINDING, section, message))
+
+    def _validate_openapi(self):
+        """
+        Publie les erreurs OpenAPI ; les premières sont détaillées comme dans `OpenAPIValidator.validate`.
+
+        :return: True si le document respecte la norme OpenAPI.
+        """
+        valid = True
+        try:
+            records = OpenAPIValidator(self.document, None, hooks=self.hooks).iter_records()
+            for index, record in enumerate(records):
+                valid = False
+                # Vérifiée avant la mise en forme, qui peut calculer l'index des positions.
+                self.hooks.check()
+                self._publish(OPENAPI_SECTION, record.render(detailed=index < MAX_DETAILED_ERRORS))
+        except ValidationCancelled:
+            raise
+        except Exception as e:
+            valid = False
+            self._publish(OPENAPI_SECTION, f"Erreur lors de la validation OpenAPI: {str(e)}")
+        self.results.put((SECTION_DONE, OPENAPI_SECTION, valid))
+        return valid
+
+    def _validate_project(self):
+        """
+        Publie les erreurs des règles du projet. Le cache incrémental n'est enregistré que si la
+        validation est allée jusqu'au bout.
+
+        :return: True si le document respecte les règles du projet.
+        """
+        self.hooks.check()
+        valid = True
+        for finding in self.project_validator.iter_findings(self.incremental_cache):
+            valid = False
+            self.hooks.check()
+            self._publish(PROJET_SECTION, finding.render(self.document))
+        if self.incremental_cache is not None:
+            self.incremental_cache.save()
+        self.results.put((SECTION_DONE, PROJET_SECTION, valid))
+        return valid
+
+
+class WatchWorker(threading.Thread):
+    """
+    Thread du mode surveillance : valide le Swagger, puis de nouveau à chaque modification de son contenu
+    ou de celui des règles du projet (voir `WatchSession`).
+
+    Chaque résultat complet est publié dans la file `results` avec le document validé ; l'interface
+    remplace alors l'affichage précédent.
+    """
+
+    def __init__(self, spec_path, rules_path, watcher=None):
+        """
+        Initialise le thread de surveillance.
+
+        :param spec_path: Chemin du fichier Swagger.
+        :param rules_path: Chemin du fichier JSON des règles du projet.
+        :param watcher: (optionnel) `FileWatcher` à utiliser, par défaut sur le Swagger et les règles.
+        """
+        super().__init__(name="swagger-watch", daemon=True)
+        self.session = WatchSession(spec_path, rules_path)
+        self.watcher = watcher or FileWatcher([spec_path, rules_path])
+        self.results = queue.Queue()
+
+    def stop(self):
+        """
+        Arrête la surveillance ; le thread se termine au plus tard après la validation en cours.
+        """
+        self.watcher.stop()
+
+    def run(self):
+        try:
+            with self.watcher:
+                changed = None
+                while True:
+                    record = self.session.refresh(changed)
+                    if record is not None:
+                        self.results.put((WATCH_RESULT, record, self.session.document))
+                    changed = self.watcher.wait()
+                    if not changed:
+                        return
+        except Exception as e:
+            self.results.put((FAILED, str(e)))
@@ -0,0 +1,244 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+# Délai sans nouvelle modification avant de signaler un changement : un enregistrement produit souvent
+# plusieurs événements (troncature, écriture, renommage du fichier temporaire de l'éditeur).
+DEFAULT_DEBOUNCE = 0.05
+# Intervalle de comparaison des fichiers lorsque inotify n'est pas disponible.
+DEFAULT_POLL_INTERVAL = 0.1
+# Durée maximale d'une attente élémentaire, pour prendre en compte `stop()` rapidement.
+_STOP_CHECK_INTERVAL = 0.1
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class _InotifyBackend:
+    """
+    Surveillance par inotify (Linux), appelé via ctypes.
+
+    Les répertoires des fichiers sont surveillés plutôt que les fichiers eux-mêmes : les éditeurs qui
+    enregistrent en remplaçant le fichier (écriture d'un fichier temporaire puis renommage) restent
+    ainsi suivis.
+    """
+
+    def __init__(self, paths):
+        """
+        Args:
+            paths (set): Chemins absolus des fichiers à surveiller.
+
+        Raises:
+            OSError: Si inotify n'est pas disponible ou qu'un répertoire ne peut pas être surveillé.
+        """
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError("inotify n'est pas disponible")
+        self._libc = libc
+        self._paths = paths
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self._directories = {}
+        try:
+            for directory in sorted({os.path.dirname(path) for path in paths}):
+                wd = libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+                if wd < 0:
+                    raise OSError(ctypes.get_errno(), f"inotify_add_watch {directory}")
+                self._directories[wd] = directory
+        except OSError:
+            self.close()
+            raise
+
+    def read(self, timeout):
+        """
+        Attend des événements pendant au plus `timeout` secondes.
+
+        Args:
+            timeout (float): Durée maximale de l'attente.
+
+        Returns:
+            set: Les fichiers surveillés concernés par les événements reçus.
+        """
+        changed = set()
+        ready, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not ready:
+            return changed
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    # Des événements ont été perdus : tous les fichiers sont considérés comme modifiés.
+                    changed.update(self._paths)
+                elif wd in self._directories and name:
+                    path = os.path.join(self._directories[wd], os.fsdecode(name))
+                    if path in self._paths:
+                        changed.add(path)
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class _PollingBackend:
+    """
+    Surveillance par comparaison périodique de la date de modification, de la taille et de l'inode.
+    """
+
+    def __init__(self, paths, poll_interval):
+        """
+        Args:
+            paths (set): Chemins absolus des fichiers à surveiller.
+            poll_interval (float): Intervalle entre deux comparaisons, en secondes.
+        """
+        self._poll_interval = poll_interval
+        self._signatures = {path: self._signature(path) for path in paths}
+
+    @staticmethod
+    def _signature(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def read(self, timeout):
+        """
+        Compare les fichiers jusqu'à constater une modification, pendant au plus `timeout` secondes.
+
+        Args:
+            timeout (float): Durée maximale de l'attente.
+
+        Returns:
+            set: Les fichiers modifiés.
+        """
+        deadline = time.monotonic() + max(timeout, 0)
+        while True:
+            time.sleep(max(0, min(self._poll_interval, deadline - time.monotonic())))
+            changed = set()
+            for path, signature in self._signatures.items():
+                current = self._signature(path)
+                if current != signature:
+                    self._signatures[path] = current
+                    changed.add(path)
+            if changed or time.monotonic() >= deadline:
+                return changed
+
+    def close(self):
+        pass
+
+
+class FileWatcher:
+    """
+    Surveille un ensemble de fichiers et signale leurs modifications, regroupées par rafale.
+
+    inotify est utilisé lorsqu'il est disponible (Linux) ; sinon, les fichiers sont comparés
+    périodiquement. Seul le fait qu'un fichier a été touché est signalé : c'est à l'appelant de
+    vérifier, par exemple avec une empreinte du contenu, que celui-ci a réellement changé.
+
+    Attributes:
+        paths (set): Chemins absolus des fichiers surveillés.
+        backend (str): "inotify" ou "polling".
+    """
+
+    def __init__(self, paths, debounce=DEFAULT_DEBOUNCE, poll_interval=DEFAULT_POLL_INTERVAL, use_inotify=True):
+        """
+        Initialise la surveillance.
+
+        Args:
+            paths (list): Fichiers à surveiller.
+            debounce (float): Délai sans nouvel événement (en secondes) avant de signaler une rafale de modifications.
+            poll_interval (float): Intervalle de comparaison (en secondes) lorsque inotify n'est pas utilisé.
+            use_inotify (bool): Utiliser inotify lorsqu'il est disponible.
+        """
+        self.paths = {os.path.abspath(path) for path in paths}
+        self.debounce = debounce
+        self._stopped = threading.Event()
+        self._backend = None
+        if use_inotify and sys.platform.startswith('linux'):
+            try:
+                self._backend = _InotifyBackend(self.paths)
+                self.backend = "inotify"
+            except (OSError, AttributeError, TypeError):
+                self._backend = None
+        if self._backend is None:
+            self._backend = _PollingBackend(self.paths, poll_interval)
+            self.backend = "polling"
+
+    def wait(self, timeout=None):
+        """
+        Attend la prochaine rafale de modifications.
+
+        Après une première modification, les événements suivants sont regroupés jusqu'à ce qu'aucun
+        n'arrive pendant `debounce` secondes.
+
+        Args:
+            timeout (float, optional): Durée maximale de l'attente de la première modification.
+
+        Returns:
+            set: Les fichiers modifiés (chemins absolus), vide si le délai a expiré ou si `stop()` a été appelé.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed = set()
+        while not changed:
+            if self._stopped.is_set():
+                return set()
+            wait = _STOP_CHECK_INTERVAL
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    return set()
+            changed = self._backend.read(wait)
+
+        quiet_until = time.monotonic() + self.debounce
+        while not self._stopped.is_set():
+            remaining = quiet_until - time.monotonic()
+            if remaining <= 0:
+                break
+            more = self._backend.read(remaining)
+            if more:
+                changed |= more
+                quiet_until = time.monotonic() + self.debounce
+        return changed
+
+    def stop(self):
+        """
+        Interrompt `wait()` (éventuellement depuis un autre thread) ; les attentes suivantes retournent immédiatement.
+        """
+        self._stopped.set()
+
+    def close(self):
+        """
+        Libère les ressources de la surveillance ; à appeler depuis le thread qui utilise `wait()`.
+        """
+        self._stopped.set()
+        self._backend.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,46 @@
+import hashlib
+import json
+
+def _normalize_keys(value):
+    """
+    Convertit récursivement les clés de dictionnaire en chaînes (le YAML autorise par exemple `200:` comme clé entière).
+
+    Args:
+        value: Valeur issue d'un document Swagger.
+
+    Returns:
+        La même valeur, dont tous les dictionnaires ont des clés de type `str`.
+    """
+    if isinstance(value, dict):
+        return {str(key): _normalize_keys(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_keys(item) for item in value]
+    return value
+
+def canonical_json(value):
+    """
+    Sérialise une valeur en JSON canonique : clés triées, sans espaces, indépendant de l'ordre de saisie.
+
+    Args:
+        value: Valeur sérialisable en JSON.
+
+    Returns:
+        str: La représentation canonique.
+    """
+    try:
+        return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    except TypeError:
+        # Clés de types mélangés (int et str) : impossible à trier sans normalisation.
+        return json.dumps(_normalize_keys(value), sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+def fingerprint(value):
+    """
+    Calcule l'empreinte SHA-256 du JSON canonique d'une valeur.
+
+    Args:
+        value: Valeur sérialisable en JSON.
+
+    Returns:
+        str: L'empreinte hexadécimale.
+    """
+    return hashlib.sha256(canonical_json(value).encode('utf-8')).hexdigest()
@@ -0,0 +1,161 @@
+import time
+
+from contextlib import contextmanager
+
+
+class ValidationHooks:
+    """
+    Points d'observation d'une validation. Les méthodes ne font rien : les sous-classes redéfinissent
+    celles qui les intéressent.
+
+    Les validateurs ne sont instrumentés que lorsqu'un objet `ValidationHooks` leur est transmis ; sans
+    lui, ils suivent exactement le même chemin qu'auparavant.
+
+    Les validateurs sont désignés par leur nom, par exemple "openapi", "projet.header" ou "projet.response".
+    """
+
+    def validator_started(self, name):
+        """
+        Args:
+            name (str): Nom du validateur qui commence.
+        """
+
+    def validator_finished(self, name, seconds):
+        """
+        Args:
+            name (str): Nom du validateur qui a terminé.
+            seconds (float): Temps passé dans le validateur (hors temps du consommateur des constats).
+        """
+
+    def operation_visited(self, operation):
+        """
+        Args:
+            operation (Operation): Opération parcourue par les règles du projet.
+        """
+
+    def node_visited(self, name, kind):
+        """
+        Args:
+            name (str): Nom du validateur appelé.
+            kind (str): Nature de l'élément visité : "path", "operation", "parameter" ou "response".
+        """
+
+    def finding_emitted(self, name, finding):
+        """
+        Args:
+            name (str): Nom du validateur à l'origine du constat.
+            finding: Le constat (`Finding` ou `OpenAPIError`).
+        """
+
+
+class ValidationStats(ValidationHooks):
+    """
+    Collecte, pour chaque validateur, le temps passé, le nombre d'éléments visités et le nombre de
+    constats, ainsi que le nombre d'opérations parcourues. Les valeurs s'additionnent sur toutes les
+    validations observées.
+
+    Attributes:
+        validators (dict): Nom du validateur -> `{"seconds", "runs", "nodes", "findings"}`.
+        operations (int): Nombre d'opérations parcourues.
+    """
+
+    def __init__(self):
+        self.validators = {}
+        self.operations = 0
+
+    def _stats(self, name):
+        stats = self.validators.get(name)
+        if stats is None:
+            stats = self.validators[name] = {"seconds": 0.0, "runs": 0, "nodes": 0, "findings": 0}
+        return stats
+
+    def validator_started(self, name):
+        self._stats(name)["runs"] += 1
+
+    def validator_finished(self, name, seconds):
+        self._stats(name)["seconds"] += seconds
+
+    def operation_visited(self, operation):
+        self.operations += 1
+
+    def node_visited(self, name, kind):
+        self._stats(name)["nodes"] += 1
+
+    def finding_emitted(self, name, finding):
+        self._stats(name)["findings"] += 1
+
+    def ranking(self):
+        """
+        Returns:
+            list: Tuples (nom, statistiques), du validateur le plus lent au plus rapide.
+        """
+        return sorted(self.validators.items(), key=lambda item: (-item[1]["seconds"], item[0]))
+
+    def format_report(self):
+        """
+        Met en forme les statistiques en un tableau classé par temps décroissant.
+
+        Returns:
+            str: Le tableau, terminé par le total et le nombre d'opérations parcourues.
+        """
+        total = sum(stats["seconds"] for stats in self.validators.values())
+        lines = [f"{'Validateur':<32} {'Temps (s)':>10} {'%':>6} {'Exéc.':>6} {'Éléments':>9} {'Constats':>9}"]
+        for name, stats in self.ranking():
+            share = 100 * stats["seconds"] / total if total else 0.0
+            lines.append(f"{name:<32} {stats['seconds']:>10.4f} {share:>6.1f} {stats['runs']:>6} "
+                         f"{stats['nodes']:>9} {stats['findings']:>9}")
+        lines.append(f"{'Total':<32} {total:>10.4f}")
+        lines.append(f"Opérations parcourues : {self.operations}")
+        return "\n".join(lines)
+
+
+def timed_findings(hooks, name, findings):
+    """
+    Instrumente un générateur de constats : le temps mesuré est celui passé à produire les constats,
+    pas celui du consommateur.
+
+    Args:
+        hooks (ValidationHooks): Les points d'observation.
+        name (str): Nom du validateur.
+        findings: Itérable des constats du validateur.
+
+    Yields:
+        Les constats, inchangés.
+    """
+    hooks.validator_started(name)
+    elapsed = 0.0
+    iterator = iter(findings)
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                finding = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                elapsed += time.perf_counter() - started
+            hooks.finding_emitted(name, finding)
+            yield finding
+    finally:
+        hooks.validator_finished(name, elapsed)
+
+@contextmanager
+def profile_to(file_path):
+    """
+    Exécute un bloc sous cProfile et enregistre les statistiques (lisibles avec `pstats` ou snakeviz).
+
+    Args:
+        file_path (str): Fichier où enregistrer les statistiques.
+
+    Yields:
+        cProfile.Profile: Le profileur actif.
+    """
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(file_path)
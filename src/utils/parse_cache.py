@@ -0,0 +1,217 @@
+import datetime
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+# Version du format des entrées ; elle fait partie du nom des fichiers, si bien qu'une entrée d'un autre
+# format n'est jamais relue.
+PARSE_CACHE_FORMAT_VERSION = 1
+
+# Taille totale maximale des entrées du cache, au-delà de laquelle les moins récemment utilisées sont supprimées.
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# En deçà de cette taille, un document est plus vite analysé que relu depuis le cache.
+DEFAULT_MIN_DOCUMENT_BYTES = 64 * 1024
+
+_ENTRY_SUFFIX = f".v{PARSE_CACHE_FORMAT_VERSION}.pickle"
+
+# Seules classes qu'une entrée peut contenir en plus des types de base (dates et horodatages YAML).
+_ALLOWED_CLASSES = frozenset((
+    ('datetime', 'date'), ('datetime', 'datetime'), ('datetime', 'time'),
+    ('datetime', 'timedelta'), ('datetime', 'timezone'),
+))
+
+_default_cache = None
+
+def default_cache_dir():
+    """
+    Retourne le répertoire du cache d'analyse par défaut.
+
+    Returns:
+        str: `$SWAGGERCHECKER_CACHE_DIR/parse` s'il est défini, sinon le répertoire de cache de l'utilisateur
+        (`%LOCALAPPDATA%` sous Windows, `$XDG_CACHE_HOME` ou `~/.cache` ailleurs) suivi de `swaggerchecker/parse`.
+    """
+    base = os.environ.get('SWAGGERCHECKER_CACHE_DIR')
+    if base:
+        return os.path.join(base, 'parse')
+    if sys.platform == 'win32':
+        root = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(root, 'swaggerchecker', 'parse')
+
+def get_default_parse_cache():
+    """
+    Retourne le cache d'analyse par défaut du processus, créé au premier appel.
+
+    Returns:
+        ParseCache: Le cache situé dans `default_cache_dir()`.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ParseCache(default_cache_dir())
+    return _default_cache
+
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    """
+    Relit une entrée sans pouvoir instancier d'autre classe que les dates : une entrée modifiée à la main
+    ne peut pas exécuter de code.
+    """
+
+    def find_class(self, module, name):
+        if (module, name) in _ALLOWED_CLASSES:
+            return getattr(datetime, name)
+        raise pickle.UnpicklingError(f"Classe non autorisée dans le cache d'analyse : {module}.{name}")
+
+
+class ParseCache:
+    """
+    Cache disque des documents Swagger YAML analysés, indexé par l'empreinte SHA-256 de leur contenu.
+
+    Un fichier inchangé, quel que soit son chemin, n'est ainsi analysé qu'une fois : les validations
+    suivantes (CI, interface graphique) relisent le dictionnaire et l'index des positions depuis le cache.
+    Chaque entrée est un fichier du répertoire, écrit de façon atomique, si bien que plusieurs processus
+    peuvent partager le cache. La date de modification d'une entrée est mise à jour à chaque lecture ;
+    lorsque la taille totale dépasse `max_bytes`, les entrées les moins récemment utilisées sont supprimées.
+
+    Une entrée illisible est ignorée (et supprimée) ; une erreur d'écriture n'interrompt pas la validation.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES, min_document_bytes=DEFAULT_MIN_DOCUMENT_BYTES):
+        """
+        Args:
+            directory (str): Répertoire des entrées (créé à la première écriture).
+            max_bytes (int): Taille totale maximale des entrées.
+            min_document_bytes (int): Taille en deçà de laquelle un document n'est pas mis en cache.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.min_document_bytes = min_document_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def accepts(self, size):
+        """
+        Indique si un document de cette taille doit passer par le cache.
+
+        Args:
+            size (int): Taille du contenu en octets.
+
+        Returns:
+            bool: True si le document est assez grand pour que le cache soit utile.
+        """
+        return size >= self.min_document_bytes
+
+    @staticmethod
+    def key(content, kind):
+        """
+        Calcule la clé d'une entrée.
+
+        Args:
+            content (bytes | mmap.mmap): Contenu brut du fichier.
+            kind (str): Nature de l'entrée, par exemple 'yaml' (document analysé).
+
+        Returns:
+            str: La clé (empreinte du contenu et nature).
+        """
+        return f"{hashlib.sha256(content).hexdigest()}.{kind}"
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    def get(self, key):
+        """
+        Relit une entrée.
+
+        Args:
+            key (str): Clé calculée par `key`.
+
+        Returns:
+            La valeur enregistrée, ou None si elle est absente ou illisible.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                value = _RestrictedUnpickler(file).load()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            self.misses += 1
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Enregistre une entrée, puis supprime les moins récemment utilisées si le cache dépasse sa taille maximale.
+
+        Args:
+            key (str): Clé calculée par `key`.
+            value: Valeur à enregistrer (types de base et dates).
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(descriptor, 'wb') as file:
+                    pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temporary_path, self._path(key))
+            except BaseException:
+                self._remove(temporary_path)
+                raise
+        except Exception:
+            return
+        self.evict()
+
+    def evict(self):
+        """
+        Supprime les entrées les moins récemment utilisées jusqu'à ce que le cache ne dépasse plus `max_bytes`.
+        """
+        entries = []
+        try:
+            with os.scandir(self.directory) as iterator:
+                for entry in iterator:
+                    if entry.name.endswith(_ENTRY_SUFFIX):
+                        try:
+                            stat = entry.stat()
+                        except FileNotFoundError:
+                            continue
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except FileNotFoundError:
+            return
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            self._remove(path)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        """
+        Supprime toutes les entrées du cache.
+        """
+        try:
+            with os.scandir(self.directory) as iterator:
+                for entry in iterator:
+                    if entry.name.endswith(_ENTRY_SUFFIX):
+                        self._remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
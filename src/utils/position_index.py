@@ -0,0 +1,344 @@
+import json
+import re
+
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, repeat
+from json.decoder import scanstring
+from operator import add
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER = re.compile(r'(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?')
+_CONSTANTS = (
+    ('true', True),
+    ('false', False),
+    ('null', None),
+    ('NaN', float('nan')),
+    ('Infinity', float('inf')),
+    ('-Infinity', float('-inf')),
+)
+
+# Nombre maximal de positions recopiées sous les alias YAML : au-delà, un alias est indexé sans ses
+# descendants (protection contre les documents dont les alias imbriqués se démultiplient).
+MAX_ALIAS_POSITIONS = 1_000_000
+
+
+def escape_pointer_token(token):
+    """
+    Échappe un segment de JSON pointer selon la RFC 6901.
+
+    Args:
+        token: Clé de dictionnaire ou index de liste.
+
+    Returns:
+        str: Le segment échappé (`~` devient `~0`, `/` devient `~1`).
+    """
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def json_pointer(*tokens):
+    """
+    Construit un JSON pointer à partir d'une suite de clés et d'index.
+
+    Exemple: `json_pointer('paths', '/pet', 'get')` retourne `/paths/~1pet/get`.
+
+    Returns:
+        str: Le JSON pointer correspondant ("" désigne la racine du document).
+    """
+    return ''.join('/' + escape_pointer_token(token) for token in tokens)
+
+
+class PositionIndex:
+    """
+    Index associant chaque JSON pointer du document à sa position (ligne, colonne) dans le texte source.
+
+    Pour un membre de dictionnaire, la position enregistrée est celle de sa clé ; pour un élément de
+    liste, celle du début de l'élément. Les lignes et colonnes commencent à 1.
+    """
+
+    __slots__ = ('_positions',)
+
+    def __init__(self, positions=None):
+        """
+        Initialise l'index.
+
+        Args:
+            positions (dict, optional): Dictionnaire JSON pointer -> (ligne, colonne).
+        """
+        self._positions = positions if positions is not None else {}
+
+    def as_dict(self):
+        """
+        Retourne les positions sous forme de dictionnaire, par exemple pour les enregistrer dans le cache d'analyse.
+
+        Returns:
+            dict: Dictionnaire JSON pointer -> (ligne, colonne).
+        """
+        return self._positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, pointer):
+        return pointer in self._positions
+
+    def locate(self, pointer):
+        """
+        Retourne la position exacte d'un JSON pointer.
+
+        Args:
+            pointer (str): JSON pointer à rechercher.
+
+        Returns:
+            tuple: (ligne, colonne), ou None si le pointer n'est pas indexé.
+        """
+        return self._positions.get(pointer)
+
+    def line(self, pointer, default="inconnue"):
+        """
+        Retourne le numéro de ligne d'un JSON pointer.
+
+        Args:
+            pointer (str): JSON pointer à rechercher.
+            default: Valeur retournée si le pointer n'est pas indexé.
+
+        Returns:
+            int: Le numéro de ligne, ou `default`.
+        """
+        position = self._positions.get(pointer)
+        return position[0] if position is not None else default
+
+    @classmethod
+    def from_yaml_node(cls, root):
+        """
+        Construit l'index à partir de l'arbre de nœuds produit par `yaml.compose`.
+
+        Args:
+            root (yaml.Node): Nœud racine du document YAML.
+
+        Returns:
+            PositionIndex: L'index des positions.
+        """
+        from yaml.nodes import MappingNode, SequenceNode
+
+        positions = {}
+        if root is None:
+            return cls(positions)
+        positions[''] = (root.start_mark.line + 1, root.start_mark.column + 1)
+
+        # Parcours itératif en profondeur, dans l'ordre du document : un nœud partagé par des alias est
+        # développé à son ancre, qui précède toujours ses alias. Les positions de ses descendants,
+        # enregistrées de façon contiguë dans `order`, sont ensuite recopiées sous chaque alias.
+        order = []
+        spans = {}  # id(nœud) -> (pointer de l'ancre, début, fin) dans `order`
+        copied = 0
+        stack = [(root, '')]
+        while stack:
+            node, pointer = stack.pop()
+            if pointer is None:
+                anchor, start = spans[id(node)]
+                spans[id(node)] = (anchor, start, len(order))
+                continue
+            span = spans.get(id(node))
+            if span is not None:
+                # Un alias récursif (à l'intérieur de sa propre ancre) n'est pas développé.
+                if len(span) == 3 and copied < MAX_ALIAS_POSITIONS:
+                    anchor, start, end = span
+                    copied += end - start
+                    for child, position in order[start:end]:
+                        child = pointer + child[len(anchor):]
+                        positions[child] = position
+                        order.append((child, position))
+                continue
+            children = []
+            if isinstance(node, MappingNode):
+                for key_node, value_node in node.value:
+                    children.append((value_node, pointer + '/' + escape_pointer_token(key_node.value), key_node))
+            elif isinstance(node, SequenceNode):
+                for index, item in enumerate(node.value):
+                    children.append((item, f"{pointer}/{index}", item))
+            else:
+                continue
+            spans[id(node)] = (pointer, len(order))
+            stack.append((node, None))
+            for child_node, child, mark_node in children:
+                position = (mark_node.start_mark.line + 1, mark_node.start_mark.column + 1)
+                positions[child] = position
+                order.append((child, position))
+            stack.extend((child_node, child) for child_node, child, _ in reversed(children))
+        return cls(positions)
+
+    @classmethod
+    def from_text(cls, text):
+        """
+        Construit l'index en analysant un texte JSON ou YAML.
+
+        Utilisé lorsque le document n'a pas été chargé via `load_swagger_document`. Un texte qui commence
+        par `{` ou `[` sans être un JSON valide est analysé comme un YAML en style « flow ». Un texte vide
+        ou illisible produit un index vide.
+
+        Args:
+            text (str): Texte brut du document.
+
+        Returns:
+            PositionIndex: L'index des positions.
+        """
+        if not text or not text.strip():
+            return cls()
+        try:
+            if text.lstrip().startswith(('{', '[')):
+                try:
+                    json.loads(text)
+                    return JsonPositionIndex(text)
+                except ValueError:
+                    pass
+            import yaml
+            return cls.from_yaml_node(yaml.compose(text, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader)))
+        except Exception:
+            return cls()
+
+
+class JsonPositionIndex(PositionIndex):
+    """
+    Index des positions d'un texte JSON valide, calculé à la demande.
+
+    Seuls les conteneurs traversés pour atteindre un pointer demandé sont parcourus, et seulement
+    jusqu'au membre recherché : leurs membres sont repérés au passage et mémorisés, et le parcours
+    d'un conteneur reprend là où il s'était arrêté. Les valeurs sautées le sont par l'analyseur JSON
+    en C (`scan_once`), si bien qu'une recherche ne coûte jamais plus qu'un `json.loads` des parties
+    du document qui la précèdent. Les lignes sont déduites des positions par une table des débuts de
+    ligne, construite au premier besoin.
+    """
+
+    __slots__ = ('_text', '_offsets', '_values', '_containers', '_line_starts')
+
+    # Analyseur JSON en C, utilisé pour sauter une valeur (il retourne la valeur et sa position de fin)
+    _scan_once = json.JSONDecoder().scan_once
+
+    def __init__(self, text):
+        """
+        Initialise l'index.
+
+        Args:
+            text (str): Texte JSON valide (par exemple déjà analysé par `json.loads`).
+        """
+        super().__init__()
+        root = _WHITESPACE.match(text, 0).end()
+        self._text = text
+        self._offsets = {'': root}  # pointer -> position enregistrée (clé ou début de l'élément)
+        self._values = {'': root}  # pointer -> début de la valeur
+        # pointer -> [reprise du parcours (None une fois terminé), index suivant, fin du conteneur,
+        #             dernier membre à sauter, membres repérés]
+        self._containers = {}
+        self._line_starts = None
+
+    def as_dict(self):
+        # Tous les conteneurs sont parcourus jusqu'au bout, dans l'ordre du document.
+        positions, pending = {}, ['']
+        while pending:
+            pointer = pending.pop()
+            positions[pointer] = self._positions.get(pointer) or self._line_column(self._offsets[pointer])
+            if self._text[self._values[pointer]] in '{[':
+                self._scan(pointer, None)
+                pending.extend(reversed(self._containers[pointer][4]))
+        self._positions.update(positions)
+        return positions
+
+    def __len__(self):
+        return len(self.as_dict())
+
+    def __contains__(self, pointer):
+        return self.locate(pointer) is not None
+
+    def locate(self, pointer):
+        position = self._positions.get(pointer)
+        if position is None:
+            try:
+                self._value(pointer)
+            except (ValueError, IndexError, StopIteration):
+                return None
+            offset = self._offsets.get(pointer)
+            if offset is None:
+                return None
+            position = self._positions[pointer] = self._line_column(offset)
+        return position
+
+    def line(self, pointer, default="inconnue"):
+        position = self.locate(pointer)
+        return position[0] if position is not None else default
+
+    def _line_column(self, offset):
+        starts = self._line_starts
+        if starts is None:
+            # Débuts de ligne cumulés en C, sans boucle Python sur les lignes.
+            lengths = map(len, self._text.split('\n'))
+            starts = self._line_starts = array('q', accumulate(map(add, lengths, repeat(1)), initial=0))
+        line = bisect_right(starts, offset)
+        return line, offset - starts[line - 1] + 1
+
+    def _value(self, pointer):
+        """
+        Retourne le début de la valeur désignée par un pointer, ou None si elle n'existe pas.
+        """
+        value = self._values.get(pointer)
+        if value is None and pointer:
+            parent = pointer[:pointer.rindex('/')]
+            if self._value(parent) is not None:
+                self._scan(parent, pointer)
+                value = self._values.get(pointer)
+        return value
+
+    def _scan(self, parent, pointer):
+        """
+        Poursuit le parcours d'un conteneur jusqu'au membre `pointer` ou jusqu'à sa fin (`pointer` None).
+
+        Le membre trouvé n'est sauté qu'à la reprise du parcours : s'il a été parcouru entre-temps, sa fin
+        est déjà connue et il n'est pas analysé une seconde fois.
+        """
+        text = self._text
+        state = self._containers.get(parent)
+        if state is None:
+            start = self._values[parent]
+            if text[start] in '{[':
+                state = [_WHITESPACE.match(text, start + 1).end(), 0, None, None, []]
+            else:
+                state = [None, 0, self._scan_once(text, start)[1], None, []]
+            self._containers[parent] = state
+        offset, index, _, pending, members = state
+        is_dict = text[self._values[parent]] == '{'
+        while offset is not None:
+            if pending is not None:
+                end = _WHITESPACE.match(text, self._end(pending)).end()
+                offset = _WHITESPACE.match(text, end + 1).end() if text[end] == ',' else end
+                pending = None
+            char = text[offset]
+            if char == '}' or char == ']':
+                state[2] = offset + 1
+                offset = None
+                break
+            if is_dict:
+                key, end = scanstring(text, offset + 1)
+                child = parent + '/' + escape_pointer_token(key)
+                value = _WHITESPACE.match(text, _WHITESPACE.match(text, end).end() + 1).end()
+            else:
+                child = f"{parent}/{index}"
+                index += 1
+                value = offset
+            self._offsets[child] = offset
+            self._values[child] = value
+            members.append(child)
+            pending = child
+            if child == pointer:
+                break
+        state[0], state[1], state[3] = offset, index, pending
+
+    def _end(self, pointer):
+        """
+        Retourne la position qui suit la valeur désignée par un pointer déjà repéré.
+        """
+        state = self._containers.get(pointer)
+        if state is None:
+            return self._scan_once(self._text, self._values[pointer])[1]
+        if state[2] is None:
+            self._scan(pointer, None)
+        return state[2]
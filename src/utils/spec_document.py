@@ -0,0 +1,144 @@
+from array import array
+from bisect import bisect_right
+
+from src.utils.position_index import PositionIndex
+
+
+class SpecDocument:
+    """
+    Document Swagger/OpenAPI partagé par tous les validateurs d'une même validation.
+
+    Le document possède le contenu brut, le dictionnaire analysé, le chemin source et l'index des
+    positions. Le texte, la table des débuts de ligne et l'index des positions ne sont calculés
+    qu'au premier accès, une seule fois pour l'ensemble des validateurs. Les attributs ne peuvent
+    pas être réaffectés après la construction.
+
+    Attributes:
+        data (dict): Le dictionnaire représentant le fichier Swagger/OpenAPI.
+        raw (bytes): Le contenu brut du fichier.
+        text (str): Le texte du fichier.
+        source_path (str): Chemin du fichier d'origine, ou None.
+        positions (PositionIndex): Index JSON pointer -> (ligne, colonne).
+        line_offsets (array): Position du début de chaque ligne dans `text`.
+    """
+
+    __slots__ = ('_data', '_raw', '_text', '_source_path', '_positions', '_line_offsets', '_encoding',
+                 '_position_source')
+
+    def __init__(self, data, raw=None, text=None, source_path=None, positions=None, encoding='utf-8',
+                 position_source=None):
+        """
+        Initialise le document.
+
+        Args:
+            data (dict): Le dictionnaire représentant le fichier Swagger/OpenAPI.
+            raw (bytes, optional): Le contenu brut du fichier.
+            text (str, optional): Le texte du fichier, s'il a déjà été décodé.
+            source_path (str, optional): Chemin du fichier d'origine.
+            positions (PositionIndex, optional): Index des positions construit au chargement.
+            encoding (str): Encodage utilisé pour décoder `raw`.
+            position_source (callable, optional): Fonction construisant l'index des positions à partir du texte,
+                appelée au premier accès à `positions` à la place de `PositionIndex.from_text` (par exemple pour
+                le relire depuis le cache d'analyse).
+        """
+        setattr_ = object.__setattr__
+        setattr_(self, '_data', data)
+        setattr_(self, '_raw', raw)
+        setattr_(self, '_text', text)
+        setattr_(self, '_source_path', source_path)
+        setattr_(self, '_positions', positions)
+        setattr_(self, '_line_offsets', None)
+        setattr_(self, '_encoding', encoding)
+        setattr_(self, '_position_source', position_source)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} est immuable")
+
+    @classmethod
+    def wrap(cls, swagger_dict, swagger_text=None, positions=None):
+        """
+        Retourne un `SpecDocument` pour les arguments historiques (dictionnaire, texte) des validateurs.
+
+        Args:
+            swagger_dict (dict | SpecDocument): Le dictionnaire Swagger, ou un document déjà construit.
+            swagger_text (str, optional): Le texte brut, ignoré si `swagger_dict` est déjà un document.
+            positions (PositionIndex, optional): Index des positions, ignoré si `swagger_dict` est déjà un document.
+
+        Returns:
+            SpecDocument: Le document partagé.
+        """
+        if isinstance(swagger_dict, cls):
+            return swagger_dict
+        return cls(swagger_dict, text=swagger_text or '', positions=positions)
+
+    @property
+    def data(self):
+        return self._data
+
+    @property
+    def source_path(self):
+        return self._source_path
+
+    @property
+    def raw(self):
+        if self._raw is None:
+            object.__setattr__(self, '_raw', self.text.encode(self._encoding))
+        return self._raw
+
+    @property
+    def text(self):
+        if self._text is None:
+            object.__setattr__(self, '_text', self._raw.decode(self._encoding) if self._raw is not None else '')
+        return self._text
+
+    @property
+    def positions(self):
+        if self._positions is None:
+            build = self._position_source or PositionIndex.from_text
+            object.__setattr__(self, '_positions', build(self.text))
+        return self._positions
+
+    @property
+    def line_offsets(self):
+        if self._line_offsets is None:
+            text = self.text
+            offsets = array('q', [0])
+            offset = text.find('\n')
+            while offset != -1:
+                offsets.append(offset + 1)
+                offset = text.find('\n', offset + 1)
+            object.__setattr__(self, '_line_offsets', offsets)
+        return self._line_offsets
+
+    @property
+    def line_count(self):
+        return len(self.line_offsets) if self.text else 0
+
+    def line_of_offset(self, offset):
+        """
+        Retourne le numéro de ligne (à partir de 1) d'une position dans le texte.
+
+        Args:
+            offset (int): Position d'un caractère dans `text`.
+
+        Returns:
+            int: Le numéro de ligne.
+        """
+        return bisect_right(self.line_offsets, offset)
+
+    def get_line(self, line_number):
+        """
+        Retourne le texte d'une ligne sans découper tout le document.
+
+        Args:
+            line_number (int): Numéro de la ligne (à partir de 1).
+
+        Returns:
+            str: Le texte de la ligne, sans le retour à la ligne final.
+        """
+        offsets = self.line_offsets
+        if not 1 <= line_number <= len(offsets):
+            raise IndexError(f"Ligne {line_number} hors du document")
+        start = offsets[line_number - 1]
+        end = offsets[line_number] - 1 if line_number < len(offsets) else len(self.text)
+        return self.text[start:end].rstrip('\r')
@@ -1,5 +1,16 @@
+import codecs
 import json
-import yaml
+import mmap
+import os
+import re
+
+from src.utils.position_index import JsonPositionIndex, PositionIndex
+from src.utils.spec_document import SpecDocument
+
+# Au-delà de cette taille, le fichier est projeté en mémoire (mmap) au lieu d'être copié par `read()`.
+MMAP_THRESHOLD = 1024 * 1024
+
+_LEADING_WHITESPACE = re.compile(rb'[ \t\r\n]*')
 
 def load_swagger(file_path):
     """
@@ -11,13 +22,152 @@ def load_swagger(file_path):
     Returns:
         dict: Contenu du fichier Swagger sous forme de dictionnaire.
     """
+    return load_swagger_document(file_path).data
+
+def _is_json(buffer, start):
+    """
+    Détermine le format du document d'après son contenu : un document qui commence par `{` ou `[`
+    est du JSON, tout autre document est analysé comme du YAML.
+    """
+    offset = _LEADING_WHITESPACE.match(buffer, start).end()
+    return buffer[offset:offset + 1] in (b'{', b'[')
+
+def _loads_json(content, source_path):
+    """
+    Analyse un document qui commence par `{` ou `[`. Un tel document peut aussi être un YAML en style
+    « flow » (`{openapi: 3.0.0, ...}`) : s'il n'est pas un JSON valide, None est retourné pour qu'il soit
+    analysé comme un YAML, sauf si le fichier porte l'extension `.json`.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            if file_path.endswith('.json'):
-                return json.load(file)
-            elif file_path.endswith('.yaml') or file_path.endswith('.yml'):
-                return yaml.safe_load(file)
+        return json.loads(content)
+    except ValueError:
+        if source_path is not None and source_path.lower().endswith('.json'):
+            raise
+        return None
+
+def _cache_key(cache, content):
+    """
+    Retourne la clé d'un document YAML dans le cache d'analyse, ou None s'il n'y a pas de cache ou que le
+    document est trop petit pour y être conservé.
+    """
+    if cache is None or not cache.accepts(len(content)):
+        return None
+    return cache.key(content, 'yaml')
+
+def _parse_yaml(text, cache=None, key=None):
+    """
+    Analyse un texte YAML et construit l'index des positions à partir des mêmes nœuds. Avec une clé,
+    le dictionnaire et les positions sont relus depuis le cache d'analyse, ou y sont enregistrés.
+    """
+    if key is not None:
+        entry = cache.get(key)
+        if entry is not None:
+            swagger_dict, positions = entry
+            return swagger_dict, PositionIndex(positions)
+
+    # Importé au premier document YAML : une validation de fichiers JSON n'en a pas besoin.
+    import yaml
+    # L'analyseur libyaml (CSafeLoader) est 4 à 5 fois plus rapide que l'analyseur en Python pur ; les nœuds
+    # portent les mêmes positions.
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)(text)
+    try:
+        node = loader.get_single_node()
+        swagger_dict = loader.construct_document(node) if node is not None else None
+    finally:
+        loader.dispose()
+    positions = PositionIndex.from_yaml_node(node)
+    if key is not None and isinstance(swagger_dict, dict):
+        cache.put(key, (swagger_dict, positions.as_dict()))
+    return swagger_dict, positions
+
+def _document(swagger_dict, is_json, **kwargs):
+    """
+    Construit le `SpecDocument`. Le texte d'un JSON ayant déjà été analysé, ses positions sont calculées
+    à la demande, sans nouvelle validation.
+    """
+    if not isinstance(swagger_dict, dict):
+        raise ValueError("Unsupported file format. Please provide a .json or .yaml file.")
+    if is_json:
+        kwargs['position_source'] = JsonPositionIndex
+    return SpecDocument(swagger_dict, **kwargs)
+
+def load_swagger_document(file_path, cache=None):
+    """
+    Charge un fichier Swagger au format JSON ou YAML dans un `SpecDocument` partagé par les validateurs.
+
+    Le fichier n'est lu qu'une fois, par projection en mémoire au-delà de `MMAP_THRESHOLD`. Le format
+    est déterminé d'après le contenu et non d'après l'extension : un document qui commence par `{` ou `[`
+    mais n'est pas un JSON valide est analysé comme un YAML en style « flow », sauf dans un fichier
+    `.json`. Un JSON est analysé directement
+    depuis les octets lus : son texte et son index des positions ne sont calculés que si un validateur
+    en a besoin. Pour un YAML, l'index des positions est construit à partir des nœuds `yaml.compose`.
+
+    Avec un cache d'analyse, un YAML déjà analysé (même contenu) n'est pas réanalysé : le dictionnaire et
+    les positions sont relus depuis le cache. Un JSON n'est pas mis en cache, `json.loads` étant aussi
+    rapide que la relecture d'une entrée et ses positions étant calculées à la demande.
+
+    Args:
+        file_path (str): Chemin vers le fichier Swagger.
+        cache (ParseCache, optional): Cache d'analyse, indexé par l'empreinte du contenu.
+
+    Returns:
+        SpecDocument: Le document (contenu brut, dictionnaire, index JSON pointer -> (ligne, colonne)).
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < MMAP_THRESHOLD:
+                raw = file.read()
             else:
-                raise ValueError("Unsupported file format. Please provide a .json or .yaml file.")
+                raw = None
+                # Le texte est décodé directement depuis la projection, sans copie intermédiaire des octets.
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    encoding = 'utf-8-sig' if buffer[:3] == codecs.BOM_UTF8 else 'utf-8'
+                    is_json = _is_json(buffer, 3 if encoding == 'utf-8-sig' else 0)
+                    key = None if is_json else _cache_key(cache, buffer)
+                    text = str(buffer, encoding)
+    except Exception as e:
+        raise ValueError(f"Failed to load Swagger file: {str(e)}")
+    if raw is not None:
+        return parse_swagger_bytes(raw, file_path, cache)
+
+    try:
+        positions = None
+        if is_json:
+            swagger_dict = _loads_json(text, file_path)
+            if swagger_dict is None:
+                is_json = False
+                key = _cache_key(cache, text.encode(encoding)) if cache is not None else None
+        if not is_json:
+            swagger_dict, positions = _parse_yaml(text, cache, key)
+        return _document(swagger_dict, is_json, text=text, source_path=file_path,
+                         positions=positions, encoding=encoding)
+    except Exception as e:
+        raise ValueError(f"Failed to load Swagger file: {str(e)}")
+
+def parse_swagger_bytes(raw, source_path=None, cache=None):
+    """
+    Analyse le contenu d'un fichier Swagger (JSON ou YAML) déjà lu, par exemple reçu par le service de validation.
+
+    Args:
+        raw (bytes): Le contenu du fichier.
+        source_path (str, optional): Nom du fichier d'origine, conservé dans le document.
+        cache (ParseCache, optional): Cache d'analyse, comme pour `load_swagger_document`.
+
+    Returns:
+        SpecDocument: Le document, comme pour `load_swagger_document`.
+    """
+    try:
+        encoding = 'utf-8-sig' if raw.startswith(codecs.BOM_UTF8) else 'utf-8'
+        is_json = _is_json(raw, 3 if encoding == 'utf-8-sig' else 0)
+        positions = text = None
+        if is_json:
+            swagger_dict = _loads_json(raw, source_path)
+            is_json = swagger_dict is not None
+        if not is_json:
+            text = raw.decode(encoding)
+            swagger_dict, positions = _parse_yaml(text, cache, _cache_key(cache, raw))
+        return _document(swagger_dict, is_json, raw=raw, text=text, source_path=source_path,
+                         positions=positions, encoding=encoding)
     except Exception as e:
         raise ValueError(f"Failed to load Swagger file: {str(e)}")
@@ -0,0 +1,105 @@
+from src.utils.position_index import json_pointer
+
+
+class OpenAPIError:
+    """
+    Erreur de validation OpenAPI sous forme d'enregistrement.
+
+    Seuls le message court, le chemin dans le document et le mot-clé en échec sont conservés au
+    moment de la validation. Le rendu complet de jsonschema (instance et schéma en échec, parfois
+    très volumineux) n'est produit que sur demande par `details()`.
+
+    Attributes:
+        message (str): Message court de l'erreur, par exemple "5 is not of type 'string'".
+        path (tuple): Chemin de l'élément en erreur dans le document.
+        validator (str): Mot-clé du schéma en échec (`type`, `required`...).
+        line (int): Ligne de l'élément en erreur (ou de son plus proche parent indexé), ou None.
+    """
+
+    __slots__ = ('message', 'path', 'validator', 'line', '_error')
+
+    def __init__(self, message, path=(), validator=None, line=None, error=None):
+        """
+        Initialise l'enregistrement.
+
+        Args:
+            message (str): Message court de l'erreur.
+            path (tuple): Chemin de l'élément en erreur dans le document.
+            validator (str, optional): Mot-clé du schéma en échec.
+            line (int, optional): Ligne de l'élément en erreur.
+            error (jsonschema.ValidationError, optional): L'erreur d'origine, utilisée par `details()`.
+        """
+        self.message = message
+        self.path = tuple(path)
+        self.validator = validator
+        self.line = line
+        self._error = error
+
+    @classmethod
+    def from_validation_error(cls, error, positions):
+        """
+        Construit l'enregistrement d'une erreur jsonschema sans la convertir en texte.
+
+        Args:
+            error (jsonschema.ValidationError): L'erreur générée par le validateur.
+            positions (PositionIndex): Index des positions du document.
+
+        Returns:
+            OpenAPIError: L'enregistrement.
+        """
+        path = tuple(error.absolute_path)
+        line = None
+        # Une propriété manquante n'est pas dans le document : on remonte au plus proche parent indexé.
+        for depth in range(len(path), -1, -1):
+            line = positions.line(json_pointer(*path[:depth]), None)
+            if line is not None:
+                break
+        return cls(error.message, path, error.validator, line, error)
+
+    @property
+    def pointer(self):
+        """JSON pointer de l'élément en erreur."""
+        return json_pointer(*self.path)
+
+    def details(self):
+        """
+        Retourne le rendu complet de l'erreur (instance et schéma en échec), calculé à la demande.
+
+        Returns:
+            str: Le rendu détaillé, ou le message court si l'erreur d'origine n'est plus disponible.
+        """
+        return str(self._error) if self._error is not None else self.message
+
+    def render(self, detailed=False):
+        """
+        Met en forme l'erreur, précédée de sa ligne lorsqu'elle est connue.
+
+        Args:
+            detailed (bool): Utiliser le rendu complet (`details()`) au lieu du message court et de l'emplacement.
+
+        Returns:
+            str: Le message mis en forme.
+        """
+        if detailed:
+            text = self.details()
+        else:
+            text = f"{self.message} (emplacement : {self.pointer})" if self.path else self.message
+        if self.line is not None:
+            return f"Ligne {self.line}: {text}"
+        return f"Erreur: {text}"
+
+    def to_dict(self):
+        """
+        Retourne l'erreur sous forme structurée (utilisée par le service de validation).
+
+        Returns:
+            dict: `message`, `pointer`, `validator`, `line` et `text` (le message mis en forme par `render()`).
+        """
+        return {"message": self.message, "pointer": self.pointer, "validator": self.validator, "line": self.line,
+                "text": self.render()}
+
+    def __str__(self):
+        return self.render()
+
+    def __repr__(self):
+        return f"OpenAPIError({self.message!r}, path={self.path!r}, validator={self.validator!r}, line={self.line!r})"
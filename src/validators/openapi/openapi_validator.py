@@ -1,4 +1,9 @@
-from openapi_spec_validator import openapi_v2_spec_validator, openapi_v3_spec_validator
+from src.utils.instrumentation import timed_findings
+from src.utils.spec_document import SpecDocument
+from src.validators.openapi.openapi_error import OpenAPIError
+
+# Nombre d'erreurs affichées avec le rendu complet de jsonschema par `validate` ; les suivantes sont abrégées.
+MAX_DETAILED_ERRORS = 10
 
 class OpenAPIValidator:
     """
@@ -6,19 +11,62 @@ class OpenAPIValidator:
 
     Attributes:
         swagger_dict (dict): Le dictionnaire représentant le fichier Swagger/OpenAPI.
-        swagger_text (list): Liste des lignes du fichier Swagger/OpenAPI en texte brut.
+        document (SpecDocument): Le document partagé (texte brut, index des positions).
     """
 
-    def __init__(self, swagger_dict, swagger_text):
+    def __init__(self, swagger_dict, swagger_text, hooks=None):
         """
         Initialise l'objet OpenAPIValidator avec le dictionnaire Swagger et le texte brut.
 
         Args:
-            swagger_dict (dict): Le dictionnaire représentant le fichier Swagger/OpenAPI.
-            swagger_text (str): Le texte brut du fichier Swagger/OpenAPI.
+            swagger_dict (dict | SpecDocument): Le dictionnaire représentant le fichier Swagger/OpenAPI,
+                ou le `SpecDocument` partagé.
+            swagger_text (str): Le texte brut du fichier Swagger/OpenAPI (ignoré si `swagger_dict` est un `SpecDocument`).
+            hooks (ValidationHooks, optional): Points d'observation avertis du début et de la fin de la
+                validation (validateur "openapi") et de chaque erreur émise.
+        """
+        self.document = SpecDocument.wrap(swagger_dict, swagger_text)
+        self.swagger_dict = self.document.data
+        self.hooks = hooks
+
+    def iter_records(self):
+        """
+        Énumère les erreurs de validation du fichier Swagger/OpenAPI sous forme d'enregistrements.
+
+        Utilise le validateur préparé (méta-schéma compilé, références résolues) de la version OpenAPI
+        du document (3.0 ou 3.1), partagé par toutes les validations du processus.
+
+        Raises:
+            Exception: Si la version du document n'est pas supportée ou pas spécifiée.
+
+        Yields:
+            OpenAPIError: Une erreur (message court, chemin, mot-clé en échec et ligne).
+        """
+        if 'openapi' not in self.swagger_dict:
+            if 'swagger' in self.swagger_dict:
+                raise Exception("La norme swagger n'est supportée, merci d'utiliser la norme OpenAPI")
+            raise Exception("Version OpenAPI non spécifiée.")
+
+        # openapi_spec_validator (jsonschema, referencing...) n'est importé qu'à la première validation OpenAPI.
+        from src.validators.openapi.spec_validator_cache import iter_spec_errors
+
+        records = map(self._build_record, iter_spec_errors(self.swagger_dict))
+        if self.hooks is not None:
+            records = timed_findings(self.hooks, "openapi", records)
+        yield from records
+
+    def iter_errors(self):
+        """
+        Énumère les erreurs de validation du fichier Swagger/OpenAPI.
+
+        Raises:
+            Exception: Si la version du document n'est pas supportée ou pas spécifiée.
+
+        Yields:
+            str: Un message d'erreur, précédé de la ligne concernée lorsqu'elle est connue.
         """
-        self.swagger_dict = swagger_dict
-        self.swagger_text = swagger_text.splitlines()
+        for record in self.iter_records():
+            yield str(record)
 
     def validate(self):
         """
@@ -26,23 +74,14 @@ class OpenAPIValidator:
 
         Utilise le validateur approprié en fonction de la version de Swagger/OpenAPI.
 
+        Les `MAX_DETAILED_ERRORS` premières erreurs sont détaillées (instance et schéma en échec), les
+        suivantes sont limitées à leur message et à leur emplacement.
+
         Returns:
             tuple: Un booléen indiquant si la validation a réussi, et un message d'erreur ou de succès.
         """
-        errors = []
         try:
-            if 'openapi' in self.swagger_dict:
-                validator = openapi_v3_spec_validator
-            elif 'swagger' in self.swagger_dict:
-                validator = openapi_v2_spec_validator
-                raise Exception("La norme swagger n'est supportée, merci d'utiliser la norme OpenAPI")
-            else:
-                raise Exception("Version OpenAPI non spécifiée.")
-
-            # Itérer sur les erreurs de validation
-            for error in validator.iter_errors(self.swagger_dict):
-                error_message = self._extract_error_line(str(error))
-                errors.append(error_message)
+            errors = [record.render(detailed=index < MAX_DETAILED_ERRORS) for index, record in enumerate(self.iter_records())]
 
             if errors:
                 return False, "\n".join(errors)
@@ -51,17 +90,17 @@ class OpenAPIValidator:
         except Exception as e:
             return False, f"Erreur lors de la validation OpenAPI: {str(e)}"
 
-    def _extract_error_line(self, error_message):
+    def _build_record(self, error):
         """
-        Extrait la ligne du fichier Swagger correspondant à l'erreur.
+        Convertit une erreur jsonschema en enregistrement, sans produire son rendu complet.
+
+        La ligne est obtenue à partir du chemin de l'erreur dans le document (`absolute_path`)
+        via l'index des positions.
 
         Args:
-            error_message (str): Le message d'erreur généré par le validateur.
+            error (jsonschema.ValidationError): L'erreur générée par le validateur.
 
         Returns:
-            str: Une chaîne indiquant la ligne de l'erreur ou un message d'erreur.
+            OpenAPIError: L'enregistrement de l'erreur.
         """
-        for index, line in enumerate(self.swagger_text, start=1):
-            if error_message.split(":")[0] in line:
-                return f"Ligne {index}: {error_message}"
-        return f"Erreur: {error_message}"
+        return OpenAPIError.from_validation_error(error, self.document.positions)
@@ -0,0 +1,92 @@
+import threading
+
+from jsonschema.validators import Draft4Validator, Draft202012Validator
+from openapi_spec_validator.schemas import schema_v30, schema_v31
+from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
+from openapi_spec_validator.validation.validators import OpenAPIV30SpecValidator, OpenAPIV31SpecValidator
+from referencing import Registry
+from referencing.jsonschema import DRAFT4, DRAFT202012
+
+# Version OpenAPI -> (validateur de la spécification, méta-schéma, validateur jsonschema, spécification jsonschema)
+_VERSIONS = {
+    "3.0": (OpenAPIV30SpecValidator, schema_v30, Draft4Validator, DRAFT4),
+    "3.1": (OpenAPIV31SpecValidator, schema_v31, Draft202012Validator, DRAFT202012),
+}
+
+# Validateurs déjà préparés, partagés par toutes les validations du processus.
+_warm_validators = {}
+_lock = threading.Lock()
+
+def openapi_version(swagger_dict):
+    """
+    Retourne la version OpenAPI (majeure.mineure) utilisée pour choisir le méta-schéma.
+
+    Args:
+        swagger_dict (dict): Le dictionnaire représentant le fichier OpenAPI.
+
+    Returns:
+        str: "3.0" pour un document 3.0.x, "3.1" sinon.
+    """
+    version = str(swagger_dict.get('openapi', ''))
+    return "3.0" if version.startswith("3.0") else "3.1"
+
+def _build_spec_validator_class(version):
+    """
+    Construit la classe de validation d'une version OpenAPI avec un méta-schéma compilé une seule fois.
+
+    Le registre des références du méta-schéma est parcouru dès la construction : les `$ref`,
+    ancres et `$dynamicRef` du méta-schéma sont ensuite résolus sans nouveau parcours.
+    """
+    base_class, schema, schema_validator_class, specification = _VERSIONS[version]
+    contents = dict(schema)
+    resource = specification.create_resource(contents)
+    registry = Registry().with_resource(contents.get('$id', ''), resource).crawl()
+    schema_validator = schema_validator_class(contents, registry=registry)
+
+    class WarmSpecValidator(base_class):
+        """
+        Validateur de la spécification réutilisant le méta-schéma préparé.
+
+        Contrairement à la classe d'origine, les erreurs ne sont pas mémorisées par instance (cache
+        global qui conservait chaque document validé jusqu'à la fin du processus).
+        """
+
+        def iter_errors(self):
+            for error in self.schema_validator.iter_errors(self.schema):
+                yield OpenAPIValidationError.create_from(error)
+            for error in self.root_validator(self.schema_path):
+                yield error if isinstance(error, OpenAPIValidationError) else OpenAPIValidationError.create_from(error)
+
+    WarmSpecValidator.schema_validator = schema_validator
+    WarmSpecValidator.__name__ = f"Warm{base_class.__name__}"
+    return WarmSpecValidator
+
+def get_spec_validator_class(version):
+    """
+    Retourne la classe de validation préparée pour une version OpenAPI, construite au premier appel.
+
+    Args:
+        version (str): "3.0" ou "3.1".
+
+    Returns:
+        type: Une sous-classe de `SpecValidator` d'openapi_spec_validator.
+    """
+    validator_class = _warm_validators.get(version)
+    if validator_class is None:
+        with _lock:
+            validator_class = _warm_validators.get(version)
+            if validator_class is None:
+                validator_class = _warm_validators[version] = _build_spec_validator_class(version)
+    return validator_class
+
+def iter_spec_errors(swagger_dict):
+    """
+    Énumère les erreurs de validation d'un document OpenAPI 3.x avec le validateur préparé de sa version.
+
+    Args:
+        swagger_dict (dict): Le dictionnaire représentant le fichier OpenAPI.
+
+    Yields:
+        jsonschema.ValidationError: Les erreurs trouvées.
+    """
+    yield from get_spec_validator_class(openapi_version(swagger_dict))(swagger_dict).iter_errors()
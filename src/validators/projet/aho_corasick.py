@@ -0,0 +1,60 @@
+class AhoCorasick:
+    """
+    Automate d'Aho-Corasick : trouve en un seul parcours d'un texte toutes les occurrences d'un ensemble
+    de motifs, quel que soit leur nombre.
+
+    L'automate est construit une fois (arbre des motifs complété par les liens d'échec) puis n'est plus
+    modifié : il peut être partagé entre threads et transmis aux processus de travail.
+    """
+
+    __slots__ = ('_goto', '_fail', '_output')
+
+    def __init__(self, patterns):
+        """
+        :param patterns: Liste des motifs (chaînes non vides). Un motif est désigné par sa position dans la liste.
+        """
+        goto = [{}]
+        output = [()]
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = goto[state][char] = len(goto)
+                    goto.append({})
+                    output.append(())
+                state = next_state
+            output[state] += ((pattern_id, len(pattern)),)
+
+        # Parcours en largeur : le lien d'échec d'un état est le plus long suffixe propre de son préfixe
+        # qui soit aussi un préfixe de motif ; ses sorties sont ajoutées à celles de l'état.
+        fail = [0] * len(goto)
+        pending = list(goto[0].values())
+        for state in pending:
+            for char, next_state in goto[state].items():
+                pending.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state] += output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def iter_matches(self, text):
+        """
+        Énumère les occurrences des motifs dans un texte.
+
+        :param text: Le texte parcouru.
+        :return: Un générateur de tuples (identifiant du motif, position de début, position de fin exclue).
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id, length in output[state]:
+                yield pattern_id, end - length, end
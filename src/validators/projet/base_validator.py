@@ -1,3 +1,6 @@
+from src.utils.position_index import json_pointer
+from src.utils.spec_document import SpecDocument
+
 class BaseValidator:
     """
     Classe de base pour les validateurs spécifiques. Contient des utilitaires communs utilisés par les validateurs.
@@ -7,20 +10,26 @@ class BaseValidator:
         """
         Initialise le validateur de base avec le dictionnaire Swagger et le texte Swagger.
         
-        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger.
-        :param swagger_text: Chaîne de caractères contenant le texte brut du fichier Swagger.
+        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger, ou `SpecDocument` partagé.
+        :param swagger_text: Chaîne de caractères contenant le texte brut du fichier Swagger (ignorée si `swagger_dict` est un `SpecDocument`).
         """
-        self.swagger_dict = swagger_dict
-        self.swagger_text = swagger_text.splitlines()
+        self.document = SpecDocument.wrap(swagger_dict, swagger_text)
+        self.swagger_dict = self.document.data
 
-    def _find_line_number(self, keyword):
+    def _find_line_number(self, *tokens):
         """
-        Recherche un mot-clé spécifique dans le texte brut du Swagger et retourne le numéro de la ligne où il apparaît.
+        Retourne le numéro de la ligne de l'élément désigné par une suite de clés du document Swagger.
         
-        :param keyword: Mot-clé à rechercher dans le texte du Swagger.
-        :return: Le numéro de la ligne où le mot-clé a été trouvé, ou "inconnue" s'il n'a pas été trouvé.
+        :param tokens: Clés et index menant à l'élément, par exemple ('paths', '/pet', 'get').
+        :return: Le numéro de la ligne de l'élément, ou "inconnue" s'il n'est pas indexé.
+        """
+        return self.document.positions.line(json_pointer(*tokens))
+
+    def _render(self, findings):
+        """
+        Met en forme des constats (`Finding`) en messages d'erreur.
+
+        :param findings: Itérable de constats.
+        :return: La liste des messages.
         """
-        for index, line in enumerate(self.swagger_text, start=1):
-            if keyword in line:
-                return index
-        return "inconnue"
+        return [finding.render(self.document) for finding in findings]
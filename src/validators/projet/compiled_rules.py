@@ -0,0 +1,284 @@
+import html
+
+from src.utils.fingerprint import fingerprint
+
+from .aho_corasick import AhoCorasick
+
+
+# Formes d'un mot réservé, selon ses jokers : 'admin' (segment ou nom exact), 'admin*' (préfixe),
+# '*admin' (suffixe) et '*admin*' (n'importe où dans le segment ou le nom, par exemple 'adminTools').
+_EXACT, _PREFIX, _SUFFIX, _SUBSTRING = 'exact', 'prefix', 'suffix', 'substring'
+
+def _parse_word(word):
+    """
+    Retourne la forme d'un mot réservé et le texte à rechercher.
+
+    :param word: Le mot tel qu'écrit dans le fichier de règles.
+    :return: Un tuple (forme, texte recherché).
+    """
+    core = word.strip('*')
+    if not core or '*' in core:
+        return _EXACT, word
+    starts, ends = word.startswith('*'), word.endswith('*')
+    if starts and ends:
+        return _SUBSTRING, core
+    if ends:
+        return _PREFIX, core
+    if starts:
+        return _SUFFIX, core
+    return _EXACT, word
+
+
+class ReservedWords:
+    """
+    Liste de mots réservés compilée une seule fois pour des recherches indépendantes de sa taille.
+
+    Les mots exacts sont indexés dans des dictionnaires ; les mots avec jokers (préfixe, suffixe ou
+    sous-chaîne, voir `_parse_word`) sont réunis dans un automate d'Aho-Corasick. Chaque segment de chemin
+    ou nom n'est ainsi parcouru qu'une fois, qu'il y ait dix ou dix mille mots réservés.
+
+    L'ordre de la liste d'origine est conservé : les mots trouvés sont toujours retournés dans cet ordre,
+    comme le faisait le parcours linéaire de la liste.
+    """
+
+    __slots__ = ('words', '_exact', '_by_lower', '_patterns', '_automaton', '_lower_automaton')
+
+    def __init__(self, words=()):
+        """
+        :param words: Liste des mots réservés, telle qu'écrite dans le fichier de règles.
+        """
+        self.words = tuple(words)
+        exact, by_lower, patterns = {}, {}, []
+        for position, word in enumerate(self.words):
+            kind, core = _parse_word(word)
+            if kind is _EXACT:
+                exact.setdefault(word, []).append(position)
+                by_lower.setdefault(word.lower(), []).append(position)
+            else:
+                patterns.append((position, kind, core))
+        self._exact = {key: tuple(value) for key, value in exact.items()}
+        self._by_lower = {key: tuple(value) for key, value in by_lower.items()}
+        self._patterns = tuple((position, kind) for position, kind, _ in patterns)
+        if patterns:
+            # Les chemins sont comparés avec la casse, les noms (en-têtes, paramètres) sans.
+            self._automaton = AhoCorasick([core for _, _, core in patterns])
+            self._lower_automaton = AhoCorasick([core.lower() for _, _, core in patterns])
+        else:
+            self._automaton = self._lower_automaton = None
+
+    @classmethod
+    def coerce(cls, words):
+        """
+        Retourne `words` s'il est déjà préparé, sinon le prépare.
+
+        :param words: Une liste de mots ou un `ReservedWords`.
+        :return: Le `ReservedWords` correspondant.
+        """
+        if isinstance(words, cls):
+            return words
+        return cls(words or ())
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __len__(self):
+        return len(self.words)
+
+    def match_name(self, name):
+        """
+        Retourne les mots réservés correspondant à un nom, sans tenir compte de la casse.
+
+        :param name: Le nom à tester (en-tête, paramètre...).
+        :return: Un tuple des mots réservés correspondants, vide si le nom est autorisé.
+        """
+        if not isinstance(name, str):
+            return ()
+        name = name.lower()
+        if self._lower_automaton is None:
+            positions = self._by_lower.get(name, ())
+            return tuple(self.words[position] for position in positions)
+        found = set()
+        self._collect(name, self._by_lower, self._lower_automaton, found)
+        return self._ordered(found)
+
+    def match_segments(self, path):
+        """
+        Retourne les mots réservés correspondant à un segment d'un chemin (avec la casse).
+
+        :param path: Le chemin d'API, par exemple '/api/admin/users'.
+        :return: Un tuple des mots réservés trouvés, vide si le chemin est autorisé.
+        """
+        found = set()
+        for segment in path.split('/'):
+            if segment:
+                self._collect(segment, self._exact, self._automaton, found)
+        return self._ordered(found)
+
+    def _collect(self, text, exact, automaton, found):
+        """
+        Ajoute à `found` la position des mots réservés correspondant à un segment ou à un nom.
+
+        :param text: Le segment ou le nom (déjà en minuscules pour une comparaison sans casse).
+        :param exact: Index des mots exacts à utiliser.
+        :param automaton: Automate des mots avec jokers à utiliser, ou None.
+        :param found: Ensemble des positions trouvées, complété sur place.
+        """
+        found.update(exact.get(text, ()))
+        if automaton is None:
+            return
+        length = len(text)
+        for pattern_id, start, end in automaton.iter_matches(text):
+            position, kind = self._patterns[pattern_id]
+            if kind is _SUBSTRING or (kind is _PREFIX and start == 0) or (kind is _SUFFIX and end == length):
+                found.add(position)
+
+    def _ordered(self, found):
+        return tuple(self.words[position] for position in sorted(found))
+
+
+class ParameterRule:
+    """
+    Règle attendue pour un en-tête ou un paramètre de requête, avec ses valeurs déjà normalisées.
+    """
+
+    __slots__ = ('name', 'key', 'rule', 'type', 'required', 'description', 'expected_description',
+                 'example', 'format', 'definition')
+
+    def __init__(self, rule, example_key):
+        """
+        :param rule: Le dictionnaire de la règle dans le fichier de règles.
+        :param example_key: Clé de l'exemple attendu ('x-example' pour les en-têtes, 'value' pour les paramètres).
+        """
+        self.rule = rule
+        self.name = rule["name"]
+        self.key = self.name.lower()
+        self.type = rule.get("type")
+        self.required = rule.get("required")
+        self.description = rule.get("description")
+        # Normaliser une seule fois la description attendue (espaces et entités HTML)
+        self.expected_description = html.unescape((self.description or "").strip())
+        self.example = rule.get(example_key)
+        self.format = rule.get("format")
+
+        lines = [
+            f"  - name: '{self.name}'\n",
+            f"    type: '{self.type}'\n",
+            f"    required: {self.required}\n",
+            f"    description: '{self.description}'\n",
+            f"    example: '{self.example}'\n",
+        ]
+        if example_key == 'value':
+            lines.append(f"    format: '{self.format}'\n")
+        self.definition = ''.join(lines)
+
+
+class ExpectedSchema:
+    """
+    Schéma de réponse attendu, préparé pour une comparaison récursive.
+
+    Les branches `allOf` sont fusionnées au schéma, chaque sous-schéma (propriétés, `items`) est lui-même
+    préparé et l'empreinte de chacun est calculée une fois : deux formats identiques (par exemple
+    l'enveloppe d'erreur commune aux codes 400 à 404) ont la même empreinte et partagent donc leurs
+    comparaisons.
+    """
+
+    __slots__ = ('source', 'type', 'properties', 'required', 'items', 'structured', 'fingerprint')
+
+    def __init__(self, schema):
+        """
+        :param schema: Le dictionnaire du schéma dans le fichier de règles.
+        """
+        schema = schema if isinstance(schema, dict) else {}
+        self.source = schema
+        schema_type, properties, required, items = None, {}, [], None
+        pending = [schema]
+        while pending:
+            part = pending.pop(0)
+            schema_type = schema_type or part.get("type")
+            for name, child in (part.get("properties") or {}).items():
+                properties.setdefault(name, child)
+            required.extend(name for name in part.get("required") or () if name not in required)
+            items = items or part.get("items")
+            pending.extend(branch for branch in part.get("allOf") or () if isinstance(branch, dict))
+        self.type = schema_type
+        self.properties = tuple((name, ExpectedSchema(child)) for name, child in properties.items())
+        self.required = tuple(required)
+        self.items = ExpectedSchema(items) if items else None
+        # Un sous-schéma sans structure ne demande qu'une comparaison de type
+        self.structured = bool(self.properties or self.required or self.items)
+        self.fingerprint = fingerprint(schema)
+
+
+class MethodRules:
+    """
+    Règles d'une méthode HTTP : en-têtes et paramètres de requête attendus (dans l'ordre du fichier
+    et indexés par nom en minuscules) et réponses attendues (code, format tel qu'écrit, `ExpectedSchema`).
+    """
+
+    __slots__ = ('headers', 'headers_by_name', 'query_parameters', 'query_parameters_by_name', 'responses')
+
+    def __init__(self, method_rules):
+        """
+        :param method_rules: Le dictionnaire des règles de la méthode dans le fichier de règles.
+        """
+        self.headers = tuple(ParameterRule(rule, 'x-example') for rule in method_rules.get("headers", []))
+        self.query_parameters = tuple(ParameterRule(rule, 'value') for rule in method_rules.get("query_parameters", []))
+        self.headers_by_name = {}
+        for rule in self.headers:
+            self.headers_by_name.setdefault(rule.key, rule)
+        self.query_parameters_by_name = {}
+        for rule in self.query_parameters:
+            self.query_parameters_by_name.setdefault(rule.key, rule)
+        self.responses = tuple(
+            (str(response["response_code"]), response["format"], ExpectedSchema(response["format"]))
+            for response in method_rules.get("responses", [])
+        )
+
+
+class CompiledRules:
+    """
+    Règles du projet (`projet_validation_rules.json`) préparées une seule fois pour tous les validateurs.
+
+    Les règles de chaque méthode HTTP sont indexées par nom en minuscules, les mots réservés sont des
+    ensembles figés et les descriptions attendues sont déjà normalisées. Les validateurs n'ont donc plus
+    à parcourir ni à normaliser les règles pour chaque opération.
+    """
+
+    __slots__ = ('source', 'methods', 'reserved_paths', 'reserved_headers', 'reserved_query_parameters',
+                 'special_characters')
+
+    def __init__(self, rules):
+        """
+        :param rules: Le dictionnaire des règles tel que chargé depuis le fichier JSON.
+        """
+        self.source = rules
+        self.reserved_paths = ReservedWords(rules.get("reserved_paths", []))
+        self.reserved_headers = ReservedWords(rules.get("reserved_headers", []))
+        self.reserved_query_parameters = ReservedWords(rules.get("reserved_query_parameters", []))
+        self.special_characters = tuple(rules.get("special_characters", []))
+        self.methods = {
+            method: MethodRules(method_rules)
+            for method, method_rules in rules.items()
+            if isinstance(method_rules, dict)
+        }
+
+    @classmethod
+    def coerce(cls, rules):
+        """
+        Retourne `rules` s'il est déjà compilé, sinon le compile.
+
+        :param rules: Le dictionnaire des règles ou un `CompiledRules`.
+        :return: Le `CompiledRules` correspondant.
+        """
+        if isinstance(rules, cls):
+            return rules
+        return cls(rules)
+
+    def for_method(self, method_upper):
+        """
+        Retourne les règles d'une méthode HTTP.
+
+        :param method_upper: La méthode en majuscules, par exemple 'GET'.
+        :return: Le `MethodRules` de la méthode, ou None si aucune règle ne la concerne.
+        """
+        return self.methods.get(method_upper)
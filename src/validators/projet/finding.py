@@ -0,0 +1,157 @@
+ERROR = "error"
+
+_HEADER_RULE = "Le header '{name}' dans {method} {path} devrait être :\n{definition}"
+_QUERY_PARAM_RULE = "Le paramètre '{name}' dans {method} {path} devrait être :\n{definition}"
+_RESPONSE_RULE = "Le schéma de la réponse pour le code '{code}' dans {method} {path} devrait être :\n{schema}\n"
+
+# Identifiant de règle -> modèle du message. Les champs disponibles sont `method` et `path` (opération),
+# `name` (sujet), `expected`, `actual`, `line` (ligne du pointer) et les détails propres au constat.
+MESSAGES = {
+    "info.title": "Le Swagger ne contient pas de titre dans la section 'info'.",
+    "info.version": "La version du Swagger doit commencer par 'v' suivi d'un chiffre.",
+    "info.description": "Le Swagger contient une description vide ou absente dans la section 'info'.",
+    "info.basepath": "Le `basePath` est incorrect : attendu '{expected}', trouvé '{actual}'.",
+
+    "reserved.path": "Le chemin '{name}' contient un mot réservé '{actual}' (ligne {line})",
+    "reserved.header": "Header '{name}' contient un mot réservé '{actual}' (ligne {line})",
+    "reserved.query_parameter": "Paramètre de requête '{name}' contient un mot réservé '{actual}' (ligne {line}) dans {method} {path}",
+
+    "header.missing": "Header '{name}' est manquant dans {method} {path}. Il devrait être comme suit :\n{definition}",
+    "header.type": "Le type du header '{name}' dans {method} {path} est '{actual}', "
+                   "mais il devrait être '{expected}'.\n" + _HEADER_RULE,
+    "header.example": "L'exemple du header '{name}' dans {method} {path} est '{actual}', "
+                      "mais il devrait être '{expected}'.\n" + _HEADER_RULE,
+    "header.description": "La description du header '{name}' dans {method} {path} est '{actual}', "
+                          "mais il devrait être '{expected}'.\n" + _HEADER_RULE,
+
+    "query_parameter.missing": "Paramètre de requête '{name}' est manquant dans {method} {path}. Il devrait être comme suit :\n{definition}",
+    "query_parameter.type": "Le type du paramètre '{name}' dans {method} {path} est '{actual}', "
+                            "mais il devrait être '{expected}'.\n" + _QUERY_PARAM_RULE,
+    "query_parameter.format": "Le format du paramètre '{name}' dans {method} {path} est '{actual}', "
+                              "mais il devrait être '{expected}'.\n" + _QUERY_PARAM_RULE,
+    "query_parameter.example": "L'exemple du paramètre '{name}' dans {method} {path} est '{actual}', "
+                               "mais il devrait être '{expected}'.\n" + _QUERY_PARAM_RULE,
+    "query_parameter.description": "La description du paramètre '{name}' dans {method} {path} est '{actual}', "
+                                   "mais il devrait être '{expected}'.\n" + _QUERY_PARAM_RULE,
+    "query_parameter.required": "Le paramètre '{name}' dans {method} {path} est '{actual}', "
+                                "mais il devrait être '{expected}'.\n" + _QUERY_PARAM_RULE,
+
+    "response.missing": "La réponse pour le code '{code}' est manquante dans {method} {path}.",
+    "response.type": "Le type de la réponse pour le code '{code}' dans {method} {path} est '{actual}', "
+                     "mais il devrait être '{expected}'.\n" + _RESPONSE_RULE,
+    "response.property_missing": "Le champ '{name}' est manquant dans la réponse pour le code '{code}' dans {method} {path}.\n" + _RESPONSE_RULE,
+    "response.property_type": "Le type du champ '{name}' dans la réponse pour le code '{code}' dans {method} {path} est '{actual}', "
+                              "mais il devrait être '{expected}'.\n" + _RESPONSE_RULE,
+    "response.property_required": "Le champ '{name}' devrait être obligatoire (`required`) dans la réponse pour le code '{code}' "
+                                  "dans {method} {path}.\n" + _RESPONSE_RULE,
+
+    "special_character": "La valeur '{actual}' sous le chemin '{name}' contient des caractères spéciaux non autorisés.",
+}
+
+# Modèles des écarts de schéma d'une réponse dont le type de contenu (`media_type`) est connu : les écarts
+# de plusieurs types de contenu d'une même réponse sont ainsi distingués.
+_RESPONSE_CODE = "la réponse pour le code '{code}'"
+MEDIA_TYPE_MESSAGES = {
+    rule_id: template.replace(_RESPONSE_CODE, _RESPONSE_CODE + " (type de contenu '{media_type}')", 1)
+    for rule_id, template in MESSAGES.items()
+    if rule_id.startswith("response.") and rule_id != "response.missing"
+}
+
+# Règles dont le message contient un numéro de ligne, résolu à partir du pointer au moment du rendu.
+_LINE_RULES = frozenset(rule_id for rule_id, template in MESSAGES.items() if "{line}" in template)
+
+
+class Finding:
+    """
+    Constat d'une règle du projet, sous forme compacte.
+
+    Le texte n'est produit que par `render()`, au moment où un consommateur en a besoin : les
+    validateurs ne construisent plus de messages (ni de blocs de règle ou de schéma) pour chaque
+    erreur. Les valeurs volumineuses (définition de la règle, schéma attendu) sont partagées par
+    référence avec les règles compilées.
+
+    Attributes:
+        rule_id (str): Identifiant de la règle, clé de `MESSAGES` (par exemple 'header.missing').
+        severity (str): Gravité du constat.
+        pointer (str): JSON pointer de l'élément concerné.
+        operation (tuple): (méthode en majuscules, chemin) de l'opération concernée, ou None.
+        subject: Nom de l'élément concerné (header, paramètre, champ, chemin...).
+        expected: Valeur attendue.
+        actual: Valeur trouvée.
+        details (dict): Champs complémentaires du message (code de réponse, définition de la règle...).
+    """
+
+    __slots__ = ('rule_id', 'severity', 'pointer', 'operation', 'subject', 'expected', 'actual', 'details')
+
+    def __init__(self, rule_id, pointer="", operation=None, subject=None, expected=None, actual=None,
+                 details=None, severity=ERROR):
+        self.rule_id = rule_id
+        self.severity = severity
+        self.pointer = pointer
+        self.operation = operation
+        self.subject = subject
+        self.expected = expected
+        self.actual = actual
+        self.details = details
+
+    def render(self, document=None):
+        """
+        Met en forme le message du constat.
+
+        :param document: (optionnel) Le `SpecDocument` validé, pour les messages indiquant une ligne ; son
+                         index des positions n'est consulté (et donc construit) que pour ces messages.
+        :return: Le message en français.
+        """
+        fields = {'name': self.subject, 'expected': self.expected, 'actual': self.actual}
+        if self.operation is not None:
+            fields['method'], fields['path'] = self.operation
+        if self.details:
+            fields.update(self.details)
+        if self.rule_id in _LINE_RULES:
+            fields['line'] = document.positions.line(self.pointer) if document is not None else "inconnue"
+        template = MEDIA_TYPE_MESSAGES.get(self.rule_id) if fields.get('media_type') else None
+        return (template or MESSAGES[self.rule_id]).format(**fields)
+
+    def __str__(self):
+        return self.render()
+
+    def __repr__(self):
+        return f"Finding({self.rule_id!r}, pointer={self.pointer!r}, subject={self.subject!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Finding):
+            return NotImplemented
+        return self.to_list() == other.to_list()
+
+    __hash__ = None
+
+    def to_dict(self, document=None):
+        """
+        Retourne le constat sous forme structurée, avec son message (utilisée par le service de validation).
+
+        :param document: (optionnel) Le `SpecDocument` validé, voir `render`.
+        :return: Un dictionnaire (`rule_id`, `severity`, `pointer`, `message`).
+        """
+        return {"rule_id": self.rule_id, "severity": self.severity, "pointer": self.pointer,
+                "message": self.render(document)}
+
+    def to_list(self):
+        """
+        Retourne le constat sous une forme sérialisable en JSON (utilisée par `IncrementalCache`).
+
+        :return: La liste des champs du constat.
+        """
+        operation = list(self.operation) if self.operation is not None else None
+        return [self.rule_id, self.severity, self.pointer, operation, self.subject, self.expected, self.actual, self.details]
+
+    @classmethod
+    def from_list(cls, values):
+        """
+        Reconstruit un constat à partir de `to_list()`.
+
+        :param values: La liste des champs du constat.
+        :return: Le `Finding`.
+        """
+        rule_id, severity, pointer, operation, subject, expected, actual, details = values
+        return cls(rule_id, pointer, tuple(operation) if operation is not None else None, subject, expected, actual,
+                   details, severity)
@@ -1,56 +1,44 @@
 import html
 from ..base_validator import BaseValidator
+from ..compiled_rules import CompiledRules
+from ..finding import Finding
+from ..operation_walker import OperationVisitor, OperationWalker
+
+class HeaderValidator(BaseValidator, OperationVisitor):
+    cacheable = True
 
-class HeaderValidator(BaseValidator):
     def __init__(self, swagger_dict, swagger_text, rules):
         super().__init__(swagger_dict, swagger_text)
-        self.rules = rules
+        self.rules = CompiledRules.coerce(rules)
 
     def validate_headers(self):
-        errors = []
-        paths = self.swagger_dict.get('paths', {})
-
-        for path, path_data in paths.items():
-            for method, method_data in path_data.items():
-                method_upper = method.upper()
-                if method_upper in self.rules:
-                    for rule in self.rules[method_upper].get("headers", []):
-                        header_name = rule["name"]
-                        parameter = self._find_header(header_name, method_data.get('parameters', []))
-                        if parameter:
-                            errors.extend(self._validate_header(parameter, rule, method, path))
-                        else:
-                            errors.append(
-                                f"Header '{header_name}' est manquant dans {method_upper} {path}. "
-                                f"Il devrait être comme suit :\n"
-                                f"  - name: '{header_name}'\n"
-                                f"    type: '{rule.get('type')}'\n"
-                                f"    required: {rule.get('required')}\n"
-                                f"    description: '{rule.get('description')}'\n"
-                                f"    example: '{rule.get('x-example')}'\n"
-                            )
-        return errors
-
-    def _find_header(self, header_name, parameters):
-        for param in parameters:
-            if param.get("in") == "header" and param.get("name").lower() == header_name.lower():
-                return param
-        return None
-
-    def _validate_header(self, parameter, rule, method, path):
-        errors = []
-        header_name = rule["name"]
-        schema = parameter.get("schema", {})
-
-        def format_rule():
-            return (
-                f"Le header '{header_name}' dans {method.upper()} {path} devrait être :\n"
-                f"  - name: '{header_name}'\n"
-                f"    type: '{rule.get('type')}'\n"
-                f"    required: {rule.get('required')}\n"
-                f"    description: '{rule.get('description')}'\n"
-                f"    example: '{rule.get('x-example')}'\n"
-            )
+        return self._render(OperationWalker([self]).walk(self.swagger_dict))
+
+    def visit_operation(self, operation):
+        method_rules = self.rules.for_method(operation.method_upper)
+        if method_rules is None:
+            return
+        for rule in method_rules.headers:
+            entry = operation.find_parameter("header", rule.key)
+            if entry is not None and entry.parameter:
+                yield from self._validate_header(entry, rule, operation)
+            else:
+                yield Finding("header.missing", operation.parameters_pointer(), operation.key, rule.name,
+                              details={"definition": rule.definition})
+
+    def _validate_header(self, entry, rule, operation):
+        parameter = entry.parameter
+        pointer = entry.pointer(operation.resolver)
+        details = {"definition": rule.definition}
+        # Un même paramètre (par exemple un composant référencé) n'est comparé qu'une fois par parcours
+        mismatches = operation.resolver.memoize(
+            ("header", id(parameter), id(rule)),
+            lambda: tuple(self._compare_header(parameter, rule, operation)))
+        for rule_id, expected, actual in mismatches:
+            yield Finding(rule_id, pointer, operation.key, rule.name, expected, actual, details)
+
+    def _compare_header(self, parameter, rule, operation):
+        schema = operation.resolve(parameter.get("schema", {}))
 
         example = schema.get("example")
         if example is None:
@@ -58,24 +46,13 @@ class HeaderValidator(BaseValidator):
 
         # Normaliser les descriptions pour ignorer les différences d'espaces ou de retours à la ligne
         actual_description = html.unescape(parameter.get("description", "").strip())
-        expected_description = html.unescape(rule.get("description", "").strip())
+        expected_description = rule.expected_description
 
-        if rule.get("type") and schema.get("type") != rule["type"]:
-            errors.append(
-                f"Le type du header '{header_name}' dans {method.upper()} {path} est '{schema.get('type')}', "
-                f"mais il devrait être '{rule['type']}'.\n{format_rule()}"
-            )
+        if rule.type and schema.get("type") != rule.type:
+            yield "header.type", rule.type, schema.get("type")
 
-        if rule.get("x-example") and example != rule["x-example"]:
-            errors.append(
-                f"L'exemple du header '{header_name}' dans {method.upper()} {path} est '{example}', "
-                f"mais il devrait être '{rule['x-example']}'.\n{format_rule()}"
-            )
+        if rule.example and example != rule.example:
+            yield "header.example", rule.example, example
 
         if expected_description and actual_description != expected_description:
-            errors.append(
-                f"La description du header '{header_name}' dans {method.upper()} {path} est '{actual_description}', "
-                f"mais il devrait être '{expected_description}'.\n{format_rule()}"
-            )
-
-        return errors
+            yield "header.description", expected_description, actual_description
@@ -0,0 +1,144 @@
+import json
+import os
+
+from src.utils.fingerprint import fingerprint
+
+from .finding import Finding
+from .operation_walker import OperationWalker
+
+CACHE_FORMAT_VERSION = 4
+
+
+class IncrementalCache:
+    """
+    Cache persistant des résultats des règles du projet, indexé par l'empreinte (JSON canonique) de chaque
+    chemin et de chaque opération, ainsi que des composants qu'ils référencent.
+
+    Lors d'une nouvelle validation, seuls les chemins et opérations dont le contenu a changé sont réévalués
+    par les visiteurs `cacheable` ; les constats (`Finding`) des autres sont repris du cache. Les constats
+    ne contenant pas de numéro de ligne, ils restent valables lorsqu'une autre partie du fichier change. Les entrées qui ne servent
+    plus (opérations supprimées ou modifiées) ne sont pas conservées à l'enregistrement.
+    """
+
+    def __init__(self, cache_path=None, context=None):
+        """
+        Initialise le cache et charge les entrées enregistrées, si elles correspondent au même contexte.
+
+        :param cache_path: (optionnel) Fichier JSON où le cache est conservé ; sans fichier, le cache reste en mémoire.
+        :param context: (optionnel) Valeur dont dépendent tous les résultats (typiquement les règles du projet) ;
+                        un changement de contexte invalide tout le cache.
+        """
+        self.cache_path = cache_path
+        self.context = fingerprint(context)
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._fresh = {}
+        if cache_path and os.path.exists(cache_path):
+            self._entries = self._read(cache_path)
+
+    def _read(self, cache_path):
+        """
+        Lit le fichier du cache ; un fichier illisible ou d'un autre contexte est ignoré.
+
+        :param cache_path: Chemin du fichier du cache.
+        :return: Le dictionnaire des entrées.
+        """
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as file:
+                content = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if content.get("version") != CACHE_FORMAT_VERSION or content.get("context") != self.context:
+            return {}
+        return content.get("entries", {})
+
+    def save(self):
+        """
+        Enregistre les entrées utilisées depuis la création du cache (ou le dernier enregistrement).
+        L'écriture passe par un fichier temporaire pour ne jamais laisser un cache tronqué.
+        """
+        self._entries = self._fresh
+        self._fresh = {}
+        if not self.cache_path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.cache_path))
+        os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{self.cache_path}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump({"version": CACHE_FORMAT_VERSION, "context": self.context, "entries": self._entries}, file,
+                      ensure_ascii=False, default=str)
+        os.replace(temporary_path, self.cache_path)
+
+    @staticmethod
+    def make_key(kind, value, *context):
+        """
+        Calcule la clé d'une entrée du cache.
+
+        :param kind: Nature de l'entrée (par exemple 'operation'), pour séparer les espaces de clés.
+        :param value: La valeur dont dépend le résultat (chemin, opération...).
+        :param context: Valeurs complémentaires dont dépend le résultat (chemin, méthode...).
+        :return: La clé de l'entrée.
+        """
+        return f"{kind}:{fingerprint([context, value])}"
+
+    def _lookup(self, key):
+        result = self._fresh.get(key)
+        if result is None:
+            result = self._entries.get(key)
+            if result is not None:
+                self._fresh[key] = result
+        return result
+
+    def get_or_compute(self, key, compute):
+        """
+        Retourne le résultat mémorisé sous une clé, ou le calcule et le mémorise.
+
+        :param key: Clé de l'entrée (voir `make_key`).
+        :param compute: Fonction sans argument calculant le résultat (une liste de `Finding`).
+        :return: La liste des constats mémorisés ou calculés.
+        """
+        stored = self._lookup(key)
+        if stored is None:
+            self.misses += 1
+            findings = list(compute())
+            self._fresh[key] = [finding.to_list() for finding in findings]
+            return findings
+        self.hits += 1
+        return [Finding.from_list(values) for values in stored]
+
+    def walk(self, walker, swagger_dict):
+        """
+        Équivalent incrémental de `OperationWalker.walk`.
+
+        Les visiteurs `cacheable` ne sont appliqués qu'aux opérations dont l'empreinte a changé ; pour un
+        chemin inchangé, les empreintes de ses opérations sont elles-mêmes reprises du cache. Les autres
+        visiteurs sont toujours appliqués. L'ordre des constats est le même que celui de `walker.walk`.
+
+        :param walker: L'`OperationWalker` portant les visiteurs du projet.
+        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger.
+        :return: Un générateur des constats.
+        """
+        cached_walker = OperationWalker([visitor for visitor in walker.visitors if visitor.cacheable])
+        live_walker = OperationWalker([visitor for visitor in walker.visitors if not visitor.cacheable])
+
+        for path, path_item, operations in walker.iter_operations(swagger_dict):
+            yield from live_walker.walk_path(path, path_item)
+
+            # Les composants référencés (`$ref`) font partie de l'empreinte : modifier un composant
+            # invalide les opérations qui l'utilisent.
+            resolver = operations[0].resolver if operations else None
+            components = resolver.cache_context(path_item) if resolver is not None else []
+            path_item_key = self.make_key('path_item', path_item, path, components)
+            operation_keys = self._lookup(path_item_key)
+            if operation_keys is None or len(operation_keys) != len(operations):
+                operation_keys = [
+                    self.make_key('operation', operation.data, path, operation.method, path_item.get('parameters'),
+                                  resolver.cache_context([path_item.get('parameters'), operation.data]))
+                    for operation in operations
+                ]
+                self._fresh[path_item_key] = operation_keys
+
+            for operation, operation_key in zip(operations, operation_keys):
+                yield from self.get_or_compute(operation_key, lambda: list(cached_walker.walk_operation(operation)))
+                yield from live_walker.walk_operation(operation)
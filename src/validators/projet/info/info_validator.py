@@ -1,4 +1,5 @@
 from ..base_validator import BaseValidator
+from ..finding import Finding
 import re
 
 class InfoValidator(BaseValidator):
@@ -6,17 +7,24 @@ class InfoValidator(BaseValidator):
     Valide les informations générales du Swagger telles que le titre, la version, la description et le basePath.
     """
 
+    def iter_findings(self):
+        """
+        Applique toutes les vérifications de la section 'info' et du basePath.
+
+        :return: Un générateur des constats, dans l'ordre titre, version, description, basePath.
+        """
+        yield from self._check_title()
+        yield from self._check_version()
+        yield from self._check_description()
+        yield from self._check_basepath()
+
     def validate_title(self):
         """
         Vérifie que le Swagger possède un titre.
         
         :return: Une liste d'erreurs trouvées lors de la validation du titre.
         """
-        errors = []
-        title = self.swagger_dict.get('info', {}).get('title', '')
-        if not title:
-            errors.append("Le Swagger ne contient pas de titre dans la section 'info'.")
-        return errors
+        return self._render(self._check_title())
 
     def validate_version(self):
         """
@@ -24,11 +32,7 @@ class InfoValidator(BaseValidator):
         
         :return: Une liste d'erreurs trouvées lors de la validation de la version.
         """
-        errors = []
-        version = self.swagger_dict.get('info', {}).get('version', '')
-        if not re.match(r'^v\d+', version):
-            errors.append("La version du Swagger doit commencer par 'v' suivi d'un chiffre.")
-        return errors
+        return self._render(self._check_version())
 
     def validate_description(self):
         """
@@ -36,11 +40,7 @@ class InfoValidator(BaseValidator):
         
         :return: Une liste d'erreurs trouvées lors de la validation de la description.
         """
-        errors = []
-        description = self.swagger_dict.get('info', {}).get('description', '')
-        if not description or description.strip() == '':
-            errors.append("Le Swagger contient une description vide ou absente dans la section 'info'.")
-        return errors
+        return self._render(self._check_description())
 
     def validate_basepath(self):
         """
@@ -48,12 +48,28 @@ class InfoValidator(BaseValidator):
         
         :return: Une liste d'erreurs trouvées lors de la validation du basePath.
         """
-        errors = []
+        return self._render(self._check_basepath())
+
+    def _check_title(self):
+        title = self.swagger_dict.get('info', {}).get('title', '')
+        if not title:
+            yield Finding("info.title", "/info")
+
+    def _check_version(self):
+        version = self.swagger_dict.get('info', {}).get('version', '')
+        if not re.match(r'^v\d+', version):
+            yield Finding("info.version", "/info/version", actual=version)
+
+    def _check_description(self):
+        description = self.swagger_dict.get('info', {}).get('description', '')
+        if not description or description.strip() == '':
+            yield Finding("info.description", "/info")
+
+    def _check_basepath(self):
         base_path = self.swagger_dict.get('basePath', '')
         info = self.swagger_dict.get('info', {})
         title = info.get('title', '')
         version = info.get('version', '')
         expected_base_path = f"/{title}/{version}"
         if base_path != expected_base_path:
-            errors.append(f"Le `basePath` est incorrect : attendu '{expected_base_path}', trouvé '{base_path}'.")
-        return errors
+            yield Finding("info.basepath", "/basePath", expected=expected_base_path, actual=base_path)
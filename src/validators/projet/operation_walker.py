@@ -0,0 +1,346 @@
+import itertools
+import time
+
+from src.utils.position_index import json_pointer
+
+from .ref_resolver import RefResolver
+
+HTTP_METHODS = frozenset(('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace'))
+
+
+class OperationParameter:
+    """
+    Paramètre effectif d'une opération, défini sur l'opération ou sur son chemin.
+    """
+
+    __slots__ = ('parameter', 'reference', 'tokens')
+
+    def __init__(self, parameter, reference, tokens):
+        """
+        :param parameter: Le dictionnaire du paramètre, référence résolue.
+        :param reference: L'élément tel qu'écrit dans la liste `parameters` (éventuellement un `$ref`).
+        :param tokens: Clés menant à cet élément, par exemple ('paths', '/pet', 'get', 'parameters', 0).
+        """
+        self.parameter = parameter
+        self.reference = reference
+        self.tokens = tokens
+
+    def pointer(self, resolver, *tokens):
+        """
+        Retourne le JSON pointer d'un élément du paramètre. Pour un paramètre défini par référence, le
+        pointer désigne le composant référencé.
+
+        :param resolver: Le `RefResolver` du document.
+        :param tokens: Clés sous le paramètre, par exemple ('name',).
+        :return: Le JSON pointer de l'élément.
+        """
+        location = resolver.location(self.reference)
+        if location is None:
+            return json_pointer(*self.tokens, *tokens)
+        return location + json_pointer(*tokens)
+
+
+def _index_parameters(resolver, parameters, tokens):
+    """
+    Indexe une liste `parameters` par position (`in`) puis par nom en minuscules. Les références sont
+    résolues ; en cas de doublon, le premier paramètre est retenu.
+
+    :param resolver: Le `RefResolver` du document.
+    :param parameters: La liste `parameters` d'un chemin ou d'une opération.
+    :param tokens: Clés menant à cette liste, pour les JSON pointers.
+    :return: Un dictionnaire {position: {nom en minuscules: `OperationParameter`}}.
+    """
+    index = {}
+    for position, reference in enumerate(parameters if isinstance(parameters, list) else []):
+        parameter = resolver.resolve(reference)
+        if isinstance(parameter, dict) and isinstance(parameter.get('name'), str):
+            index.setdefault(parameter.get('in'), {}).setdefault(
+                parameter['name'].lower(), OperationParameter(parameter, reference, (*tokens, position)))
+    return index
+
+
+class Operation:
+    """
+    Contexte d'une opération (méthode HTTP d'un chemin) transmis aux visiteurs.
+    """
+
+    __slots__ = ('path', 'method', 'data', 'path_item', 'resolver', '_parameter_index')
+
+    def __init__(self, path, method, data, path_item, resolver=None):
+        """
+        :param path: Chemin d'API de l'opération, par exemple '/pet'.
+        :param method: Clé de la méthode telle qu'écrite dans le Swagger, par exemple 'get'.
+        :param data: Dictionnaire de l'opération.
+        :param path_item: Dictionnaire du chemin contenant l'opération.
+        :param resolver: (optionnel) `RefResolver` du document, partagé par toutes les opérations d'un parcours.
+        """
+        self.path = path
+        self.method = method
+        self.data = data
+        self.path_item = path_item
+        self.resolver = resolver if resolver is not None else RefResolver({})
+        self._parameter_index = None
+
+    @property
+    def method_upper(self):
+        return self.method.upper()
+
+    @property
+    def key(self):
+        """(méthode en majuscules, chemin), l'opération telle qu'indiquée dans les messages."""
+        return self.method.upper(), self.path
+
+    def pointer(self, *tokens):
+        """
+        Retourne le JSON pointer d'un élément de l'opération.
+
+        :param tokens: Clés et index sous l'opération, par exemple ('parameters', 0, 'name').
+        :return: Le JSON pointer, par exemple '/paths/~1pet/get/parameters/0/name'.
+        """
+        return json_pointer('paths', self.path, self.method, *tokens)
+
+    def resolve(self, value):
+        """
+        Résout une référence locale (`$ref`) avec le `RefResolver` du parcours.
+
+        :param value: Une valeur de l'opération (paramètre, réponse, schéma...).
+        :return: La valeur résolue, ou la valeur elle-même si ce n'est pas une référence.
+        """
+        return self.resolver.resolve(value)
+
+    @property
+    def parameter_index(self):
+        """
+        Index des paramètres effectifs de l'opération : {position (`in`): {nom en minuscules: `OperationParameter`}}.
+
+        Comme le prévoit OpenAPI, les paramètres communs du chemin s'appliquent à l'opération, sauf ceux
+        qu'elle redéfinit (même position et même nom). L'index du chemin n'est construit qu'une fois pour
+        toutes ses opérations, et celui de l'opération au premier appel : chaque règle y trouve ensuite un
+        paramètre en temps constant, sans parcourir ni mettre en minuscules les listes `parameters`.
+        """
+        if self._parameter_index is None:
+            path_index = self.resolver.memoize(
+                ('path_parameters', id(self.path_item)),
+                lambda: _index_parameters(self.resolver, self.path_item.get('parameters'),
+                                          ('paths', self.path, 'parameters')))
+            operation_index = _index_parameters(self.resolver, self.data.get('parameters'),
+                                                ('paths', self.path, self.method, 'parameters'))
+            if not operation_index:
+                index = path_index
+            else:
+                index = {location: dict(by_name) for location, by_name in path_index.items()}
+                for location, by_name in operation_index.items():
+                    index.setdefault(location, {}).update(by_name)
+            self._parameter_index = index
+        return self._parameter_index
+
+    def parameters(self, location):
+        """
+        Retourne les paramètres effectifs de l'opération à une position donnée.
+
+        :param location: Position des paramètres (`in`), par exemple 'header' ou 'query'.
+        :return: Les `OperationParameter`, ceux du chemin en premier.
+        """
+        return self.parameter_index.get(location, {}).values()
+
+    def find_parameter(self, location, name_key):
+        """
+        Retourne le paramètre effectif de l'opération ayant une position et un nom donnés.
+
+        :param location: Position du paramètre (`in`), par exemple 'header' ou 'query'.
+        :param name_key: Nom du paramètre en minuscules.
+        :return: L'`OperationParameter` (dictionnaire du paramètre, référence résolue, et son emplacement), ou None.
+        """
+        return self.parameter_index.get(location, {}).get(name_key)
+
+    def parameters_pointer(self):
+        """
+        Retourne le JSON pointer où signaler un paramètre manquant : la liste `parameters` de l'opération,
+        à défaut celle de son chemin, à défaut l'opération elle-même.
+
+        :return: Le JSON pointer.
+        """
+        if isinstance(self.data.get('parameters'), list):
+            return self.pointer('parameters')
+        if isinstance(self.path_item.get('parameters'), list):
+            return json_pointer('paths', self.path, 'parameters')
+        return self.pointer()
+
+
+class OperationVisitor:
+    """
+    Règle appliquée par `OperationWalker`. Les sous-classes redéfinissent les méthodes `visit_*`
+    qui les concernent ; chacune retourne un itérable de constats (`Finding`).
+
+    `cacheable` indique que les constats d'une opération ne dépendent que de son contenu : ils peuvent
+    alors être réutilisés par `IncrementalCache`. Seuls les visiteurs d'opération, de paramètre et de
+    réponse peuvent l'être.
+    """
+
+    cacheable = False
+
+    def visit_path(self, path, path_item):
+        return ()
+
+    def visit_operation(self, operation):
+        return ()
+
+    def visit_parameter(self, operation, index, parameter):
+        return ()
+
+    def visit_response(self, operation, response_code, response):
+        return ()
+
+
+class InstrumentedVisitor(OperationVisitor):
+    """
+    Enveloppe d'un visiteur qui signale chaque visite, chaque constat et le temps passé aux points
+    d'observation (`ValidationHooks`). Seules les méthodes `visit_*` redéfinies par le visiteur enveloppé
+    sont exposées, si bien que `OperationWalker` les appelle exactement comme pour le visiteur lui-même.
+    """
+
+    def __init__(self, name, visitor, hooks):
+        """
+        :param name: Nom du validateur dans les statistiques, par exemple 'projet.header'.
+        :param visitor: Le visiteur enveloppé.
+        :param hooks: Les points d'observation (`ValidationHooks`).
+        """
+        self.name = name
+        self.visitor = visitor
+        self.hooks = hooks
+        self.cacheable = visitor.cacheable
+        self.seconds = 0.0
+        for method_name in _VISIT_METHODS:
+            if getattr(type(visitor), method_name) is not getattr(OperationVisitor, method_name):
+                setattr(self, method_name, self._wrap(getattr(visitor, method_name), method_name[len('visit_'):]))
+
+    def _wrap(self, method, kind):
+        name, hooks = self.name, self.hooks
+
+        def hook(*args):
+            started = time.perf_counter()
+            findings = list(method(*args))
+            self.seconds += time.perf_counter() - started
+            hooks.node_visited(name, kind)
+            for finding in findings:
+                hooks.finding_emitted(name, finding)
+            return findings
+        return hook
+
+
+_VISIT_METHODS = ('visit_path', 'visit_operation', 'visit_parameter', 'visit_response')
+
+
+class OperationWalker:
+    """
+    Parcourt une seule fois les chemins et opérations du Swagger et transmet chaque chemin, opération,
+    paramètre et réponse aux visiteurs enregistrés.
+
+    Les clés d'un chemin qui ne sont pas des méthodes HTTP (`parameters`, `summary`, `servers`, `$ref`...)
+    sont ignorées. Les paramètres et réponses définis par référence (`$ref`) sont résolus avant d'être transmis aux
+    visiteurs, par un `RefResolver` partagé par toutes les opérations du parcours.
+    """
+
+    def __init__(self, visitors=(), hooks=None):
+        """
+        :param visitors: Liste des visiteurs (`OperationVisitor`) à appliquer, dans l'ordre.
+        :param hooks: (optionnel) Points d'observation (`ValidationHooks`) avertis de chaque opération parcourue.
+        """
+        self.hooks = hooks
+        self.visitors = []
+        self._path_hooks = []
+        self._operation_hooks = []
+        self._parameter_hooks = []
+        self._response_hooks = []
+        for visitor in visitors:
+            self.register(visitor)
+
+    def register(self, visitor):
+        """
+        Enregistre un visiteur. Seules les méthodes `visit_*` qu'il redéfinit sont appelées.
+
+        :param visitor: Le visiteur à enregistrer.
+        """
+        self.visitors.append(visitor)
+        for name, hooks in zip(_VISIT_METHODS, (self._path_hooks, self._operation_hooks,
+                                                self._parameter_hooks, self._response_hooks)):
+            method = getattr(visitor, name)
+            if getattr(method, '__func__', None) is not getattr(OperationVisitor, name):
+                hooks.append(method)
+
+    def iter_operations(self, swagger_dict, start=0, stop=None):
+        """
+        Énumère les opérations du Swagger.
+
+        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger.
+        :param start: (optionnel) Position du premier chemin de `paths` à parcourir.
+        :param stop: (optionnel) Position du chemin auquel s'arrêter (exclu) ; par défaut, jusqu'au dernier.
+        :return: Un générateur de tuples (chemin, dictionnaire du chemin, liste des `Operation` du chemin).
+        """
+        paths = swagger_dict.get('paths') or {}
+        if not isinstance(paths, dict):
+            return
+        resolver = RefResolver(swagger_dict)
+        for path, path_item in itertools.islice(paths.items(), start, stop):
+            if not isinstance(path_item, dict):
+                continue
+            operations = [
+                Operation(path, method, data, path_item, resolver)
+                for method, data in path_item.items()
+                if isinstance(method, str) and method.lower() in HTTP_METHODS and isinstance(data, dict)
+            ]
+            if self.hooks is not None:
+                for operation in operations:
+                    self.hooks.operation_visited(operation)
+            yield path, path_item, operations
+
+    def walk(self, swagger_dict, start=0, stop=None):
+        """
+        Applique tous les visiteurs au Swagger en un seul parcours.
+
+        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger.
+        :param start: (optionnel) Position du premier chemin de `paths` à parcourir.
+        :param stop: (optionnel) Position du chemin auquel s'arrêter (exclu), voir `iter_operations`.
+        :return: Un générateur des constats, dans l'ordre du document.
+        """
+        for path, path_item, operations in self.iter_operations(swagger_dict, start, stop):
+            yield from self.walk_path(path, path_item)
+            for operation in operations:
+                yield from self.walk_operation(operation)
+
+    def walk_path(self, path, path_item):
+        """
+        Applique les visiteurs de niveau chemin à un seul chemin.
+
+        :param path: Le chemin visité.
+        :param path_item: Le dictionnaire du chemin.
+        :return: Un générateur des constats.
+        """
+        for hook in self._path_hooks:
+            yield from hook(path, path_item)
+
+    def walk_operation(self, operation):
+        """
+        Applique les visiteurs à une seule opération, à ses paramètres et à ses réponses.
+
+        :param operation: L'`Operation` à visiter.
+        :return: Un générateur des constats.
+        """
+        for hook in self._operation_hooks:
+            yield from hook(operation)
+
+        if self._parameter_hooks:
+            parameters = operation.data.get('parameters') or []
+            for index, parameter in enumerate(parameters if isinstance(parameters, list) else []):
+                parameter = operation.resolve(parameter)
+                if isinstance(parameter, dict):
+                    for hook in self._parameter_hooks:
+                        yield from hook(operation, index, parameter)
+
+        if self._response_hooks:
+            responses = operation.data.get('responses') or {}
+            for response_code, response in (responses.items() if isinstance(responses, dict) else ()):
+                response = operation.resolve(response)
+                if isinstance(response, dict):
+                    for hook in self._response_hooks:
+                        yield from hook(operation, response_code, response)
@@ -0,0 +1,109 @@
+"""
+Évaluation des règles du projet en parallèle, par lots de chemins (`paths`) d'un même Swagger.
+
+Le document est chargé une seule fois : les processus de travail sont créés par fork et héritent du
+document et des règles compilées sans copie ni sérialisation (copie à l'écriture). Chaque processus
+parcourt une tranche contiguë de `paths` ; les constats des tranches sont réunis dans l'ordre des
+tranches, si bien que le résultat est identique à celui d'un parcours dans un seul processus.
+
+Une recherche complémentaire sur chaque tranche (par exemple celle des caractères spéciaux dans les
+valeurs des chemins) peut être effectuée par les mêmes processus.
+"""
+
+# Nombre minimal de chemins par tranche : en deçà, le coût du fork et du transfert des constats
+# dépasse le gain du parallélisme.
+MIN_PATHS_PER_SHARD = 250
+
+# Tranches par processus, pour équilibrer la charge lorsque certains chemins sont plus coûteux.
+SHARDS_PER_JOB = 4
+
+# Parcours et recherche complémentaire hérités par les processus de travail (voir `walk_in_shards`)
+_shard_walker = None
+_shard_swagger_dict = None
+_shard_scan = None
+
+def fork_available():
+    """
+    Indique si les processus de travail peuvent être créés par fork (Linux, macOS ; pas Windows).
+
+    :return: True si la méthode de démarrage 'fork' est disponible.
+    """
+    # multiprocessing n'est importé que pour une validation en parallèle.
+    import multiprocessing
+
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+def shard_bounds(path_count, jobs):
+    """
+    Découpe les chemins en tranches contiguës de tailles voisines.
+
+    :param path_count: Nombre de chemins du Swagger.
+    :param jobs: Nombre de processus de travail.
+    :return: La liste des tranches (début, fin exclue), vide si le Swagger est trop petit pour être découpé.
+    """
+    shards = min(jobs * SHARDS_PER_JOB, path_count // MIN_PATHS_PER_SHARD)
+    if jobs <= 1 or shards < 2:
+        return []
+    size, extra = divmod(path_count, shards)
+    bounds, start = [], 0
+    for index in range(shards):
+        stop = start + size + (index < extra)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+def _walk_shard(bounds):
+    """
+    Parcourt une tranche de chemins dans un processus de travail.
+
+    :param bounds: La tranche (début, fin exclue).
+    :return: Un tuple (constats du parcours, constats de la recherche complémentaire ou None).
+    """
+    findings = list(_shard_walker.walk(_shard_swagger_dict, *bounds))
+    return findings, (_shard_scan(*bounds) if _shard_scan is not None else None)
+
+def walk_in_shards(walker, swagger_dict, jobs, scan=None):
+    """
+    Lance le parcours des chemins du Swagger par tranches dans des processus créés par fork.
+
+    Les processus sont créés et les tranches soumises dès l'appel : l'appelant peut effectuer d'autres
+    traitements pendant le parcours, puis consommer les constats.
+
+    Les processus héritant du parcours au moment du fork, un seul parcours par tranches peut être lancé à
+    la fois dans un processus.
+
+    :param walker: L'`OperationWalker` portant les visiteurs du projet (non observé).
+    :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger.
+    :param jobs: Nombre de processus de travail.
+    :param scan: (optionnel) Recherche complémentaire `scan(début, fin)` effectuée par chaque processus sur
+                 sa tranche de chemins, et retournant une liste de constats.
+    :return: Un itérateur des tuples (constats du parcours, constats de `scan` ou None) de chaque tranche,
+             dans l'ordre du document, ou None si le Swagger est trop petit pour être découpé ou que fork
+             n'est pas disponible.
+    """
+    global _shard_walker, _shard_swagger_dict, _shard_scan
+
+    paths = swagger_dict.get('paths')
+    bounds = shard_bounds(len(paths) if isinstance(paths, dict) else 0, jobs)
+    if not bounds or not fork_available():
+        return None
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    _shard_walker, _shard_swagger_dict, _shard_scan = walker, swagger_dict, scan
+    try:
+        executor = ProcessPoolExecutor(max_workers=min(jobs, len(bounds)),
+                                       mp_context=multiprocessing.get_context('fork'))
+        results = executor.map(_walk_shard, bounds)
+    finally:
+        # Les processus sont tous créés par fork lors de la première soumission.
+        _shard_walker = _shard_swagger_dict = _shard_scan = None
+    return _merge(executor, results)
+
+def _merge(executor, results):
+    """
+    Énumère les résultats des tranches dans leur ordre, puis arrête les processus de travail.
+    """
+    with executor:
+        yield from results
@@ -2,6 +2,14 @@ import os
 import sys
 import json
 
+from src.utils.instrumentation import timed_findings
+from src.utils.position_index import json_pointer
+from src.utils.spec_document import SpecDocument
+
+from .compiled_rules import CompiledRules
+from .operation_walker import InstrumentedVisitor, OperationWalker
+from .path_shards import walk_in_shards
+from .rule_registry import get_compiled_rules
 from .headers.header_validator import HeaderValidator
 from .query_params.query_param_validator import QueryParamValidator
 from .reserved_keywords.reserved_path_validator import ReservedPathValidator
@@ -11,45 +19,90 @@ from .info.info_validator import InfoValidator
 from .responses.response_validator import ResponseValidator
 from .reserved_keywords.special_character_validator import SpecialCharacterValidator
 
+def default_rules_config_path():
+    """
+    Retourne le chemin du fichier de règles livré avec l'application (ou embarqué dans l'exécutable PyInstaller).
+
+    :return: Le chemin vers `config/projet_validation_rules.json`.
+    """
+    if getattr(sys, 'frozen', False):
+        base_path = sys._MEIPASS
+    else:
+        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..','..'))
+    return os.path.join(base_path, 'config', 'projet_validation_rules.json')
+
+# Ordre des validateurs lorsqu'ils étaient appelés l'un après l'autre, par famille de règles (identifiant de
+# règle, ou son préfixe pour les règles des headers, paramètres de requête et réponses).
+VALIDATOR_ORDER = ("reserved.path", "reserved.header", "reserved.query_parameter", "info", "special_character",
+                   "header", "query_parameter", "response")
+_VALIDATOR_RANKS = {family: rank for rank, family in enumerate(VALIDATOR_ORDER)}
+
+def validator_rank(finding):
+    """
+    Clé de tri regroupant les constats par validateur, dans l'ordre de `VALIDATOR_ORDER`. Le tri étant
+    stable, les constats d'un même validateur restent dans l'ordre du parcours.
+
+    :param finding: Un constat (`Finding`).
+    :return: Le rang du validateur à l'origine du constat.
+    """
+    rank = _VALIDATOR_RANKS.get(finding.rule_id)
+    if rank is None:
+        rank = _VALIDATOR_RANKS[finding.rule_id.partition('.')[0]]
+    return rank
+
 class ProjetRulesValidator:
     """
     Classe principale pour valider un fichier Swagger (ou OpenAPI) par rapport à un ensemble de règles spécifiques.
     """
 
-    def __init__(self, swagger_dict, swagger_text, rules_config_path=None):
+    def __init__(self, swagger_dict, swagger_text, rules_config_path=None, rules=None, hooks=None):
         """
         Initialise la classe avec les différents validateurs.
         
-        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger.
-        :param swagger_text: Chaîne de caractères contenant le texte brut du fichier Swagger.
-        :param rules_config_path: (optionnel) Chemin vers le fichier JSON contenant les règles de validation.
+        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger, ou `SpecDocument` partagé par tous les validateurs.
+        :param swagger_text: Chaîne de caractères contenant le texte brut du fichier Swagger (ignorée si `swagger_dict` est un `SpecDocument`).
+        :param rules_config_path: (optionnel) Chemin vers le fichier JSON contenant les règles de validation, compilées
+                                  une seule fois par processus (voir `RuleRegistry`) et rechargées s'il est modifié.
+        :param rules: (optionnel) Règles de validation déjà chargées (dictionnaire ou `CompiledRules`) ; le fichier de règles n'est alors pas relu.
+        :param hooks: (optionnel) Points d'observation (`ValidationHooks`) avertis du début et de la fin de chaque
+                      validateur, des opérations parcourues, des éléments visités et des constats émis.
         """
-        if rules_config_path is None:
-            if getattr(sys, 'frozen', False):
-                base_path = sys._MEIPASS
-                rules_config_path = os.path.join(base_path, 'config', 'projet_validation_rules.json')
-            else:
-                base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..','..'))
-                rules_config_path = os.path.join(base_path, 'config', 'projet_validation_rules.json')
+        if rules is None:
+            rules = get_compiled_rules(rules_config_path or default_rules_config_path())
 
-        print(f"Loading validation rules from: {rules_config_path}")
-        
-        self.swagger_dict = swagger_dict
-        self.swagger_text = swagger_text.splitlines()
-        self.rules = self.load_validation_rules(rules_config_path)
-
-        special_characters = self.rules.get("special_characters", [])
-
-        self.reserved_path_validator = ReservedPathValidator(swagger_dict, swagger_text, self.rules.get("reserved_paths", []))
-        self.reserved_header_validator = ReservedHeaderValidator(swagger_dict, swagger_text, self.rules.get("reserved_headers", []))
-        self.reserved_query_param_validator = ReservedQueryParamValidator(swagger_dict, swagger_text, self.rules.get("reserved_query_parameters", []))
-        self.info_validator = InfoValidator(swagger_dict, swagger_text)
-        self.response_validator = ResponseValidator(swagger_dict, swagger_text, self.rules)
-        self.special_character_validator = SpecialCharacterValidator(swagger_dict, swagger_text, special_characters)
-        self.header_validator = HeaderValidator(swagger_dict, swagger_text, self.rules)
-        self.query_param_validator = QueryParamValidator(swagger_dict, swagger_text, self.rules)
-
-    def load_validation_rules(self, filepath):
+        self.document = SpecDocument.wrap(swagger_dict, swagger_text)
+        self.swagger_dict = self.document.data
+        # Les règles sont préparées une seule fois et partagées par tous les validateurs
+        self.compiled_rules = CompiledRules.coerce(rules)
+        self.rules = self.compiled_rules.source
+        compiled = self.compiled_rules
+
+        self.reserved_path_validator = ReservedPathValidator(self.document, swagger_text, compiled.reserved_paths)
+        self.reserved_header_validator = ReservedHeaderValidator(self.document, swagger_text, compiled.reserved_headers)
+        self.reserved_query_param_validator = ReservedQueryParamValidator(self.document, swagger_text, compiled.reserved_query_parameters)
+        self.info_validator = InfoValidator(self.document, swagger_text)
+        self.response_validator = ResponseValidator(self.document, swagger_text, compiled)
+        self.special_character_validator = SpecialCharacterValidator(self.document, swagger_text, compiled.special_characters)
+        self.header_validator = HeaderValidator(self.document, swagger_text, compiled)
+        self.query_param_validator = QueryParamValidator(self.document, swagger_text, compiled)
+
+        self.hooks = hooks
+        visitors = [
+            ("projet.reserved_path", self.reserved_path_validator),
+            ("projet.reserved_header", self.reserved_header_validator),
+            ("projet.reserved_query_parameter", self.reserved_query_param_validator),
+            ("projet.header", self.header_validator),
+            ("projet.query_parameter", self.query_param_validator),
+            ("projet.response", self.response_validator),
+        ]
+        if hooks is None:
+            self.walker = OperationWalker([visitor for _, visitor in visitors])
+        else:
+            # Les visiteurs ne sont enveloppés que si la validation est observée.
+            self.walker = OperationWalker([InstrumentedVisitor(name, visitor, hooks) for name, visitor in visitors], hooks)
+
+    @staticmethod
+    def load_validation_rules(filepath):
         """
         Charge les règles de validation à partir du fichier JSON spécifié.
         
@@ -63,30 +116,114 @@ class ProjetRulesValidator:
             return json.load(file)
 
 
-    def validate(self):
+    def iter_findings(self, cache=None, jobs=1):
         """
         Exécute toutes les validations définies dans les validateurs.
-        
-        :return: Un tuple (bool, str) où le booléen indique si le Swagger est conforme, et la chaîne contient les détails des erreurs ou un message de succès.
+
+        Les règles portant sur les chemins, opérations et paramètres sont appliquées en un seul parcours
+        du document par `OperationWalker`. Les constats sont produits au fur et à mesure : ceux de la section
+        `info`, puis ceux du parcours dans l'ordre des chemins et opérations (les validateurs du parcours y
+        sont mêlés), puis ceux des caractères spéciaux. Pour les regrouper par validateur, les trier avec
+        `validator_rank`, comme `validate`.
+
+        :param cache: (optionnel) `IncrementalCache` ; seules les opérations modifiées depuis la validation
+                      précédente sont alors réévaluées. L'appelant se charge de `cache.save()`.
+        :param jobs: (optionnel) Nombre de processus entre lesquels répartir les chemins d'un grand Swagger
+                     (voir `walk_in_shards`) ; ignoré avec un cache ou des points d'observation. Les constats
+                     sont les mêmes, dans le même ordre, qu'avec un seul processus.
+        :return: Un générateur des constats (`Finding`).
+        """
+        if self.hooks is not None:
+            yield from self._iter_observed_findings(cache)
+            return
+        yield from self.info_validator.iter_findings()
+        if cache is not None:
+            yield from cache.walk(self.walker, self.swagger_dict)
+        elif jobs > 1:
+            shards = self._walk_in_shards(jobs)
+            if shards is not None:
+                yield from shards
+                return
+            yield from self.walker.walk(self.swagger_dict)
+        else:
+            yield from self.walker.walk(self.swagger_dict)
+        yield from self.special_character_validator.iter_findings(cache)
+
+    def _walk_in_shards(self, jobs):
         """
-        errors = []
-        errors.extend(self.reserved_path_validator.validate_reserved_paths())
-        errors.extend(self.reserved_header_validator.validate_reserved_headers())
-        errors.extend(self.reserved_query_param_validator.validate_reserved_query_parameters())
-        errors.extend(self.info_validator.validate_title())
-        errors.extend(self.info_validator.validate_version())
-        errors.extend(self.info_validator.validate_description())
-        errors.extend(self.info_validator.validate_basepath())
-        errors.extend(self.special_character_validator.validate_all_values())
-        errors.extend(self.header_validator.validate_headers())
-        errors.extend(self.query_param_validator.validate_query_parameters())
-        errors.extend(self.response_validator.validate_responses())
-
-        for method, method_rules in self.rules.items():
-            if isinstance(method_rules, dict):
-                errors.extend(self.reserved_query_param_validator.validate_reserved_query_parameters())
-                errors.extend(self.reserved_header_validator.validate_reserved_headers())
+        Parcourt les chemins par tranches dans des processus de travail (voir `walk_in_shards`), qui
+        recherchent aussi les caractères spéciaux dans les valeurs de leurs chemins.
 
+        Pendant ce temps, le processus courant prépare l'index des positions des chemins, afin que les
+        lignes des constats soient trouvées sans nouveau parcours du texte.
+
+        :param jobs: Nombre de processus de travail.
+        :return: Un générateur des constats du parcours puis des caractères spéciaux, dans l'ordre d'un
+                 parcours dans un seul processus, ou None si le Swagger n'est pas découpé.
+        """
+        special = self.special_character_validator
+        shards = walk_in_shards(self.walker, self.swagger_dict, jobs, special.scan_paths if special.may_match() else None)
+        if shards is None:
+            return None
+        self.document.positions.locate(json_pointer('paths', next(reversed(self.swagger_dict['paths']))))
+        return self._merge_shards(shards)
+
+    def _merge_shards(self, shards):
+        path_findings = []
+        for findings, special_findings in shards:
+            yield from findings
+            if special_findings is not None:
+                path_findings.extend(special_findings)
+        yield from self.special_character_validator.iter_findings(path_findings=path_findings)
+
+    def _iter_observed_findings(self, cache):
+        """
+        Équivalent de `iter_findings` lorsque la validation est observée par `hooks`.
+
+        Les visiteurs du parcours étant appelés en alternance, le temps de chacun est cumulé par son
+        `InstrumentedVisitor` et signalé à la fin du parcours. Avec un cache, seules les opérations
+        réévaluées sont comptées dans les éléments visités et les constats des visiteurs.
+
+        :param cache: (optionnel) `IncrementalCache`, voir `iter_findings`.
+        :return: Un générateur des constats (`Finding`).
+        """
+        hooks = self.hooks
+        yield from timed_findings(hooks, "projet.info", self.info_validator.iter_findings())
+
+        for visitor in self.walker.visitors:
+            visitor.seconds = 0.0
+            hooks.validator_started(visitor.name)
+        try:
+            if cache is None:
+                yield from self.walker.walk(self.swagger_dict)
+            else:
+                yield from cache.walk(self.walker, self.swagger_dict)
+        finally:
+            for visitor in self.walker.visitors:
+                hooks.validator_finished(visitor.name, visitor.seconds)
+
+        yield from timed_findings(hooks, "projet.special_character", self.special_character_validator.iter_findings(cache))
+
+    def iter_errors(self, cache=None, jobs=1):
+        """
+        Exécute toutes les validations et met en forme chaque constat au fur et à mesure.
+
+        :param cache: (optionnel) `IncrementalCache`, voir `iter_findings`.
+        :param jobs: (optionnel) Nombre de processus de validation, voir `iter_findings`.
+        :return: Un générateur des messages d'erreur.
+        """
+        for finding in self.iter_findings(cache, jobs):
+            yield finding.render(self.document)
+
+    def validate(self, cache=None):
+        """
+        Exécute toutes les validations définies dans les validateurs.
+        
+        :param cache: (optionnel) `IncrementalCache` utilisé pour ne réévaluer que les opérations modifiées.
+        :return: Un tuple (bool, str) où le booléen indique si le Swagger est conforme, et la chaîne contient les détails des erreurs
+                 (regroupées par validateur, voir `validator_rank`) ou un message de succès.
+        """
+        errors = [finding.render(self.document) for finding in sorted(self.iter_findings(cache), key=validator_rank)]
         if errors:
             return False, "\n".join(errors)
         return True, "Swagger conforme aux normes du projet."
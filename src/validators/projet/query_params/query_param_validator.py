@@ -1,20 +1,25 @@
 from ..base_validator import BaseValidator
+from ..compiled_rules import CompiledRules
+from ..finding import Finding
+from ..operation_walker import OperationVisitor, OperationWalker
 
-class QueryParamValidator(BaseValidator):
+class QueryParamValidator(BaseValidator, OperationVisitor):
     """
     Valide les paramètres de requête définis dans le Swagger en fonction des règles spécifiques pour chaque méthode HTTP.
     """
 
+    cacheable = True
+
     def __init__(self, swagger_dict, swagger_text, rules):
         """
         Initialise le validateur avec les règles de validation des paramètres de requête pour chaque méthode HTTP.
         
-        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger.
+        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger, ou `SpecDocument` partagé.
         :param swagger_text: Chaîne de caractères contenant le texte brut du fichier Swagger.
-        :param rules: Règles spécifiques pour chaque méthode HTTP.
+        :param rules: Règles spécifiques pour chaque méthode HTTP (dictionnaire ou `CompiledRules`).
         """
         super().__init__(swagger_dict, swagger_text)
-        self.rules = rules
+        self.rules = CompiledRules.coerce(rules)
 
     def validate_query_parameters(self):
         """
@@ -22,97 +27,70 @@ class QueryParamValidator(BaseValidator):
         
         :return: Une liste d'erreurs trouvées lors de la validation des paramètres de requête.
         """
-        errors = []
-        paths = self.swagger_dict.get('paths', {})
-
-        for path, path_data in paths.items():
-            for method, method_data in path_data.items():
-                method_upper = method.upper()
-                if method_upper in self.rules:
-                    for rule in self.rules[method_upper].get("query_parameters", []):
-                        param_name = rule["name"]
-                        parameter = self._find_query_parameter(param_name, method_data.get('parameters', []))
-                        if parameter:
-                            errors.extend(self._validate_query_parameter(parameter, rule, method, path))
-                        else:
-                            errors.append(
-                                f"Paramètre de requête '{param_name}' est manquant dans {method_upper} {path}. "
-                                f"Il devrait être comme suit :\n"
-                                f"  - name: '{param_name}'\n"
-                                f"    type: '{rule.get('type')}'\n"
-                                f"    required: {rule.get('required')}\n"
-                                f"    description: '{rule.get('description')}'\n"
-                                f"    example: '{rule.get('value')}'\n"
-                                f"    format: '{rule.get('format')}'\n"
-                            )
-        return errors
-
-    def _find_query_parameter(self, param_name, parameters):
+        return self._render(OperationWalker([self]).walk(self.swagger_dict))
+
+    def visit_operation(self, operation):
         """
-        Trouve un paramètre de requête spécifique dans les paramètres.
+        Valide les paramètres de requête d'une opération.
 
-        :param param_name: Nom du paramètre de requête à rechercher.
-        :param parameters: Liste des paramètres pour une méthode donnée.
-        :return: Le dictionnaire du paramètre trouvé ou None.
+        :param operation: L'opération visitée.
+        :return: Un générateur des constats.
         """
-        for param in parameters:
-            if param.get("in") == "query" and param.get("name").lower() == param_name.lower():
-                return param
-        return None
+        method_rules = self.rules.for_method(operation.method_upper)
+        if method_rules is None:
+            return
+        for rule in method_rules.query_parameters:
+            entry = operation.find_parameter("query", rule.key)
+            if entry is not None and entry.parameter:
+                yield from self._validate_query_parameter(entry, rule, operation)
+            else:
+                yield Finding("query_parameter.missing", operation.parameters_pointer(), operation.key, rule.name,
+                              details={"definition": rule.definition})
 
-    def _validate_query_parameter(self, parameter, rule, method, path):
+    def _validate_query_parameter(self, entry, rule, operation):
         """
         Valide un paramètre de requête en fonction d'une règle spécifique.
 
+        Les écarts d'un même paramètre (par exemple un composant référencé par de nombreuses opérations)
+        ne sont calculés qu'une fois par parcours. Ils sont signalés à l'emplacement du paramètre : sur
+        l'opération, sur son chemin s'il en hérite, ou sur le composant référencé.
+
+        :param entry: Le paramètre à valider (`OperationParameter`).
+        :param rule: La règle de validation (`ParameterRule`) pour ce paramètre.
+        :param operation: L'opération dans laquelle ce paramètre est utilisé.
+        :return: Un générateur des constats si la validation échoue.
+        """
+        parameter = entry.parameter
+        pointer = entry.pointer(operation.resolver)
+        details = {"definition": rule.definition}
+        mismatches = operation.resolver.memoize(
+            ("query_parameter", id(parameter), id(rule)),
+            lambda: tuple(self._compare_query_parameter(parameter, rule, operation)))
+        for rule_id, expected, actual in mismatches:
+            yield Finding(rule_id, pointer, operation.key, rule.name, expected, actual, details)
+
+    def _compare_query_parameter(self, parameter, rule, operation):
+        """
+        Compare un paramètre de requête à sa règle.
+
         :param parameter: Le dictionnaire du paramètre à valider.
-        :param rule: La règle de validation pour ce paramètre.
-        :param method: La méthode HTTP pour laquelle ce paramètre est utilisé.
-        :param path: Le chemin d'API pour lequel ce paramètre est utilisé.
-        :return: Une liste d'erreurs si la validation échoue.
+        :param rule: La règle de validation (`ParameterRule`) pour ce paramètre.
+        :param operation: L'opération visitée, pour résoudre le schéma du paramètre.
+        :return: Un générateur de tuples (identifiant de règle, valeur attendue, valeur trouvée).
         """
-        errors = []
-        param_name = rule["name"]
-        schema = parameter.get("schema", {})
-
-        def format_rule():
-            return (
-                f"Le paramètre '{param_name}' dans {method.upper()} {path} devrait être :\n"
-                f"  - name: '{param_name}'\n"
-                f"    type: '{rule.get('type')}'\n"
-                f"    required: {rule.get('required')}\n"
-                f"    description: '{rule.get('description')}'\n"
-                f"    example: '{rule.get('value')}'\n"
-                f"    format: '{rule.get('format')}'\n"
-            )
-
-        if rule.get("type") and schema.get("type") != rule["type"]:
-            errors.append(
-                f"Le type du paramètre '{param_name}' dans {method.upper()} {path} est '{schema.get('type')}', "
-                f"mais il devrait être '{rule['type']}'.\n{format_rule()}"
-            )
-
-        if rule.get("format") and schema.get("format") != rule["format"]:
-            errors.append(
-                f"Le format du paramètre '{param_name}' dans {method.upper()} {path} est '{schema.get('format')}', "
-                f"mais il devrait être '{rule['format']}'.\n{format_rule()}"
-            )
-
-        if rule.get("value") and parameter.get("example") != rule["value"]:
-            errors.append(
-                f"L'exemple du paramètre '{param_name}' dans {method.upper()} {path} est '{parameter.get('example')}', "
-                f"mais il devrait être '{rule['value']}'.\n{format_rule()}"
-            )
-
-        if rule.get("description") and parameter.get("description") != rule["description"]:
-            errors.append(
-                f"La description du paramètre '{param_name}' dans {method.upper()} {path} est '{parameter.get('description')}', "
-                f"mais il devrait être '{rule['description']}'.\n{format_rule()}"
-            )
-
-        if rule.get("required") is not None and parameter.get("required") != rule["required"]:
-            errors.append(
-                f"Le paramètre '{param_name}' dans {method.upper()} {path} est '{parameter.get('required')}', "
-                f"mais il devrait être '{rule['required']}'.\n{format_rule()}"
-            )
-
-        return errors
+        schema = operation.resolve(parameter.get("schema", {}))
+
+        if rule.type and schema.get("type") != rule.type:
+            yield "query_parameter.type", rule.type, schema.get("type")
+
+        if rule.format and schema.get("format") != rule.format:
+            yield "query_parameter.format", rule.format, schema.get("format")
+
+        if rule.example and parameter.get("example") != rule.example:
+            yield "query_parameter.example", rule.example, parameter.get("example")
+
+        if rule.description and parameter.get("description") != rule.description:
+            yield "query_parameter.description", rule.description, parameter.get("description")
+
+        if rule.required is not None and parameter.get("required") != rule.required:
+            yield "query_parameter.required", rule.required, parameter.get("required")
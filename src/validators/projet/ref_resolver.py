@@ -0,0 +1,208 @@
+from urllib.parse import unquote
+
+from src.utils.fingerprint import fingerprint
+
+
+def ref_of(value):
+    """
+    Retourne la référence (`$ref`) d'une valeur, ou None si la valeur n'est pas une référence.
+
+    :param value: Une valeur du document Swagger.
+    :return: La chaîne de la référence, par exemple '#/components/parameters/X-Trace-Id'.
+    """
+    if isinstance(value, dict):
+        ref = value.get('$ref')
+        if isinstance(ref, str):
+            return ref
+    return None
+
+
+class RefResolver:
+    """
+    Résout les références locales (`#/components/...`, `#/definitions/...`) d'un document Swagger.
+
+    Chaque référence n'est résolue qu'une seule fois : la cible (au bout d'une éventuelle chaîne de
+    références) est mémorisée, ainsi que les résultats des règles calculés pour cette cible (voir
+    `memoize`). Un composant référencé par 2 000 opérations est donc résolu et vérifié une seule fois.
+    Les références externes, introuvables ou circulaires ne sont pas résolues : la valeur est alors
+    retournée telle quelle.
+    """
+
+    def __init__(self, swagger_dict):
+        """
+        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger.
+        """
+        self.swagger_dict = swagger_dict
+        self._targets = {}
+        self._closures = {}
+        self._fingerprints = {}
+        self._memo = {}
+
+    def resolve(self, value):
+        """
+        Retourne la valeur désignée par une référence, ou la valeur elle-même si ce n'est pas une référence.
+
+        :param value: Une valeur du document, par exemple `{'$ref': '#/components/schemas/Pet'}`.
+        :return: La valeur résolue.
+        """
+        ref = ref_of(value)
+        if ref is None:
+            return value
+        target = self._target(ref)
+        return value if target is None else target[1]
+
+    def location(self, value):
+        """
+        Retourne le JSON pointer de la valeur désignée par une référence.
+
+        :param value: Une valeur du document.
+        :return: Le JSON pointer de la cible, ou None si la valeur n'est pas une référence résolue.
+        """
+        ref = ref_of(value)
+        if ref is None:
+            return None
+        target = self._target(ref)
+        return None if target is None else target[0]
+
+    def _target(self, ref):
+        """
+        Résout une référence en suivant les chaînes de références, avec détection des cycles.
+
+        :param ref: La référence à résoudre.
+        :return: Un tuple (JSON pointer, valeur) de la cible finale, ou None si elle ne peut pas être résolue.
+        """
+        if ref in self._targets:
+            return self._targets[ref]
+
+        chain = []
+        target = None
+        current = ref
+        while True:
+            if current in self._targets:
+                target = self._targets[current]
+                break
+            if current in chain:
+                # Référence circulaire : aucune des références de la chaîne n'est résolue
+                break
+            chain.append(current)
+            pointer, value = self._lookup(current)
+            if pointer is None:
+                break
+            next_ref = ref_of(value)
+            if next_ref is None:
+                target = (pointer, value)
+                break
+            current = next_ref
+
+        for chained_ref in chain:
+            self._targets[chained_ref] = target
+        return target
+
+    def _lookup(self, ref):
+        """
+        Retourne la valeur désignée directement par une référence locale, sans suivre les références.
+
+        :param ref: La référence, par exemple '#/components/schemas/Pet'.
+        :return: Un tuple (JSON pointer, valeur), ou (None, None) si la référence est externe ou introuvable.
+        """
+        if not ref.startswith('#'):
+            return None, None
+        pointer = unquote(ref[1:])
+        if pointer and not pointer.startswith('/'):
+            return None, None
+        value = self.swagger_dict
+        for token in pointer.split('/')[1:]:
+            token = token.replace('~1', '/').replace('~0', '~')
+            if isinstance(value, dict) and token in value:
+                value = value[token]
+            elif isinstance(value, list) and token.isdigit() and int(token) < len(value):
+                value = value[int(token)]
+            else:
+                return None, None
+        return pointer, value
+
+    def dependencies(self, value):
+        """
+        Retourne toutes les références dont dépend une valeur, directement ou par l'intermédiaire d'autres composants.
+
+        :param value: Une valeur du document (opération, chemin...).
+        :return: L'ensemble des références.
+        """
+        found = set()
+        for ref in _refs_in(value):
+            if ref not in found:
+                found |= self._closure(ref)
+        return found
+
+    def _closure(self, ref):
+        """
+        Retourne une référence et toutes celles atteintes depuis sa cible (mémorisé par référence).
+
+        :param ref: La référence de départ.
+        :return: L'ensemble des références atteintes, `ref` compris.
+        """
+        closure = self._closures.get(ref)
+        if closure is not None:
+            return closure
+        closure = set()
+        pending = [ref]
+        while pending:
+            current = pending.pop()
+            if current in closure:
+                continue
+            known = self._closures.get(current)
+            if known is not None:
+                closure |= known
+                continue
+            closure.add(current)
+            pending.extend(_refs_in(self._lookup(current)[1]))
+        self._closures[ref] = closure = frozenset(closure)
+        return closure
+
+    def cache_context(self, value):
+        """
+        Retourne les composants dont dépend une valeur, sous une forme utilisable dans une clé de cache.
+
+        :param value: Une valeur du document (opération, chemin...).
+        :return: La liste triée des couples (référence, empreinte de sa cible).
+        """
+        context = []
+        for ref in sorted(self.dependencies(value)):
+            digest = self._fingerprints.get(ref)
+            if digest is None:
+                digest = self._fingerprints[ref] = fingerprint(self._lookup(ref)[1])
+            context.append((ref, digest))
+        return context
+
+    def memoize(self, key, compute):
+        """
+        Retourne le résultat mémorisé sous une clé, ou le calcule et le mémorise pour la suite du parcours.
+
+        :param key: La clé du résultat, par exemple ('header', id(paramètre), nom de la règle).
+        :param compute: Fonction sans argument calculant le résultat.
+        :return: Le résultat.
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            result = self._memo[key] = compute()
+            return result
+
+
+def _refs_in(value):
+    """
+    Énumère les références présentes dans une valeur (sans les suivre), avec une pile explicite.
+
+    :param value: Une valeur du document.
+    :return: Un générateur des références.
+    """
+    pending = [value]
+    while pending:
+        current = pending.pop()
+        if isinstance(current, dict):
+            ref = current.get('$ref')
+            if isinstance(ref, str):
+                yield ref
+            pending.extend(item for item in current.values() if isinstance(item, (dict, list)))
+        elif isinstance(current, list):
+            pending.extend(item for item in current if isinstance(item, (dict, list)))
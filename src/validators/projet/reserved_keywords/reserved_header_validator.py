@@ -1,20 +1,25 @@
 from ..base_validator import BaseValidator
+from ..compiled_rules import ReservedWords
+from ..finding import Finding
+from ..operation_walker import OperationVisitor, OperationWalker
 
-class ReservedHeaderValidator(BaseValidator):
+class ReservedHeaderValidator(BaseValidator, OperationVisitor):
     """
     Valide les en-têtes définis dans le Swagger pour s'assurer qu'ils ne contiennent pas de mots réservés.
     """
 
+    cacheable = True
+
     def __init__(self, swagger_dict, swagger_text, reserved_headers):
         """
         Initialise le validateur d'en-têtes avec les en-têtes réservés.
         
-        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger.
+        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger, ou `SpecDocument` partagé.
         :param swagger_text: Chaîne de caractères contenant le texte brut du fichier Swagger.
-        :param reserved_headers: Liste des en-têtes réservés à valider.
+        :param reserved_headers: Liste des en-têtes réservés à valider (liste ou `ReservedWords`).
         """
         super().__init__(swagger_dict, swagger_text)
-        self.reserved_headers = reserved_headers
+        self.reserved_headers = ReservedWords.coerce(reserved_headers)
 
     def validate_reserved_headers(self):
         """
@@ -22,15 +27,18 @@ class ReservedHeaderValidator(BaseValidator):
         
         :return: Une liste d'erreurs trouvées lors de la validation des en-têtes réservés.
         """
-        errors = []
-        paths = self.swagger_dict.get('paths', {})
-        for path_data in paths.values():
-            for method_data in path_data.values():
-                for param in method_data.get('parameters', []):
-                    if param.get('in') == 'header':
-                        header_name = param.get('name')
-                        for reserved in self.reserved_headers:
-                            if reserved.lower() == header_name.lower():
-                                line_number = self._find_line_number(header_name)
-                                errors.append(f"Header '{header_name}' contient un mot réservé '{reserved}' (ligne {line_number})")
-        return errors
+        return self._render(OperationWalker([self]).walk(self.swagger_dict))
+
+    def visit_operation(self, operation):
+        """
+        Vérifie que les paramètres d'en-tête effectifs d'une opération (y compris ceux de son chemin) ne
+        portent pas un nom réservé.
+
+        :param operation: L'opération visitée.
+        :return: Un générateur des constats.
+        """
+        for entry in operation.parameters('header'):
+            header_name = entry.parameter['name']
+            for reserved in self.reserved_headers.match_name(header_name):
+                yield Finding("reserved.header", entry.pointer(operation.resolver, 'name'), operation.key,
+                              header_name, actual=reserved)
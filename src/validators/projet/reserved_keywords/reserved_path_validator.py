@@ -1,6 +1,11 @@
+from src.utils.position_index import json_pointer
+
 from ..base_validator import BaseValidator
+from ..compiled_rules import ReservedWords
+from ..finding import Finding
+from ..operation_walker import OperationVisitor, OperationWalker
 
-class ReservedPathValidator(BaseValidator):
+class ReservedPathValidator(BaseValidator, OperationVisitor):
     """
     Valide les chemins définis dans le Swagger pour s'assurer qu'ils ne contiennent pas de mots réservés.
     """
@@ -9,12 +14,12 @@ class ReservedPathValidator(BaseValidator):
         """
         Initialise le validateur de chemins avec les chemins réservés.
         
-        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger.
+        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger, ou `SpecDocument` partagé.
         :param swagger_text: Chaîne de caractères contenant le texte brut du fichier Swagger.
-        :param reserved_paths: Liste des chemins réservés à valider.
+        :param reserved_paths: Liste des chemins réservés à valider (liste ou `ReservedWords`).
         """
         super().__init__(swagger_dict, swagger_text)
-        self.reserved_paths = reserved_paths
+        self.reserved_paths = ReservedWords.coerce(reserved_paths)
 
     def validate_reserved_paths(self):
         """
@@ -22,10 +27,15 @@ class ReservedPathValidator(BaseValidator):
         
         :return: Une liste d'erreurs trouvées lors de la validation des chemins réservés.
         """
-        errors = []
-        for path in self.swagger_dict.get('paths', {}).keys():
-            for reserved in self.reserved_paths:
-                if reserved in path.split('/'):
-                    line_number = self._find_line_number(path)
-                    errors.append(f"Le chemin '{path}' contient un mot réservé '{reserved}' (ligne {line_number})")
-        return errors
+        return self._render(OperationWalker([self]).walk(self.swagger_dict))
+
+    def visit_path(self, path, path_item):
+        """
+        Vérifie qu'un chemin ne contient pas de mots réservés.
+
+        :param path: Le chemin visité.
+        :param path_item: Le dictionnaire du chemin.
+        :return: Un générateur des constats.
+        """
+        for reserved in self.reserved_paths.match_segments(path):
+            yield Finding("reserved.path", json_pointer('paths', path), subject=path, actual=reserved)
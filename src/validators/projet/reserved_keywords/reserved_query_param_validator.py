@@ -1,20 +1,25 @@
 from ..base_validator import BaseValidator
+from ..compiled_rules import ReservedWords
+from ..finding import Finding
+from ..operation_walker import OperationVisitor, OperationWalker
 
-class ReservedQueryParamValidator(BaseValidator):
+class ReservedQueryParamValidator(BaseValidator, OperationVisitor):
     """
     Valide les paramètres de requête définis dans le Swagger pour s'assurer qu'ils ne contiennent pas de mots réservés.
     """
 
+    cacheable = True
+
     def __init__(self, swagger_dict, swagger_text, reserved_query_parameters):
         """
         Initialise le validateur de paramètres de requête avec les paramètres réservés.
         
-        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger.
+        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger, ou `SpecDocument` partagé.
         :param swagger_text: Chaîne de caractères contenant le texte brut du fichier Swagger.
-        :param reserved_query_parameters: Liste des paramètres de requête réservés à valider.
+        :param reserved_query_parameters: Liste des paramètres de requête réservés à valider (liste ou `ReservedWords`).
         """
         super().__init__(swagger_dict, swagger_text)
-        self.reserved_query_parameters = reserved_query_parameters
+        self.reserved_query_parameters = ReservedWords.coerce(reserved_query_parameters)
 
     def validate_reserved_query_parameters(self):
         """
@@ -22,15 +27,18 @@ class ReservedQueryParamValidator(BaseValidator):
         
         :return: Une liste d'erreurs trouvées lors de la validation des paramètres de requête réservés.
         """
-        errors = []
-        paths = self.swagger_dict.get('paths', {})
-        for path, path_data in paths.items():
-            for method, method_data in path_data.items():
-                for param in method_data.get('parameters', []):
-                    if param.get('in') == 'query':
-                        param_name = param.get('name')
-                        for reserved in self.reserved_query_parameters:
-                            if reserved.lower() == param_name.lower():
-                                line_number = self._find_line_number(param_name)
-                                errors.append(f"Paramètre de requête '{param_name}' contient un mot réservé '{reserved}' (ligne {line_number}) dans {method.upper()} {path}")
-        return errors
+        return self._render(OperationWalker([self]).walk(self.swagger_dict))
+
+    def visit_operation(self, operation):
+        """
+        Vérifie que les paramètres de requête effectifs d'une opération (y compris ceux de son chemin) ne
+        portent pas un nom réservé.
+
+        :param operation: L'opération visitée.
+        :return: Un générateur des constats.
+        """
+        for entry in operation.parameters('query'):
+            param_name = entry.parameter['name']
+            for reserved in self.reserved_query_parameters.match_name(param_name):
+                yield Finding("reserved.query_parameter", entry.pointer(operation.resolver, 'name'), operation.key,
+                              param_name, actual=reserved)
@@ -1,77 +1,182 @@
 import re
 
+from itertools import islice
+
+from src.utils.position_index import json_pointer
+
 from ..base_validator import BaseValidator
+from ..finding import Finding
+
+# Échappements YAML et JSON nommés (par exemple "\t"), qui permettent d'écrire un caractère sans qu'il apparaisse dans le texte.
+_NAMED_ESCAPES = {
+    '\0': '0', '\a': 'a', '\b': 'b', '\t': 't', '\n': 'n', '\v': 'v', '\f': 'f', '\r': 'r', '\x1b': 'e',
+    ' ': ' ', '"': '"', '/': '/', '\\': '\\', '\x85': 'N', '\xa0': '_', '\u2028': 'L', '\u2029': 'P',
+}
+
+# Fin d'un conteneur lors du parcours itératif
+_END = object()
+
+def _escaped_forms(char):
+    """
+    Retourne les écritures échappées (JSON et YAML) d'un caractère, pour le préfiltre sur le texte brut.
+    """
+    code = ord(char)
+    forms = [f"\\u{code:04x}", f"\\U{code:08x}"]
+    if code <= 0xff:
+        forms.append(f"\\x{code:02x}")
+    if code > 0xffff:
+        # Paire de substitution UTF-16 d'un échappement JSON
+        high, low = divmod(code - 0x10000, 0x400)
+        forms.append(f"\\u{0xd800 + high:04x}\\u{0xdc00 + low:04x}")
+    if char in _NAMED_ESCAPES:
+        forms.append('\\' + _NAMED_ESCAPES[char])
+    return forms
 
 class SpecialCharacterValidator(BaseValidator):
     """
     Valide que les valeurs dans le Swagger ne contiennent pas de caractères spéciaux non autorisés.
+
+    Lorsque le document a été chargé depuis un fichier, son texte brut est d'abord parcouru : si aucun
+    caractère spécial n'y apparaît, ni directement ni sous une forme échappée, le parcours des valeurs
+    est évité. Le parcours lui-même est itératif (pas de limite de profondeur) et le chemin d'une
+    valeur n'est construit que lorsqu'elle contient un caractère spécial.
     """
 
     def __init__(self, swagger_dict, swagger_text, special_characters):
         """
         Initialise le validateur de caractères spéciaux.
         
-        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger.
+        :param swagger_dict: Dictionnaire contenant la représentation du fichier Swagger, ou `SpecDocument` partagé.
         :param swagger_text: Chaîne de caractères contenant le texte brut du fichier Swagger.
         :param special_characters: Liste des caractères spéciaux à valider.
         """
         super().__init__(swagger_dict, swagger_text)
         self.special_characters = special_characters
-        self.special_characters_pattern = re.compile(f"[{''.join(re.escape(char) for char in special_characters)}]")
+        if special_characters:
+            self.special_characters_pattern = re.compile(f"[{''.join(re.escape(char) for char in special_characters)}]")
+            candidates = [re.escape(char) for char in special_characters]
+            candidates += [re.escape(form) for char in special_characters for form in _escaped_forms(char)]
+            self.text_prefilter_pattern = re.compile('|'.join(candidates), re.IGNORECASE)
+        else:
+            self.special_characters_pattern = self.text_prefilter_pattern = None
 
-    def validate_all_values(self):
+    def validate_all_values(self, cache=None):
         """
         Valide toutes les valeurs dans le dictionnaire Swagger pour vérifier qu'elles ne contiennent pas de caractères spéciaux.
         
+        :param cache: (optionnel) `IncrementalCache` ; les résultats de chaque chemin de `paths` y sont mémorisés
+                      et seuls les chemins modifiés sont de nouveau parcourus.
         :return: Une liste d'erreurs si des caractères spéciaux sont trouvés, sinon une liste vide.
         """
+        return self._render(self.iter_findings(cache))
+
+    def iter_findings(self, cache=None, path_findings=None):
+        """
+        Recherche les valeurs du Swagger contenant des caractères spéciaux.
+
+        :param cache: (optionnel) `IncrementalCache`, voir `validate_all_values`.
+        :param path_findings: (optionnel) Constats des chemins de `paths` déjà recherchés, par exemple par
+                              tranches (voir `scan_paths`) ; `paths` n'est alors pas parcouru.
+        :return: La liste des constats (`Finding`).
+        """
+        if not self.may_match():
+            return []
+
         errors = []
-        self._check_dict(self.swagger_dict, errors)
+        if path_findings is not None:
+            for key, value in self.swagger_dict.items():
+                if key == 'paths' and isinstance(value, dict):
+                    errors.extend(path_findings)
+                else:
+                    self._scan(value, f"root.{key}", (key,), errors)
+            return errors
+        if cache is None:
+            self._scan(self.swagger_dict, "root", (), errors)
+            return errors
+
+        for key, value in self.swagger_dict.items():
+            new_path = f"root.{key}"
+            if key == 'paths' and isinstance(value, dict):
+                for path, path_item in value.items():
+                    path_item_path = f"{new_path}.{path}"
+                    cache_key = cache.make_key('special_characters', path_item, path_item_path, self.special_characters)
+                    errors.extend(cache.get_or_compute(
+                        cache_key, lambda: self._scan(path_item, path_item_path, ('paths', path), [])))
+            else:
+                self._scan(value, new_path, (key,), errors)
         return errors
 
-    def _check_dict(self, current_dict, errors, path="root"):
+    def scan_paths(self, start=0, stop=None):
         """
-        Parcourt de manière récursive un dictionnaire pour valider ses valeurs.
+        Recherche les caractères spéciaux dans une tranche des chemins de `paths`.
 
-        :param current_dict: Le dictionnaire actuel à vérifier.
-        :param errors: Liste d'erreurs accumulées.
-        :param path: Chemin actuel dans la structure du dictionnaire.
+        :param start: Position du premier chemin.
+        :param stop: (optionnel) Position du chemin auquel s'arrêter (exclu).
+        :return: La liste des constats, dans l'ordre du document.
         """
-        for key, value in current_dict.items():
-            new_path = f"{path}.{key}"
-            if isinstance(value, dict):
-                self._check_dict(value, errors, new_path)
-            elif isinstance(value, list):
-                self._check_list(value, errors, new_path)
-            else:
-                self._check_value(key, value, errors, new_path)
+        errors = []
+        for path, path_item in islice(self.swagger_dict['paths'].items(), start, stop):
+            self._scan(path_item, f"root.paths.{path}", ('paths', path), errors)
+        return errors
 
-    def _check_list(self, current_list, errors, path):
+    def may_match(self):
         """
-        Parcourt une liste pour valider ses valeurs.
+        Indique si le document peut contenir un caractère spécial (voir `_text_may_match`).
 
-        :param current_list: La liste actuelle à vérifier.
-        :param errors: Liste d'erreurs accumulées.
-        :param path: Chemin actuel dans la structure du dictionnaire.
+        :return: False si aucune recherche n'est nécessaire.
         """
-        for index, item in enumerate(current_list):
-            new_path = f"{path}[{index}]"
-            if isinstance(item, dict):
-                self._check_dict(item, errors, new_path)
-            elif isinstance(item, list):
-                self._check_list(item, errors, new_path)
-            else:
-                self._check_value(f"[{index}]", item, errors, new_path)
+        return self.special_characters_pattern is not None and self._text_may_match()
+
+    def _text_may_match(self):
+        """
+        Indique si le texte brut du document peut contenir un caractère spécial.
+
+        Le texte n'est pris en compte que pour un document chargé depuis un fichier : le texte fourni
+        avec un dictionnaire construit en mémoire peut ne pas lui correspondre.
+
+        :return: False seulement s'il est certain qu'aucune valeur ne contient de caractère spécial.
+        """
+        if self.document.source_path is None:
+            return True
+        return self.text_prefilter_pattern.search(self.document.text) is not None
 
-    def _check_value(self, key, value, errors, path):
+    def _scan(self, value, path, pointer_tokens, errors):
         """
-        Valide une valeur individuelle pour vérifier qu'elle ne contient pas de caractères spéciaux.
+        Parcourt une valeur et ses descendants avec une pile explicite.
 
-        :param key: Le nom du champ à vérifier.
-        :param value: La valeur à vérifier.
-        :param errors: Liste d'erreurs accumulées.
-        :param path: Chemin actuel dans la structure du dictionnaire.
+        :param value: La valeur à vérifier (dictionnaire, liste ou valeur simple).
+        :param path: Chemin de la valeur au format 'root.paths./pet.get'.
+        :param pointer_tokens: Clés menant à la valeur, pour son JSON pointer.
+        :param errors: Liste des constats accumulés.
+        :return: La liste `errors`.
         """
-        if isinstance(value, str) and self.special_characters_pattern.search(value):
-            errors.append(f"La valeur '{value}' sous le chemin '{path}' contient des caractères spéciaux non autorisés.")
+        search = self.special_characters_pattern.search
+        if not isinstance(value, (dict, list)):
+            if isinstance(value, str) and search(value):
+                errors.append(Finding("special_character", json_pointer(*pointer_tokens), subject=path, actual=value))
+            return errors
 
+        # iterators[i] parcourt le conteneur de profondeur i ; tokens[i] est sa clé (ou son index) courante.
+        iterators = [iter(value.items()) if isinstance(value, dict) else iter(enumerate(value))]
+        in_list = [isinstance(value, list)]
+        tokens = [None]
+        while iterators:
+            entry = next(iterators[-1], _END)
+            if entry is _END:
+                iterators.pop()
+                in_list.pop()
+                tokens.pop()
+                continue
+            tokens[-1], item = entry
+            if isinstance(item, dict):
+                iterators.append(iter(item.items()))
+                in_list.append(False)
+                tokens.append(None)
+            elif isinstance(item, list):
+                iterators.append(iter(enumerate(item)))
+                in_list.append(True)
+                tokens.append(None)
+            elif isinstance(item, str) and search(item):
+                item_path = path + ''.join(f"[{t}]" if is_index else f".{t}" for t, is_index in zip(tokens, in_list))
+                errors.append(Finding("special_character", json_pointer(*pointer_tokens, *tokens), subject=item_path, actual=item))
+        return errors
@@ -1,67 +1,174 @@
 from ..base_validator import BaseValidator
+from ..compiled_rules import CompiledRules
+from ..finding import Finding
+from ..operation_walker import OperationVisitor, OperationWalker
+
+# Valeur par défaut partagée (jamais modifiée) : les schémas comparés sont mémorisés par identité
+_EMPTY = {}
+
+# Écart (nature, chemin relatif du champ) -> identifiant de règle
+_RULE_IDS = {"type": "response.property_type", "missing": "response.property_missing",
+             "required": "response.property_required"}
+
+
+class _SchemaView:
+    """
+    Vue d'un schéma de la réponse dont les branches `allOf` (références résolues) sont fusionnées.
+    """
+
+    __slots__ = ('type', 'properties', 'required', 'items')
+
+    def __init__(self, schema, resolve):
+        self.type, self.properties, self.required, self.items = None, {}, set(), None
+        pending, seen = [schema], set()
+        while pending:
+            part = resolve(pending.pop(0))
+            if not isinstance(part, dict) or id(part) in seen:
+                continue
+            seen.add(id(part))
+            self.type = self.type or part.get("type")
+            properties = resolve(part.get("properties") or _EMPTY)
+            if isinstance(properties, dict):
+                for name, child in properties.items():
+                    self.properties.setdefault(name, child)
+            required = part.get("required")
+            if isinstance(required, list):
+                self.required.update(name for name in required if isinstance(name, str))
+            self.items = self.items or part.get("items")
+            branches = part.get("allOf")
+            if isinstance(branches, list):
+                pending.extend(branches)
+
+
+def _property_name(tokens):
+    """Nom d'un champ à partir de son chemin, par exemple ('data', '[]', 'id') -> 'data[].id'."""
+    name = ""
+    for token in tokens:
+        name += token if token == "[]" else (f".{token}" if name else token)
+    return name
+
+
+class ResponseValidator(BaseValidator, OperationVisitor):
+    """
+    Compare les schémas des réponses de chaque opération aux formats attendus par les règles du projet.
+
+    La comparaison est récursive : propriétés imbriquées, `items`, champs obligatoires (`required`) et
+    branches `allOf`, références résolues à chaque niveau. Elle porte sur chaque type de contenu de la
+    réponse. Le résultat de chaque comparaison est mémorisé pour le parcours sous la clé (identité du
+    schéma comparé, empreinte du format attendu) : un composant partagé, comme une enveloppe d'erreur
+    commune, n'est comparé qu'une fois par format attendu.
+    """
+
+    cacheable = True
 
-class ResponseValidator(BaseValidator):
     def __init__(self, swagger_dict, swagger_text, rules):
         super().__init__(swagger_dict, swagger_text)
-        self.rules = rules
+        self.rules = CompiledRules.coerce(rules)
 
     def validate_responses(self):
-        errors = []
-        paths = self.swagger_dict.get('paths', {})
-
-        for path, path_data in paths.items():
-            for method, method_data in path_data.items():
-                method_upper = method.upper()
-                if method_upper in self.rules:
-                    for expected_response in self.rules[method_upper].get("responses", []):
-                        response_code = str(expected_response["response_code"])
-                        actual_response = method_data.get('responses', {}).get(response_code, {})
-                        if not actual_response:
-                            errors.append(f"La réponse pour le code '{response_code}' est manquante dans {method_upper} {path}.")
-                        else:
-                            content_type = next(iter(actual_response.get("content", {}).keys()), None)
-                            actual_schema = actual_response.get("content", {}).get(content_type, {}).get("schema", {})
-                            expected_schema = expected_response["format"]
-
-                            errors.extend(self._validate_response_schema(actual_schema, expected_schema, response_code, method, path))
-        return errors
-
-    def _validate_response_schema(self, actual_schema, expected_schema, response_code, method, path):
-        errors = []
-
-        def format_rule():
-            return (
-                f"Le schéma de la réponse pour le code '{response_code}' dans {method.upper()} {path} devrait être :\n"
-                f"{expected_schema}\n"
-            )
-
-        actual_type = actual_schema.get("type")
-        expected_type = expected_schema.get("type")
-
-        if expected_type and actual_type != expected_type:
-            # Ne pas signaler d'erreur si le schéma attendu est vide
-            if not actual_schema and expected_schema == {}:
-                return errors
-            errors.append(
-                f"Le type de la réponse pour le code '{response_code}' dans {method.upper()} {path} est '{actual_type}', "
-                f"mais il devrait être '{expected_type}'.\n{format_rule()}"
-            )
-
-        if expected_schema.get("properties"):
-            for prop, prop_expected_schema in expected_schema.get("properties", {}).items():
-                actual_prop_schema = actual_schema.get("properties", {}).get(prop)
-                if not actual_prop_schema:
-                    errors.append(f"Le champ '{prop}' est manquant dans la réponse pour le code '{response_code}' dans {method.upper()} {path}.\n{format_rule()}")
-                else:
-                    if prop_expected_schema.get("type") and actual_prop_schema.get("type") != prop_expected_schema["type"]:
-                        errors.append(
-                            f"Le type du champ '{prop}' dans la réponse pour le code '{response_code}' dans {method.upper()} {path} est '{actual_prop_schema.get('type')}', "
-                            f"mais il devrait être '{prop_expected_schema['type']}'.\n{format_rule()}"
-                        )
-
-        if expected_schema.get("items"):
-            actual_items_schema = actual_schema.get("items", {})
-
-            errors.extend(self._validate_response_schema(actual_items_schema, expected_schema["items"], response_code, method, path))
-
-        return errors
+        return self._render(OperationWalker([self]).walk(self.swagger_dict))
+
+    def visit_operation(self, operation):
+        method_rules = self.rules.for_method(operation.method_upper)
+        if method_rules is None:
+            return
+        responses = operation.resolve(operation.data.get('responses', _EMPTY))
+        if not isinstance(responses, dict):
+            # `responses` mal formé (liste, valeur scalaire) : les réponses attendues sont signalées manquantes
+            responses = _EMPTY
+        for response_code, expected_schema, expected in method_rules.responses:
+            actual_response = operation.resolve(responses.get(response_code, _EMPTY))
+            if not actual_response or not isinstance(actual_response, dict):
+                yield Finding("response.missing", operation.pointer('responses'), operation.key,
+                              details={"code": response_code})
+                continue
+
+            pointer = operation.pointer('responses', response_code)
+            compared = set()
+            for media_type, actual_schema in self._media_schemas(actual_response, operation):
+                # Un même schéma partagé par plusieurs types de contenu n'est signalé qu'une fois
+                if id(actual_schema) in compared:
+                    continue
+                compared.add(id(actual_schema))
+                details = {"code": response_code, "schema": expected_schema}
+                if media_type is not None:
+                    details["media_type"] = media_type
+                for kind, tokens, expected_value, actual_value in self._compare(actual_schema, expected, operation):
+                    rule_id, name = self._rule(kind, tokens)
+                    yield Finding(rule_id, pointer, operation.key, name, expected_value, actual_value, details)
+
+    @staticmethod
+    def _media_schemas(response, operation):
+        """
+        Énumère les schémas (références résolues) de chaque type de contenu d'une réponse ; une réponse
+        sans contenu est comparée comme un schéma vide.
+        """
+        content = operation.resolve(response.get("content", _EMPTY))
+        if not isinstance(content, dict) or not content:
+            return [(None, _EMPTY)]
+        schemas = []
+        for media_type, media in content.items():
+            media = operation.resolve(media)
+            schema = media.get("schema", _EMPTY) if isinstance(media, dict) else _EMPTY
+            schemas.append((media_type, operation.resolve(schema)))
+        return schemas
+
+    @staticmethod
+    def _rule(kind, tokens):
+        """
+        Retourne l'identifiant de règle et le nom du champ d'un écart. Les `items` du schéma racine sont
+        désignés comme la réponse elle-même.
+        """
+        while tokens and tokens[0] == "[]":
+            tokens = tokens[1:]
+        if not tokens:
+            return "response.type", None
+        return _RULE_IDS[kind], _property_name(tokens)
+
+    def _compare(self, actual_schema, expected, operation):
+        """
+        Retourne les écarts mémorisés entre un schéma de la réponse (référence résolue) et un format attendu.
+        """
+        return operation.resolver.memoize(
+            ("response", id(actual_schema), expected.fingerprint),
+            lambda: tuple(self._compare_response_schema(actual_schema, expected, operation)))
+
+    def _view(self, schema, operation):
+        return operation.resolver.memoize(("response_view", id(schema)), lambda: _SchemaView(schema, operation.resolve))
+
+    def _compare_response_schema(self, actual_schema, expected, operation):
+        """
+        Compare un schéma de la réponse à un format attendu (`ExpectedSchema`).
+
+        :return: Un générateur de tuples (nature de l'écart, chemin relatif du champ, attendu, trouvé),
+                 la nature étant 'type', 'missing' ou 'required'.
+        """
+        view = self._view(actual_schema, operation)
+
+        if expected.type and view.type != expected.type:
+            yield "type", (), expected.type, view.type
+
+        for name, child in expected.properties:
+            actual_child = operation.resolve(view.properties.get(name))
+            if not actual_child:
+                yield "missing", (name,), None, None
+            elif child.structured:
+                for kind, tokens, expected_value, actual_value in self._compare(actual_child, child, operation):
+                    yield kind, (name, *tokens), expected_value, actual_value
+            elif child.type:
+                actual_type = self._view(actual_child, operation).type
+                if actual_type != child.type:
+                    yield "type", (name,), child.type, actual_type
+
+        expected_names = {name for name, _ in expected.properties}
+        for name in expected.required:
+            if name not in view.properties:
+                if name not in expected_names:
+                    yield "missing", (name,), None, None
+            elif name not in view.required:
+                yield "required", (name,), None, None
+
+        if expected.items:
+            actual_items = operation.resolve(view.items or _EMPTY)
+            for kind, tokens, expected_value, actual_value in self._compare(actual_items, expected.items, operation):
+                yield kind, ("[]", *tokens), expected_value, actual_value
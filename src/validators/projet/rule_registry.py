@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+import threading
+
+from .compiled_rules import CompiledRules
+
+
+class _Entry:
+    """
+    Règles compilées d'un fichier, avec la signature et l'empreinte du contenu dont elles proviennent.
+    """
+
+    __slots__ = ('signature', 'digest', 'rules')
+
+    def __init__(self, signature, digest, rules):
+        self.signature = signature
+        self.digest = digest
+        self.rules = rules
+
+
+class RuleRegistry:
+    """
+    Registre des règles du projet compilées (`CompiledRules`), partagé par tout le processus.
+
+    Chaque fichier de règles n'est lu et compilé qu'une fois. À chaque demande, la date de modification,
+    la taille et l'inode du fichier sont comparés à ceux de la dernière lecture : s'ils n'ont pas changé,
+    les règles compilées sont retournées sans lire le fichier. Sinon, le fichier est relu et les règles ne
+    sont recompilées que si l'empreinte (SHA-256) de son contenu a changé. Tant que le fichier ne change
+    pas, le même objet `CompiledRules` est donc retourné, ce qui permet aux appelants de détecter un
+    rechargement par simple comparaison d'identité.
+
+    Les règles compilées ne sont jamais modifiées après leur construction : elles sont partagées sans
+    copie entre les threads, et transmises telles quelles (sérialisées une fois) aux processus de travail.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, rules_path):
+        """
+        Retourne les règles compilées d'un fichier, rechargées s'il a changé depuis la dernière demande.
+
+        :param rules_path: Chemin du fichier JSON des règles.
+        :raises FileNotFoundError: Si le fichier n'est pas trouvé.
+        :raises ValueError: Si le fichier n'est pas un JSON valide.
+        :return: Le `CompiledRules` du fichier.
+        """
+        rules_path = os.path.abspath(rules_path)
+        try:
+            stat = os.stat(rules_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Validation rules file not found: {rules_path}")
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        entry = self._entries.get(rules_path)
+        if entry is not None and entry.signature == signature:
+            return entry.rules
+
+        with self._lock:
+            entry = self._entries.get(rules_path)
+            if entry is not None and entry.signature == signature:
+                return entry.rules
+            with open(rules_path, 'rb') as file:
+                content = file.read()
+            digest = hashlib.sha256(content).hexdigest()
+            if entry is not None and entry.digest == digest:
+                # Fichier touché ou réécrit à l'identique : les règles compilées restent valables.
+                rules = entry.rules
+            else:
+                rules = CompiledRules(json.loads(content))
+            self._entries[rules_path] = _Entry(signature, digest, rules)
+            return rules
+
+    def clear(self):
+        """
+        Oublie toutes les règles compilées ; elles seront relues à la prochaine demande.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# Registre partagé par toutes les validations du processus.
+_registry = RuleRegistry()
+
+def get_compiled_rules(rules_path):
+    """
+    Retourne les règles compilées d'un fichier depuis le registre du processus (voir `RuleRegistry.get`).
+
+    :param rules_path: Chemin du fichier JSON des règles.
+    :raises FileNotFoundError: Si le fichier n'est pas trouvé.
+    :raises ValueError: Si le fichier n'est pas un JSON valide.
+    :return: Le `CompiledRules` du fichier.
+    """
+    return _registry.get(rules_path)
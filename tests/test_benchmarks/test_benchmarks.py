@@ -0,0 +1,43 @@
+import json
+import pytest
+
+from benchmarks.run_benchmarks import compare, run
+from benchmarks.spec_generator import generate_spec, write_spec
+from src.utils.swagger_loader import load_swagger_document
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator
+
+@pytest.fixture
+def rules():
+    with open('config/projet_validation_rules.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def test_generator_is_deterministic(rules):
+    assert generate_spec(40, seed=3, violation_rate=0.3, rules=rules) == generate_spec(40, seed=3, violation_rate=0.3, rules=rules)
+    assert generate_spec(40, seed=3, violation_rate=0.3, rules=rules) != generate_spec(40, seed=4, violation_rate=0.3, rules=rules)
+
+def test_generator_shape(rules):
+    spec = generate_spec(25, parameters=3, ref_fanout=1.0, nesting_depth=4, rules=rules)
+    operations = [operation for path_item in spec["paths"].values() for operation in path_item.values()]
+    assert len(operations) == 25
+    assert all(len(operation["parameters"]) == len(rules["GET"]["headers"]) + 3 for operation in operations)
+    assert all("$ref" in parameter for operation in operations for parameter in operation["parameters"])
+    assert "Item4" in spec["components"]["schemas"]
+
+def test_generated_spec_violations(rules, tmp_path):
+    clean = generate_spec(50, violation_rate=0.0, rules=rules)
+    assert list(ProjetRulesValidator(clean, "", rules=rules).iter_errors()) == []
+
+    spec_file = str(tmp_path / "spec.yaml")
+    write_spec(generate_spec(50, violation_rate=1.0, rules=rules), spec_file)
+    findings = list(ProjetRulesValidator(load_swagger_document(spec_file), None, rules=rules).iter_findings())
+    assert len(findings) >= 50
+
+def test_harness_and_regression_check(rules):
+    current = run(sizes=[10], repeat=1, rules=rules)
+    cases = current["results"]["10"]
+    assert {"load_swagger.json", "load_swagger.yaml", "openapi", "projet.header", "projet.all"} <= set(cases)
+    assert all(measurement["seconds"] >= 0 and measurement["peak_mib"] >= 0 for measurement in cases.values())
+
+    assert compare(current, current) == []
+    faster = {"results": {"10": {"openapi": {"seconds": cases["openapi"]["seconds"] / 10 - 1, "peak_mib": 1000}}}}
+    assert len(compare(current, faster)) == 1
@@ -0,0 +1,31 @@
+import json
+import pytest
+
+from benchmarks.import_time import heavy_imports, import_times
+
+# Temps cumulé maximal de l'import de la ligne de commande (une cinquantaine de millisecondes en pratique).
+MAX_CLI_IMPORT_SECONDS = 0.25
+
+@pytest.mark.parametrize("module", [
+    "src.cli.command_line",
+    "src.validators.projet.projet_rules_validator",
+    "src.validators.openapi.openapi_validator",
+    "src.utils.swagger_loader",
+])
+def test_heavy_dependencies_are_not_imported(module):
+    assert heavy_imports(import_times(f"import {module}")) == []
+
+def test_command_line_import_time():
+    times = import_times("import src.cli.command_line")
+    assert times["src.cli.command_line"][1] / 1e6 < MAX_CLI_IMPORT_SECONDS
+
+def test_projet_only_check_of_json_spec(tmp_path):
+    spec = tmp_path / "spec.json"
+    spec.write_text(json.dumps({"openapi": "3.1.0", "info": {"title": "api", "version": "v1"}, "paths": {}}))
+    times = import_times(f"from src.cli.command_line import main; main(['check', {str(spec)!r}, '--skip-openapi', '--jobs', '1'])")
+    assert heavy_imports(times) == []
+
+def test_openapi_validation_imports_its_dependencies_on_first_use():
+    times = import_times("from src.validators.openapi.openapi_validator import OpenAPIValidator; "
+                         "list(OpenAPIValidator({'openapi': '3.1.0', 'info': {}, 'paths': {}}, None).iter_records())")
+    assert {"jsonschema", "openapi_spec_validator"} <= set(heavy_imports(times))
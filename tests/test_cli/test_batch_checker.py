@@ -0,0 +1,80 @@
+import json
+import pytest
+
+import src.cli.batch_checker as batch_checker
+from src.cli.batch_checker import check_specs, discover_specs
+from src.cli.command_line import main
+
+VALID_SPEC = {
+    "openapi": "3.1.0",
+    "info": {"title": "api", "version": "v1", "description": "API de test"},
+    "basePath": "/api/v1",
+    "paths": {}
+}
+
+@pytest.fixture
+def specs_dir(tmp_path):
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "valid.json").write_text(json.dumps(VALID_SPEC))
+    (tmp_path / "nested" / "invalid.yaml").write_text("openapi: 3.1.0\ninfo:\n  title: api\n  version: '1.0'\npaths: {}\n")
+    (tmp_path / "notes.txt").write_text("pas un swagger")
+    return tmp_path
+
+@pytest.fixture
+def rules():
+    with open('config/projet_validation_rules.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def test_discover_specs(specs_dir):
+    files = discover_specs([str(specs_dir), str(specs_dir / "*.json")])
+    assert files == [str(specs_dir / "valid.json"), str(specs_dir / "nested" / "invalid.yaml")]
+
+def test_check_specs_in_process_pool(specs_dir, rules):
+    files = discover_specs([str(specs_dir)])
+    records = list(check_specs(files, rules, jobs=2))
+    assert [record["file"] for record in records] == files
+    assert records[0]["projet"]["valid"] is True
+    assert records[1]["valid"] is False
+    assert "La version du Swagger doit commencer par 'v' suivi d'un chiffre." in records[1]["projet"]["errors"]
+
+def test_check_command_writes_jsonl(specs_dir, capsys):
+    main(["check", str(specs_dir / "valid.json"), "--jobs", "1"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(records) == 1
+    assert records[0]["file"] == str(specs_dir / "valid.json")
+    assert records[0]["projet"] == {"valid": True, "errors": []}
+
+def test_check_command_exit_codes(specs_dir, tmp_path, capsys):
+    assert main(["check", str(specs_dir), "--jobs", "2"]) == 1
+    assert main(["check", str(tmp_path / "absent")]) == 2
+
+def test_unreadable_spec_is_reported(tmp_path, rules):
+    broken = tmp_path / "broken.json"
+    broken.write_text("{")
+    record = next(check_specs([str(broken)], rules))
+    assert record["valid"] is False
+    assert "Failed to load Swagger file" in record["error"]
+
+def test_projet_validation_error_does_not_stop_the_batch(specs_dir, rules, monkeypatch):
+    iter_errors = batch_checker.ProjetRulesValidator.iter_errors
+
+    def fail_on_bad_spec(validator, *args):
+        if validator.document.source_path.endswith("bad.json"):
+            raise AttributeError("'list' object has no attribute 'get'")
+        return iter_errors(validator, *args)
+    monkeypatch.setattr(batch_checker.ProjetRulesValidator, "iter_errors", fail_on_bad_spec)
+    (specs_dir / "bad.json").write_text(json.dumps(VALID_SPEC))
+
+    files = discover_specs([str(specs_dir)])
+    records = list(check_specs(files, rules, openapi=False))
+    assert [record["file"] for record in records] == files
+    bad = records[files.index(str(specs_dir / "bad.json"))]
+    assert bad == {"file": str(specs_dir / "bad.json"), "valid": False,
+                   "error": "Erreur lors de la validation des règles du projet: 'list' object has no attribute 'get'"}
+    assert records[files.index(str(specs_dir / "valid.json"))]["valid"] is True
+
+def test_check_command_skip_openapi(specs_dir, capsys):
+    assert main(["check", str(specs_dir / "valid.json"), "--skip-openapi", "--jobs", "1"]) == 0
+    record = json.loads(capsys.readouterr().out)
+    assert "openapi" not in record
+    assert record["valid"] is True and record["projet"] == {"valid": True, "errors": []}
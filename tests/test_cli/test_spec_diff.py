@@ -0,0 +1,121 @@
+import copy
+import json
+import pytest
+
+from src.cli.command_line import main
+from src.cli.spec_diff import diff_specs
+
+SPEC = {
+    "openapi": "3.1.0",
+    "info": {"title": "api", "version": "v1"},
+    "paths": {
+        "/api/v1/users": {
+            "get": {
+                "parameters": [{"name": "page", "in": "query", "schema": {"type": "integer"}}],
+                "responses": {"200": {"content": {"application/json": {
+                    "schema": {"$ref": "#/components/schemas/User"}}}}}
+            }
+        },
+        "/api/v1/orders": {
+            "get": {"responses": {"200": {"description": "ok"}}},
+            "delete": {"responses": {"204": {"description": "supprimé"}}}
+        }
+    },
+    "components": {"schemas": {"User": {
+        "type": "object",
+        "properties": {"id": {"type": "string"}, "name": {"type": "string"}}
+    }}}
+}
+
+@pytest.fixture
+def new_spec():
+    return copy.deepcopy(SPEC)
+
+def kinds(result):
+    return [change.kind for change in result.changes]
+
+def test_identical_specs_are_skipped(new_spec):
+    result = diff_specs(SPEC, new_spec)
+    assert result.changes == []
+    assert (result.unchanged, result.compared) == (3, 0)
+
+def test_key_order_does_not_matter():
+    reordered = json.loads(json.dumps(SPEC, sort_keys=True))
+    assert diff_specs(SPEC, reordered).compared == 0
+
+def test_removed_and_added_paths_and_operations(new_spec):
+    del new_spec["paths"]["/api/v1/orders"]["delete"]
+    new_spec["paths"]["/api/v1/orders"]["post"] = {"responses": {"201": {"description": "créé"}}}
+    new_spec["paths"]["/api/v1/items"] = new_spec["paths"].pop("/api/v1/users")
+    result = diff_specs(SPEC, new_spec)
+    assert kinds(result) == ["path.removed", "operation.removed", "path.added", "operation.added"]
+    assert [change.breaking for change in result.changes] == [True, True, False, False]
+
+def test_required_parameter_added_is_breaking(new_spec):
+    parameters = new_spec["paths"]["/api/v1/users"]["get"]["parameters"]
+    parameters.append({"name": "X-Tenant", "in": "header", "required": True, "schema": {"type": "string"}})
+    parameters.append({"name": "sort", "in": "query", "schema": {"type": "string"}})
+    parameters[0]["schema"]["type"] = "string"
+    result = diff_specs(SPEC, new_spec)
+    assert kinds(result) == ["parameter.type_changed", "parameter.added", "parameter.added_required"]
+    assert [change.breaking for change in result.changes] == [True, False, True]
+    assert result.changes[0].render() == ("Le type du paramètre 'page' (query) de GET /api/v1/users est passé "
+                                          "de 'integer' à 'string'.")
+
+def test_shared_component_change_reaches_every_operation_using_it(new_spec):
+    properties = new_spec["components"]["schemas"]["User"]["properties"]
+    del properties["name"]
+    properties["id"]["type"] = "integer"
+    properties["email"] = {"type": "string"}
+    result = diff_specs(SPEC, new_spec)
+    assert (result.unchanged, result.compared) == (2, 1)
+    assert kinds(result) == ["response.property_removed", "response.property_added", "response.type_changed"]
+    assert [change.name for change in result.changes] == ["name", "email", "id"]
+    assert len(result.breaking) == 2
+
+def test_request_body_property_now_required_is_breaking(new_spec):
+    body = {"content": {"application/json": {"schema": {"type": "object", "properties": {
+        "name": {"type": "string"}, "email": {"type": "string"}, "address": {"type": "object", "properties": {
+            "city": {"type": "string"}}}}, "required": ["email"]}}}}
+    old_spec = copy.deepcopy(SPEC)
+    old_spec["paths"]["/api/v1/users"]["post"] = {"requestBody": body, "responses": {"201": {"description": "créé"}}}
+    new_spec["paths"]["/api/v1/users"]["post"] = copy.deepcopy(old_spec["paths"]["/api/v1/users"]["post"])
+    schema = new_spec["paths"]["/api/v1/users"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+    schema["required"] = ["name", "email"]
+    schema["properties"]["address"]["required"] = ["city"]
+    result = diff_specs(old_spec, new_spec)
+    assert kinds(result) == ["request_body.property_now_required", "request_body.property_now_required"]
+    assert [change.name for change in result.changes] == ["name", "address.city"]
+    assert all(change.breaking for change in result.changes)
+    assert result.changes[0].render() == ("Le champ 'name' du corps de la requête de POST /api/v1/users "
+                                          "est devenu obligatoire.")
+
+def test_documentation_only_change_is_compatible(new_spec):
+    new_spec["paths"]["/api/v1/orders"]["get"]["summary"] = "Liste des commandes"
+    result = diff_specs(SPEC, new_spec)
+    assert kinds(result) == ["operation.changed"]
+    assert result.breaking == []
+
+@pytest.fixture
+def spec_files(tmp_path, new_spec):
+    old, new = tmp_path / "old.json", tmp_path / "new.json"
+    old.write_text(json.dumps(SPEC))
+    del new_spec["paths"]["/api/v1/orders"]["delete"]
+    new.write_text(json.dumps(new_spec))
+    return str(old), str(new)
+
+def test_diff_command(spec_files, capsys):
+    old, new = spec_files
+    assert main(["diff", old, old]) == 0
+    assert main(["diff", old, new]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[-2] == "[cassant] L'opération DELETE /api/v1/orders a été supprimée."
+    assert lines[-1] == "1 changement(s) dont 1 cassant(s) ; 2 opération(s) inchangée(s)."
+
+def test_diff_command_json(spec_files, tmp_path, capsys):
+    old, new = spec_files
+    assert main(["diff", old, new, "--json"]) == 1
+    result = json.loads(capsys.readouterr().out)
+    assert result["breaking"] is True
+    assert [change["kind"] for change in result["changes"]] == ["operation.removed"]
+    assert main(["diff", old, str(tmp_path / "absent.json")]) == 2
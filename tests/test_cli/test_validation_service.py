@@ -0,0 +1,121 @@
+import http.client
+import json
+import threading
+import pytest
+
+from src.cli.command_line import main
+from src.cli.validation_service import ValidationService, create_server, request_check
+from src.validators.projet.responses.response_validator import ResponseValidator
+
+VALID_SPEC = {
+    "openapi": "3.1.0",
+    "info": {"title": "api", "version": "v1", "description": "API de test"},
+    "basePath": "/api/v1",
+    "paths": {}
+}
+
+@pytest.fixture(scope="module")
+def service():
+    return ValidationService('config/projet_validation_rules.json')
+
+@pytest.fixture
+def server(service):
+    server = create_server(service, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def specs(tmp_path):
+    (tmp_path / "valid.json").write_text(json.dumps(VALID_SPEC))
+    (tmp_path / "invalid.yaml").write_text("openapi: 3.1.0\ninfo:\n  title: api\n  version: '1.0'\npaths: {}\n")
+    (tmp_path / "broken.json").write_text("{")
+    return tmp_path
+
+def test_batch_request_returns_structured_findings(server, specs):
+    files = [str(specs / "valid.json"), str(specs / "invalid.yaml"), str(specs / "broken.json")]
+    records = request_check(files, *server.server_address[:2])
+    assert [record["file"] for record in records] == files
+    assert records[0]["projet"] == {"valid": True, "errors": [], "findings": []}
+    assert records[0]["openapi"]["findings"][0]["pointer"] == ""
+    assert records[1]["projet"]["valid"] is False
+    assert {"rule_id": "info.version", "severity": "error", "pointer": "/info/version",
+            "message": "La version du Swagger doit commencer par 'v' suivi d'un chiffre."} in records[1]["projet"]["findings"]
+    assert "Failed to load Swagger file" in records[2]["error"]
+
+def test_projet_validation_error_is_reported_per_file(service, monkeypatch):
+    def fail(validator, operation):
+        raise AttributeError("'list' object has no attribute 'get'")
+    monkeypatch.setattr(ResponseValidator, "visit_operation", fail)
+    spec = dict(VALID_SPEC, paths={"/pet": {"get": {"responses": {}}}})
+    records = service.check_request({"specs": [{"name": "odd.json", "content": json.dumps(spec)},
+                                               {"name": "api.json", "content": json.dumps(VALID_SPEC)}]})
+    assert records[0]["valid"] is False
+    assert records[0]["error"].startswith("Erreur lors de la validation des règles du projet")
+    assert records[1]["projet"]["valid"] is True
+
+def test_rules_edits_are_picked_up_by_a_running_service(tmp_path):
+    rules_path = tmp_path / "rules.json"
+    with open('config/projet_validation_rules.json', encoding='utf-8') as file:
+        rules = json.load(file)
+    rules_path.write_text(json.dumps(rules))
+    service = ValidationService(str(rules_path))
+    spec = dict(VALID_SPEC, paths={"/api/v1/secret": {}})
+    request = {"name": "api.json", "content": json.dumps(spec)}
+    assert service.check_request(request)[0]["projet"]["valid"] is True
+
+    rules["reserved_paths"] = list(rules.get("reserved_paths", [])) + ["secret"]
+    rules_path.write_text(json.dumps(rules) + " ")
+    assert service.check_request(request)[0]["projet"]["valid"] is False
+
+    rules_path.write_text("{")
+    with pytest.raises(RuntimeError, match="Règles du projet illisibles"):
+        service.check_request(request)
+
+def test_single_spec_request_and_errors(server):
+    connection = http.client.HTTPConnection(*server.server_address[:2])
+    connection.request("POST", "/check", json.dumps({"name": "api.json", "content": json.dumps(VALID_SPEC)}))
+    response = connection.getresponse()
+    assert response.status == 200
+    assert json.loads(response.read())["results"][0]["file"] == "api.json"
+
+    connection.request("POST", "/check", json.dumps({"specs": [{"name": "api.json"}]}))
+    response = connection.getresponse()
+    assert response.status == 400
+    response.read()
+
+    connection.request("GET", "/health")
+    assert json.loads(connection.getresponse().read())["status"] == "ok"
+    connection.close()
+
+def test_unix_socket(service, specs, tmp_path):
+    socket_path = str(tmp_path / "service.sock")
+    server = create_server(service, socket_path=socket_path)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        records = request_check([str(specs / "valid.json")], socket_path=socket_path)
+        assert records[0]["projet"]["valid"] is True
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_existing_file_is_not_replaced_by_the_socket(service, tmp_path):
+    important = tmp_path / "important.json"
+    important.write_text("{}")
+    with pytest.raises(ValueError, match="n'est pas une socket"):
+        create_server(service, socket_path=str(important))
+    assert important.read_text() == "{}"
+
+def test_only_loopback_addresses_are_accepted(service):
+    with pytest.raises(ValueError):
+        create_server(service, "0.0.0.0", 0)
+
+def test_client_command(server, specs, capsys):
+    host, port = server.server_address[:2]
+    # `basePath` n'est pas autorisé par OpenAPI 3.1 : le fichier n'est conforme qu'aux règles du projet
+    assert main(["client", str(specs / "valid.json"), "--host", host, "--port", str(port)]) == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records[0]["projet"] == {"valid": True, "errors": [], "findings": []}
+    assert main(["client", str(specs / "absent"), "--host", host, "--port", str(port)]) == 2
@@ -0,0 +1,129 @@
+import json
+import threading
+import time
+import pytest
+
+import src.cli.watch as watch
+from src.cli.command_line import run_watch
+from src.cli.watch import WatchSession, watch_specs
+from src.utils.file_watcher import FileWatcher
+from src.validators.projet.rule_registry import get_compiled_rules
+
+VALID_SPEC = {
+    "openapi": "3.1.0",
+    "info": {"title": "api", "version": "v1", "description": "API de test"},
+    "basePath": "/api/v1",
+    "paths": {}
+}
+
+@pytest.fixture
+def spec_file(tmp_path):
+    path = tmp_path / "api.json"
+    path.write_text(json.dumps(VALID_SPEC))
+    return path
+
+@pytest.fixture
+def rules_file(tmp_path):
+    with open('config/projet_validation_rules.json', 'r', encoding='utf-8') as f:
+        rules = json.load(f)
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(rules))
+    return path
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_file_watcher_debounces_bursts(tmp_path, spec_file, use_inotify):
+    with FileWatcher([str(spec_file)], debounce=0.05, poll_interval=0.02, use_inotify=use_inotify) as watcher:
+        assert watcher.wait(timeout=0.05) == set()
+
+        def save():
+            for index in range(3):
+                spec_file.write_text(json.dumps(dict(VALID_SPEC, version=index)))
+                time.sleep(0.01)
+            (tmp_path / "other.txt").write_text("ignoré")
+
+        threading.Timer(0.05, save).start()
+        assert watcher.wait(timeout=2) == {str(spec_file)}
+        assert watcher.wait(timeout=0.1) == set()
+
+def test_session_reparses_only_changed_content(spec_file, rules_file, monkeypatch):
+    session = WatchSession(str(spec_file), str(rules_file))
+    openapi_runs = []
+    validate_openapi = watch.validate_openapi
+    monkeypatch.setattr(watch, "validate_openapi", lambda document: openapi_runs.append(1) or validate_openapi(document))
+
+    record = session.refresh()
+    assert record["projet"] == {"valid": True, "errors": []}
+    assert len(openapi_runs) == 1
+
+    # Même contenu réécrit : rien n'est revalidé
+    spec_file.write_text(json.dumps(VALID_SPEC))
+    assert session.refresh({session.spec_path}) is None
+
+    # Seules les règles changent : la validation OpenAPI n'est pas refaite
+    rules = json.loads(rules_file.read_text())
+    rules["reserved_paths"].append("v1")
+    rules_file.write_text(json.dumps(rules))
+    record = session.refresh({session.rules_path})
+    assert record["changed"] == [session.rules_path]
+    assert len(openapi_runs) == 1
+
+    spec_file.write_text(json.dumps(dict(VALID_SPEC, info={"title": "api", "version": "1.0", "description": "API"})))
+    record = session.refresh({session.spec_path})
+    assert len(openapi_runs) == 2
+    assert "La version du Swagger doit commencer par 'v' suivi d'un chiffre." in record["projet"]["errors"]
+
+def test_session_reads_the_spec_once_and_shares_compiled_rules(spec_file, rules_file, monkeypatch):
+    session = WatchSession(str(spec_file), str(rules_file))
+    opened = []
+    monkeypatch.setattr(watch, "open", lambda path, *args: opened.append(path) or open(path, *args), raising=False)
+
+    session.refresh()
+    assert opened == [session.spec_path]
+    assert session.document.raw == spec_file.read_bytes()
+    assert session._rules is get_compiled_rules(str(rules_file))
+
+    # Règles réécrites à l'identique : le registre retourne les mêmes règles, rien n'est revalidé
+    rules_file.write_text(rules_file.read_text())
+    assert session.refresh({session.rules_path}) is None
+
+def test_session_reports_unreadable_files(spec_file, rules_file):
+    session = WatchSession(str(spec_file), str(rules_file))
+    rules_file.write_text("{")
+    assert "Failed to load validation rules" in session.refresh()["error"]
+    spec_file.write_text("{")
+    record = session.refresh({session.spec_path})
+    assert "Failed to load Swagger file" in record["error"]
+
+    spec_file.write_text(json.dumps(VALID_SPEC))
+    assert "Failed to load validation rules" in session.refresh({session.spec_path})["error"]
+    rules_file.write_text(json.dumps({}))
+    assert session.refresh({session.rules_path})["projet"]["valid"] is True
+
+def test_watch_specs_yields_record_per_save(spec_file, rules_file):
+    watcher = FileWatcher([str(spec_file), str(rules_file)], debounce=0.02)
+    records = watch_specs([str(spec_file)], str(rules_file), watcher)
+    assert next(records)["projet"]["valid"] is True
+
+    threading.Timer(0.05, lambda: spec_file.write_text("{")).start()
+    started = time.monotonic()
+    record = next(records)
+    assert "Failed to load Swagger file" in record["error"]
+    assert time.monotonic() - started < 2
+
+    watcher.stop()
+    assert list(records) == []
+
+def test_run_watch_writes_jsonl(spec_file, rules_file):
+    class Output:
+        lines = []
+        def write(self, text):
+            self.lines.append(text)
+        def flush(self):
+            pass
+
+    watcher = FileWatcher([str(spec_file), str(rules_file)])
+    watcher.stop()
+    out = Output()
+    # Le Swagger de test n'est pas conforme à OpenAPI 3.1 (`basePath`)
+    assert run_watch([str(spec_file)], str(rules_file), out, watcher) == 1
+    assert json.loads(out.lines[0])["file"] == str(spec_file)
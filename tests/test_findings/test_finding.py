@@ -0,0 +1,43 @@
+import json
+
+from src.utils.spec_document import SpecDocument
+from src.validators.projet.finding import Finding
+from src.validators.projet.incremental_cache import IncrementalCache
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator
+
+def swagger_dict(description):
+    return {
+        "info": {"title": "api", "version": "v1", "description": description},
+        "basePath": "/api/v1",
+        "paths": {"/pet": {"get": {"parameters": [{"name": "john", "in": "query"}], "responses": {}}}}
+    }
+
+def test_finding_is_rendered_on_demand():
+    finding = Finding("header.missing", "/paths/~1pet/get/parameters", ("GET", "/pet"), "Accept",
+                      details={"definition": "  - name: 'Accept'\n"})
+    assert finding.render() == "Header 'Accept' est manquant dans GET /pet. Il devrait être comme suit :\n  - name: 'Accept'\n"
+    assert Finding.from_list(json.loads(json.dumps(finding.to_list()))) == finding
+
+def test_line_is_resolved_from_document_when_rendered():
+    text = '{\n  "paths": {\n    "/pet": {}\n  }\n}'
+    document = SpecDocument(json.loads(text), text=text)
+    finding = Finding("reserved.path", "/paths/~1pet", subject="/pet", actual="pet")
+    assert finding.render(document) == "Le chemin '/pet' contient un mot réservé 'pet' (ligne 3)"
+    assert finding.render() == "Le chemin '/pet' contient un mot réservé 'pet' (ligne inconnue)"
+
+def test_cached_reserved_findings_follow_line_changes():
+    cache = IncrementalCache(context="rules")
+    before = swagger_dict("API")
+    text = json.dumps(before, indent=2)
+    first = list(ProjetRulesValidator(before, text).iter_errors(cache))
+    cache.save()
+
+    # Une description sur plusieurs lignes décale toutes les lignes suivantes sans modifier l'opération
+    after = swagger_dict("API")
+    text = json.dumps(after, indent=2).replace('"description": "API"', '"description":\n\n\n "API"')
+    second = list(ProjetRulesValidator(after, text).iter_errors(cache))
+
+    assert cache.hits > 0
+    assert second == list(ProjetRulesValidator(after, text).iter_errors())
+    reserved = [error for error in second if "mot réservé 'john'" in error]
+    assert reserved and reserved[0] not in first
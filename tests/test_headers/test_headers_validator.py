@@ -183,3 +183,22 @@ def test_valid_headers(swagger_valid_headers, rules):
     validator = HeaderValidator(swagger_valid_headers, "", rules)
     errors = validator.validate_headers()
     assert not errors, "Aucune erreur ne devrait être trouvée pour des en-têtes valides"
+
+def test_findings_point_at_the_parameter_definition(rules):
+    from src.validators.projet.operation_walker import OperationWalker
+
+    swagger_dict = {
+        "paths": {
+            "/example": {
+                "parameters": [{"name": "Content-Type", "in": "header", "schema": {"type": "integer"},
+                                "description": "Type de contenu pour GET"}],
+                "get": {},
+                "post": {},
+            }
+        }
+    }
+    validator = HeaderValidator(swagger_dict, "", rules)
+    findings = {finding.rule_id: finding.pointer for finding in OperationWalker([validator]).walk(swagger_dict)}
+    # Paramètre hérité du chemin : signalé à sa définition sur le chemin
+    assert findings["header.type"] == "/paths/~1example/parameters/0"
+    assert findings["header.missing"] == "/paths/~1example/parameters"
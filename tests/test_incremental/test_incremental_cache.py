@@ -0,0 +1,60 @@
+import copy
+import json
+import pytest
+
+from src.validators.projet.incremental_cache import IncrementalCache
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator
+
+@pytest.fixture
+def rules():
+    with open('config/projet_validation_rules.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+@pytest.fixture
+def swagger_dict():
+    paths = {}
+    for index in range(20):
+        paths[f"/api/v1/item{index}"] = {
+            "get": {
+                "summary": "Lecture~" if index == 3 else "Lecture",
+                "parameters": [{"name": "john", "in": "query", "schema": {"type": "string"}}],
+                "responses": {"200": {"description": "ok", "content": {"application/json": {"schema": {"type": "object"}}}}}
+            }
+        }
+    return {"info": {"title": "api", "version": "v1", "description": "API"}, "basePath": "/api/v1", "paths": paths}
+
+def validate(swagger_dict, rules, cache=None):
+    errors = list(ProjetRulesValidator(swagger_dict, "", rules=rules).iter_errors(cache))
+    if cache is not None:
+        cache.save()
+    return errors
+
+def test_incremental_results_match_full_validation(swagger_dict, rules):
+    cache = IncrementalCache(context=rules)
+    assert validate(swagger_dict, rules, cache) == validate(swagger_dict, rules)
+    assert validate(swagger_dict, rules, cache) == validate(swagger_dict, rules)
+
+def test_only_changed_operation_is_reevaluated(swagger_dict, rules, tmp_path):
+    cache_path = str(tmp_path / "cache.json")
+    validate(swagger_dict, rules, IncrementalCache(cache_path, context=rules))
+
+    modified = copy.deepcopy(swagger_dict)
+    modified["paths"]["/api/v1/item7"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]["type"] = "array"
+    cache = IncrementalCache(cache_path, context=rules)
+    errors = validate(modified, rules, cache)
+
+    # Seuls l'opération modifiée et les caractères spéciaux de son chemin sont recalculés
+    assert cache.misses == 2
+    assert cache.hits == 38
+    assert errors == validate(modified, rules)
+    assert any("/api/v1/item7" in error and "'array'" in error for error in errors)
+
+def test_rules_change_invalidates_cache(swagger_dict, rules, tmp_path):
+    cache_path = str(tmp_path / "cache.json")
+    validate(swagger_dict, rules, IncrementalCache(cache_path, context=rules))
+
+    rules["GET"]["headers"] = []
+    cache = IncrementalCache(cache_path, context=rules)
+    errors = validate(swagger_dict, rules, cache)
+    assert cache.hits == 0
+    assert not any("Header" in error for error in errors)
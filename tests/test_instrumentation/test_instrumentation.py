@@ -0,0 +1,108 @@
+import json
+import pstats
+import pytest
+
+from src.cli.command_line import main
+from src.utils.instrumentation import ValidationHooks, ValidationStats
+from src.utils.spec_document import SpecDocument
+from src.validators.openapi.openapi_validator import OpenAPIValidator
+from src.validators.projet.incremental_cache import IncrementalCache
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator
+
+SPEC = {
+    "openapi": "3.1.0",
+    "info": {"title": "api", "version": "v1", "description": "API de test"},
+    "basePath": "/api/v1",
+    "paths": {
+        "/api/v1/admin": {
+            "get": {
+                "parameters": [{"name": "toto", "in": "header", "schema": {"type": "string"}}],
+                "responses": {"200": {"description": "ok"}}
+            },
+            "post": {"responses": {"201": {"description": "créé"}}}
+        }
+    }
+}
+
+@pytest.fixture
+def rules():
+    with open('config/projet_validation_rules.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+class RecordingHooks(ValidationHooks):
+    def __init__(self):
+        self.events = []
+
+    def validator_started(self, name):
+        self.events.append(("started", name))
+
+    def validator_finished(self, name, seconds):
+        assert seconds >= 0
+        self.events.append(("finished", name))
+
+def test_stats_are_collected_per_validator(rules):
+    stats = ValidationStats()
+    observed = list(ProjetRulesValidator(SpecDocument(SPEC), None, rules=rules, hooks=stats).iter_errors())
+
+    assert observed == list(ProjetRulesValidator(SpecDocument(SPEC), None, rules=rules).iter_errors())
+    assert stats.operations == 2
+    validators = stats.validators
+    assert validators["projet.reserved_path"]["nodes"] == 1
+    assert validators["projet.reserved_path"]["findings"] == 1
+    assert validators["projet.reserved_header"]["nodes"] == 2
+    assert validators["projet.reserved_header"]["findings"] == 1
+    assert validators["projet.header"]["nodes"] == 2
+    assert sum(stats["findings"] for stats in validators.values()) == len(observed)
+    assert all(stats["runs"] == 1 for stats in validators.values())
+
+def test_each_validator_is_started_and_finished_once(rules):
+    hooks = RecordingHooks()
+    list(ProjetRulesValidator(SpecDocument(SPEC), None, rules=rules, hooks=hooks).iter_findings())
+    started = [name for event, name in hooks.events if event == "started"]
+    finished = [name for event, name in hooks.events if event == "finished"]
+    assert started[0] == "projet.info" and started[-1] == "projet.special_character"
+    assert sorted(started) == sorted(finished) and len(set(started)) == len(started) == 8
+
+def test_observed_validation_with_cache(rules):
+    cache = IncrementalCache(context=rules)
+    expected = list(ProjetRulesValidator(SpecDocument(SPEC), None, rules=rules).iter_errors(cache))
+    cache.save()
+
+    stats = ValidationStats()
+    assert list(ProjetRulesValidator(SpecDocument(SPEC), None, rules=rules, hooks=stats).iter_errors(cache)) == expected
+    # Les opérations reprises du cache sont parcourues mais pas réévaluées par les visiteurs `cacheable`.
+    assert stats.operations == 2
+    assert stats.validators["projet.header"]["nodes"] == 0
+
+def test_openapi_validator_hooks():
+    stats = ValidationStats()
+    records = list(OpenAPIValidator(SpecDocument(SPEC), None, hooks=stats).iter_records())
+    assert stats.validators["openapi"]["findings"] == len(records) == 1
+    assert stats.validators["openapi"]["runs"] == 1
+
+def test_report_ranks_validators_by_time():
+    stats = ValidationStats()
+    for name, seconds in (("rapide", 0.1), ("lent", 0.3)):
+        stats.validator_started(name)
+        stats.validator_finished(name, seconds)
+    lines = stats.format_report().splitlines()
+    assert lines[1].startswith("lent") and lines[2].startswith("rapide")
+    assert lines[-1] == "Opérations parcourues : 0"
+
+def test_check_command_profile(tmp_path, capsys):
+    spec = tmp_path / "spec.json"
+    spec.write_text(json.dumps(SPEC))
+    main(["check", str(spec), "--profile", "--jobs", "2"])
+    captured = capsys.readouterr()
+    assert len(captured.out.splitlines()) == 1
+    report = captured.err.splitlines()
+    assert report[0].startswith("Validateur")
+    assert {line.split()[0] for line in report[1:-2]} >= {"openapi", "load_swagger", "projet.header"}
+
+def test_check_command_profile_output(tmp_path, capsys):
+    spec = tmp_path / "spec.json"
+    spec.write_text(json.dumps(SPEC))
+    profile = tmp_path / "check.prof"
+    main(["check", str(spec), "--profile-output", str(profile)])
+    assert len(capsys.readouterr().out.splitlines()) == 1
+    assert pstats.Stats(str(profile)).total_calls > 0
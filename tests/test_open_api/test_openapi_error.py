@@ -0,0 +1,31 @@
+import json
+
+from src.validators.openapi.openapi_validator import OpenAPIValidator
+
+def broken_openapi():
+    return {
+        "openapi": "3.1.0",
+        "info": {"version": "1.0.0"},
+        "paths": {"/pet": {"get": {"responses": {"200": {"description": 5}}}}}
+    }
+
+def test_records_are_structured_and_located():
+    swagger_dict = broken_openapi()
+    swagger_text = json.dumps(swagger_dict, indent=2)
+    records = list(OpenAPIValidator(swagger_dict, swagger_text).iter_records())
+    by_validator = {record.validator: record for record in records}
+
+    missing_title = by_validator["required"]
+    assert missing_title.message == "'title' is a required property"
+    assert missing_title.pointer == "/info"
+    assert missing_title.line == 3
+
+    wrong_type = by_validator["type"]
+    assert wrong_type.path == ("paths", "/pet", "get", "responses", "200", "description")
+    assert str(wrong_type) == f"Ligne {wrong_type.line}: 5 is not of type 'string' (emplacement : {wrong_type.pointer})"
+    assert "Failed validating" in wrong_type.details()
+
+def test_iter_errors_does_not_render_full_dump():
+    errors = list(OpenAPIValidator(broken_openapi(), "").iter_errors())
+    assert errors
+    assert all(error.startswith("Erreur: ") and "Failed validating" not in error for error in errors)
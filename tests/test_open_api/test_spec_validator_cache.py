@@ -0,0 +1,27 @@
+from src.validators.openapi.openapi_validator import OpenAPIValidator
+from src.validators.openapi.spec_validator_cache import get_spec_validator_class, openapi_version
+
+def minimal_openapi(version):
+    return {
+        "openapi": version,
+        "info": {"title": "API", "version": "1.0.0"},
+        "paths": {"/pet": {"get": {"responses": {"200": {"description": "ok"}}}}}
+    }
+
+def test_validators_are_built_once_per_version():
+    assert get_spec_validator_class("3.0") is get_spec_validator_class("3.0")
+    assert get_spec_validator_class("3.0") is not get_spec_validator_class("3.1")
+    assert openapi_version({"openapi": "3.0.3"}) == "3.0"
+    assert openapi_version({"openapi": "3.1.0"}) == "3.1"
+
+def test_openapi_30_uses_30_meta_schema():
+    result, message = OpenAPIValidator(minimal_openapi("3.0.3"), "").validate()
+    assert result is True, message
+
+def test_warm_validator_reused_across_documents():
+    assert OpenAPIValidator(minimal_openapi("3.1.0"), "").validate()[0] is True
+    invalid = minimal_openapi("3.1.0")
+    invalid["paths"]["/pet"]["get"]["responses"]["200"]["description"] = 5
+    result, message = OpenAPIValidator(invalid, "").validate()
+    assert result is False
+    assert "5 is not of type 'string'" in message
@@ -0,0 +1,102 @@
+import datetime
+import os
+import pickle
+
+import pytest
+import yaml
+
+from src.utils.parse_cache import ParseCache
+from src.utils.swagger_loader import load_swagger_document, parse_swagger_bytes
+
+YAML_SPEC = "openapi: 3.0.0\ninfo:\n  title: API\n  version: '1'\nx-date: 2024-01-02\npaths:\n  /pet:\n    get: {}\n"
+JSON_SPEC = '{\n  "openapi": "3.0.0",\n  "paths": {\n    "/pet": {\n      "get": {}\n    }\n  }\n}'
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParseCache(str(tmp_path / "parse"), min_document_bytes=0)
+
+def test_yaml_cache_hit_skips_parsing(tmp_path, cache, monkeypatch):
+    spec = tmp_path / "api.yaml"
+    spec.write_text(YAML_SPEC)
+    first = load_swagger_document(str(spec), cache)
+    assert cache.misses == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("le document ne doit pas être réanalysé")
+    monkeypatch.setattr(yaml, "CSafeLoader", fail, raising=False)
+    monkeypatch.setattr(yaml, "SafeLoader", fail)
+
+    # Même contenu, autre chemin
+    copy = tmp_path / "copy.yaml"
+    copy.write_text(YAML_SPEC)
+    second = load_swagger_document(str(copy), cache)
+    assert cache.hits == 1
+    assert second.data == first.data
+    assert second.data["x-date"] == datetime.date(2024, 1, 2)
+    assert second.positions.locate("/paths/~1pet/get") == first.positions.locate("/paths/~1pet/get") == (8, 5)
+
+def test_modified_content_is_parsed_again(tmp_path, cache):
+    spec = tmp_path / "api.yaml"
+    spec.write_text(YAML_SPEC)
+    load_swagger_document(str(spec), cache)
+    spec.write_text(YAML_SPEC.replace("title: API", "title: Autre"))
+    assert load_swagger_document(str(spec), cache).data["info"]["title"] == "Autre"
+    assert cache.hits == 0
+
+def test_json_documents_are_not_cached(cache):
+    document = parse_swagger_bytes(JSON_SPEC.encode(), cache=cache)
+    assert document.positions.locate("/paths/~1pet/get") == (5, 7)
+    assert cache.hits == cache.misses == 0
+    assert not os.path.exists(cache.directory)
+
+def test_small_documents_are_not_cached(tmp_path):
+    cache = ParseCache(str(tmp_path / "parse"))
+    parse_swagger_bytes(YAML_SPEC.encode(), cache=cache)
+    assert cache.hits == cache.misses == 0
+    assert not os.path.exists(cache.directory)
+
+def test_corrupted_entry_is_ignored(cache):
+    raw = YAML_SPEC.encode()
+    parse_swagger_bytes(raw, cache=cache)
+    (entry,) = os.listdir(cache.directory)
+    with open(os.path.join(cache.directory, entry), "wb") as file:
+        file.write(b"pas un pickle")
+
+    assert parse_swagger_bytes(raw, cache=cache).data["info"]["title"] == "API"
+    assert cache.hits == 0
+    assert cache.get(ParseCache.key(raw, "yaml")) is not None
+
+def test_entry_cannot_load_arbitrary_classes(cache):
+    key = ParseCache.key(b"contenu", "yaml")
+    os.makedirs(cache.directory)
+    with open(cache._path(key), "wb") as file:
+        pickle.dump(({"openapi": "3.0.0"}, os.system), file)
+    assert cache.get(key) is None
+    assert not os.path.exists(cache._path(key))
+
+def test_least_recently_used_entries_are_evicted(cache):
+    cache.put("a", "x" * 1000)
+    size = os.path.getsize(cache._path("a"))
+    cache.max_bytes = 2 * size
+    cache.put("b", "x" * 1000)
+    os.utime(cache._path("a"), ns=(1, 1))
+    os.utime(cache._path("b"), ns=(2, 2))
+    assert cache.get("a") is not None
+
+    cache.put("c", "x" * 1000)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+def test_yaml_is_parsed_with_libyaml_when_available(monkeypatch):
+    if not hasattr(yaml, "CSafeLoader"):
+        pytest.skip("libyaml indisponible")
+    used = []
+
+    class Loader(yaml.CSafeLoader):
+        def __init__(self, stream):
+            used.append(True)
+            super().__init__(stream)
+    monkeypatch.setattr(yaml, "CSafeLoader", Loader)
+    document = parse_swagger_bytes(YAML_SPEC.encode())
+    assert used
+    assert document.positions.locate("/paths/~1pet/get") == (8, 5)
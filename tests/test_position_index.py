@@ -0,0 +1,84 @@
+import json
+import pytest
+import yaml
+
+from src.utils.position_index import JsonPositionIndex, PositionIndex, json_pointer
+from src.validators.projet.reserved_keywords.reserved_header_validator import ReservedHeaderValidator
+
+@pytest.fixture
+def swagger_text():
+    return """{
+  "paths": {
+    "/api/v1/pet": {
+      "get": {
+        "parameters": [
+          {"name": "toto", "in": "header"}
+        ]
+      }
+    },
+    "/api/v1/user": {
+      "get": {
+        "parameters": [
+          {"name": "X-Request-ID", "in": "header"},
+          {"name": "toto", "in": "header"}
+        ]
+      }
+    }
+  }
+}"""
+
+def test_json_pointer_escaping():
+    assert json_pointer("paths", "/api/v1/pet", "get") == "/paths/~1api~1v1~1pet/get"
+    assert json_pointer("x~y", 0) == "/x~0y/0"
+    assert json_pointer() == ""
+
+def test_json_index_matches_yaml_index(swagger_text):
+    # Un JSON est aussi un YAML : les deux index doivent repérer les mêmes positions.
+    expected = PositionIndex.from_yaml_node(yaml.compose(swagger_text)).as_dict()
+    index = PositionIndex.from_text(swagger_text)
+    assert isinstance(index, JsonPositionIndex)
+    assert index.locate("") == (1, 1)
+    assert index.locate("/paths/~1api~1v1~1user/get/parameters/1") == (14, 11)
+    # Dans l'ordre inverse, pour reprendre des conteneurs partiellement parcourus
+    for pointer in reversed(list(expected)):
+        assert index.locate(pointer) == expected[pointer]
+    assert index.locate("/paths/~1absent") is None
+    assert index.locate("/paths/~1api~1v1~1pet/get/parameters/7") is None
+    assert index.line("paths") == "inconnue"
+    assert JsonPositionIndex(swagger_text).as_dict() == expected
+    assert len(index) == len(expected)
+
+def test_json_index_only_scans_what_it_needs():
+    paths = {f"/p{i}": {"get": {"parameters": [{"name": "a", "in": "query"}]}} for i in range(500)}
+    text = json.dumps({"openapi": "3.0.0", "paths": paths}, indent=2)
+    index = JsonPositionIndex(text)
+    assert index.locate("/paths/~1p3/get/parameters/0") == JsonPositionIndex(text).as_dict()["/paths/~1p3/get/parameters/0"]
+    # Les chemins suivants ne sont pas parcourus
+    assert len(index._offsets) < 20
+
+def test_from_text_yaml():
+    positions = PositionIndex.from_text("info:\n  title: API\n")
+    assert positions.line("/info/title") == 2
+    assert positions.line("/info/version") == "inconnue"
+
+def test_yaml_alias_indexes_anchor_and_alias_sites():
+    positions = PositionIndex.from_text("a:\n  b: &x\n    c: 1\n  d: *x\nr: &r\n  s: *r\n")
+    assert positions.locate("/a/b/c") == (3, 5)
+    # Les descendants d'un alias sont situés à l'ancre
+    assert positions.locate("/a/d") == (4, 3)
+    assert positions.locate("/a/d/c") == (3, 5)
+    assert positions.locate("/r/s") == (6, 3)
+
+def test_from_text_flow_style_yaml():
+    assert PositionIndex.from_text("{info: {title: API},\n paths: {}}").locate("/paths") == (2, 2)
+
+def test_from_text_invalid_returns_empty_index():
+    assert len(PositionIndex.from_text("{ invalide")) == 0
+    assert len(PositionIndex.from_text("")) == 0
+
+def test_reserved_header_reports_each_occurrence(swagger_text):
+    validator = ReservedHeaderValidator(json.loads(swagger_text), swagger_text, ["toto"])
+    errors = validator.validate_reserved_headers()
+    assert len(errors) == 2
+    assert "(ligne 6)" in errors[0]
+    assert "(ligne 14)" in errors[1]
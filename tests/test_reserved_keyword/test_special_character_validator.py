@@ -91,3 +91,33 @@ def test_validate_special_characters_non_passant(swagger_dict_non_passant, swagg
     assert "La valeur 'Invalid~ API' sous le chemin 'root.info.title' contient des caractères spéciaux non autorisés." in errors[0]
     assert "La valeur 'This description contains a ~ special character.' sous le chemin 'root.info.description' contient des caractères spéciaux non autorisés." in errors[1]
     assert "La valeur 'Get user details~' sous le chemin 'root.paths./api/v1/user.get.summary' contient des caractères spéciaux non autorisés." in errors[2]
+
+def test_validate_special_characters_deep_nesting(special_characters):
+    # Structure bien plus profonde que la limite de récursion de Python
+    leaf = {"value": "deep~"}
+    for _ in range(5000):
+        leaf = {"child": [leaf]}
+    validator = SpecialCharacterValidator({"x-deep": leaf}, "", special_characters)
+    errors = validator.iter_findings()
+    assert len(errors) == 1
+    assert errors[0].subject == "root.x-deep" + ".child[0]" * 5000 + ".value"
+    assert errors[0].pointer == "/x-deep" + "/child/0" * 5000 + "/value"
+
+def test_text_prefilter_skips_scan(tmp_path, swagger_dict_passant, special_characters, monkeypatch):
+    from src.utils.swagger_loader import load_swagger_document
+
+    swagger_file = tmp_path / "swagger.json"
+    swagger_file.write_text(json.dumps(swagger_dict_passant), encoding="utf-8")
+    validator = SpecialCharacterValidator(load_swagger_document(str(swagger_file)), None, special_characters)
+    monkeypatch.setattr(validator, "_scan", lambda *args: pytest.fail("le parcours aurait dû être évité"))
+    assert validator.validate_all_values() == []
+
+def test_text_prefilter_detects_escaped_characters(tmp_path, special_characters):
+    from src.utils.swagger_loader import load_swagger_document
+
+    # "~" n'apparaît que sous forme échappée dans le texte brut
+    swagger_file = tmp_path / "swagger.json"
+    swagger_file.write_text('{"info": {"title": "Escaped\\u007e API"}}', encoding="utf-8")
+    validator = SpecialCharacterValidator(load_swagger_document(str(swagger_file)), None, special_characters)
+    errors = validator.validate_all_values()
+    assert errors == ["La valeur 'Escaped~ API' sous le chemin 'root.info.title' contient des caractères spéciaux non autorisés."]
@@ -1,4 +1,5 @@
 import pytest
+from src.validators.projet.operation_walker import OperationWalker
 from src.validators.projet.responses.response_validator import ResponseValidator
 
 @pytest.fixture
@@ -92,6 +93,13 @@ def test_missing_response(swagger_responses, rules):
     errors = validator.validate_responses()
     assert errors, "Une erreur devrait être trouvée pour une réponse manquante."
 
+@pytest.mark.parametrize("responses", [[], "ok", {"200": "ok", "400": None}])
+def test_malformed_responses_are_reported_missing(rules, responses):
+    swagger = {"paths": {"/example": {"get": {"responses": responses}}}}
+    errors = ResponseValidator(swagger, "", rules).validate_responses()
+    assert errors == ["La réponse pour le code '200' est manquante dans GET /example.",
+                      "La réponse pour le code '400' est manquante dans GET /example."]
+
 def test_valid_responses_with_empty_objects():
     swagger_responses_with_empty_objects = {
         "paths": {
@@ -197,3 +205,94 @@ def test_invalid_response_format():
     validator = ResponseValidator(swagger_responses_invalid, "", rules)
     errors = validator.validate_responses()
     assert errors, "Une erreur devrait être trouvée pour un format de réponse incorrect."
+
+@pytest.fixture
+def envelope_rules():
+    return {
+        "GET": {
+            "responses": [
+                {
+                    "response_code": code,
+                    "format": {
+                        "type": "object",
+                        "properties": {
+                            "error": {"type": "string"},
+                            "data": {"type": "object", "properties": {"items": {"type": "array", "items": {
+                                "type": "object", "properties": {"id": {"type": "integer"}}}}}}
+                        },
+                        "required": ["error"]
+                    }
+                }
+                for code in (400, 404)
+            ]
+        }
+    }
+
+def envelope_spec(envelope, operations=1):
+    error = {"description": "erreur", "content": {
+        "application/json": {"schema": {"$ref": "#/components/schemas/Envelope"}},
+        "application/xml": {"schema": {"type": "string"}},
+    }}
+    return {
+        "paths": {f"/api/v1/item{index}": {"get": {"responses": {"400": error, "404": error}}}
+                  for index in range(operations)},
+        "components": {"schemas": {
+            "Envelope": envelope,
+            "Base": {"type": "object", "properties": {"error": {"type": "string"}}, "required": ["error"]},
+        }}
+    }
+
+def test_nested_properties_allof_and_required(envelope_rules):
+    envelope = {"allOf": [
+        {"$ref": "#/components/schemas/Base"},
+        {"properties": {"data": {"type": "object", "properties": {
+            "items": {"type": "array", "items": {"type": "object", "properties": {"id": {"type": "string"}}}}}}}},
+    ]}
+    validator = ResponseValidator(envelope_spec(envelope), "", envelope_rules)
+    findings = [(finding.rule_id, finding.subject, finding.details.get("media_type"))
+                for finding in OperationWalker([validator]).walk(validator.swagger_dict)
+                if finding.details["code"] == "400"]
+    assert findings == [
+        ("response.property_type", "data.items[].id", "application/json"),
+        ("response.type", None, "application/xml"),
+        ("response.property_missing", "error", "application/xml"),
+        ("response.property_missing", "data", "application/xml"),
+    ]
+
+def test_required_field_must_stay_required(envelope_rules):
+    envelope = {"type": "object", "properties": {
+        "error": {"type": "string"},
+        "data": {"type": "object", "properties": {"items": {"type": "array", "items": {"$ref": "#/components/schemas/Item"}}}},
+    }}
+    spec = envelope_spec(envelope)
+    spec["components"]["schemas"]["Item"] = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    errors = ResponseValidator(spec, "", envelope_rules).validate_responses()
+    assert errors[0].startswith("Le champ 'error' devrait être obligatoire (`required`) dans la réponse pour le code '400' "
+                                "(type de contenu 'application/json') dans GET /api/v1/item0.")
+
+def test_shared_envelope_is_compared_once_per_expected_format(envelope_rules, monkeypatch):
+    validator = ResponseValidator(envelope_spec({"$ref": "#/components/schemas/Base"}, operations=50), "", envelope_rules)
+    calls = []
+    compare = validator._compare_response_schema
+    monkeypatch.setattr(validator, "_compare_response_schema",
+                        lambda *args: calls.append(args) or compare(*args))
+    findings = list(OperationWalker([validator]).walk(validator.swagger_dict))
+    assert len(findings) == 50 * 2 * 4
+    # Les formats des codes 400 et 404 sont identiques : une comparaison par schéma de la réponse
+    assert len(calls) == 2
+
+def test_messages_name_the_media_type(swagger_responses, rules):
+    content = swagger_responses["paths"]["/example"]["get"]["responses"]["200"]["content"]
+    content["application/json"]["schema"]["type"] = "array"
+    content["application/xml"] = {"schema": {"type": "array", "properties": {"message": {"type": "string"}}}}
+    errors = ResponseValidator(swagger_responses, "", rules).validate_responses()
+    assert [error.split("\n")[0] for error in errors] == [
+        f"Le type de la réponse pour le code '200' (type de contenu '{media_type}') dans GET /example est 'array', "
+        "mais il devrait être 'object'."
+        for media_type in ("application/json", "application/xml")
+    ]
+
+def test_message_without_content_has_no_media_type(rules):
+    swagger = {"paths": {"/example": {"get": {"responses": {"200": {"description": "ok"}, "400": {"description": "ko"}}}}}}
+    errors = ResponseValidator(swagger, "", rules).validate_responses()
+    assert errors[0].startswith("Le type de la réponse pour le code '200' dans GET /example est 'None', ")
@@ -0,0 +1,48 @@
+import json
+import pytest
+
+from src.validators.projet.aho_corasick import AhoCorasick
+from src.validators.projet.compiled_rules import CompiledRules, ReservedWords
+from src.validators.projet.headers.header_validator import HeaderValidator
+
+@pytest.fixture
+def rules():
+    with open('config/projet_validation_rules.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def test_compiled_rules_index_by_lower_name(rules):
+    compiled = CompiledRules(rules)
+    get_rules = compiled.for_method("GET")
+    assert get_rules.headers_by_name["authorization"].name == "Authorization"
+    assert "&lt;" not in get_rules.headers_by_name["authorization"].expected_description
+    assert compiled.for_method("TRACE") is None
+    assert CompiledRules.coerce(compiled) is compiled
+
+def test_reserved_words_keep_rule_order():
+    reserved = ReservedWords(["Toto", "tata", "toto"])
+    assert reserved.match_name("TOTO") == ("Toto", "toto")
+    assert reserved.match_name(None) == ()
+    assert ReservedWords(["root", "admin"]).match_segments("/admin/root") == ("root", "admin")
+    assert ReservedWords(["admin"]).match_segments("/administration") == ()
+
+def test_aho_corasick_finds_overlapping_patterns():
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    assert sorted(automaton.iter_matches("ushers")) == [(0, 2, 4), (1, 1, 4), (3, 2, 6)]
+    assert list(AhoCorasick([]).iter_matches("ushers")) == []
+
+def test_reserved_words_with_wildcards():
+    reserved = ReservedWords(["admin*", "*tools", "*secret*", "root", "*"])
+    assert reserved.match_segments("/api/adminTools/users") == ("admin*",)
+    assert reserved.match_segments("/api/devtools/root") == ("*tools", "root")
+    assert reserved.match_segments("/api/mySecretStuff") == ()
+    assert reserved.match_segments("/api/topsecrets/superadmin") == ("*secret*",)
+    assert reserved.match_name("X-Top-SECRET-Id") == ("*secret*",)
+    assert reserved.match_name("ADMINISTRATOR") == ("admin*",)
+    assert reserved.match_name("*") == ("*",)
+
+def test_validators_accept_raw_or_compiled_rules(rules):
+    swagger_dict = {"paths": {"/test": {"get": {"parameters": [], "responses": {}}}}}
+    raw_errors = HeaderValidator(swagger_dict, "", rules).validate_headers()
+    compiled_errors = HeaderValidator(swagger_dict, "", CompiledRules(rules)).validate_headers()
+    assert raw_errors == compiled_errors
+    assert len(raw_errors) == len(rules["GET"]["headers"])
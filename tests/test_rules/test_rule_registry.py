@@ -0,0 +1,61 @@
+import json
+import os
+import pickle
+import pytest
+
+from src.validators.projet.compiled_rules import CompiledRules
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator
+from src.validators.projet.rule_registry import RuleRegistry, get_compiled_rules
+
+@pytest.fixture
+def rules_file(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"reserved_paths": ["admin"]}))
+    return path
+
+def _touch(path, offset):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset))
+
+def test_rules_are_compiled_once(rules_file):
+    registry = RuleRegistry()
+    rules = registry.get(str(rules_file))
+    assert isinstance(rules, CompiledRules)
+    assert registry.get(str(rules_file)) is rules
+
+def test_unchanged_content_is_not_recompiled(rules_file):
+    registry = RuleRegistry()
+    rules = registry.get(str(rules_file))
+    rules_file.write_text(rules_file.read_text())
+    _touch(rules_file, 1_000_000)
+    assert registry.get(str(rules_file)) is rules
+
+def test_modified_file_is_reloaded(rules_file):
+    registry = RuleRegistry()
+    rules = registry.get(str(rules_file))
+    rules_file.write_text(json.dumps({"reserved_paths": ["admin", "root"]}))
+    _touch(rules_file, 1_000_000)
+    reloaded = registry.get(str(rules_file))
+    assert reloaded is not rules
+    assert list(reloaded.reserved_paths) == ["admin", "root"]
+
+def test_missing_or_invalid_file(tmp_path):
+    registry = RuleRegistry()
+    with pytest.raises(FileNotFoundError):
+        registry.get(str(tmp_path / "absent.json"))
+    broken = tmp_path / "broken.json"
+    broken.write_text("{")
+    with pytest.raises(ValueError):
+        registry.get(str(broken))
+
+def test_validator_uses_process_registry(rules_file, capsys):
+    first = ProjetRulesValidator({"paths": {}}, "", rules_config_path=str(rules_file))
+    second = ProjetRulesValidator({"paths": {}}, "", rules_config_path=str(rules_file))
+    assert first.compiled_rules is second.compiled_rules is get_compiled_rules(str(rules_file))
+    assert capsys.readouterr().out == ""
+
+def test_compiled_rules_are_sent_to_workers_as_is(rules_file):
+    rules = RuleRegistry().get(str(rules_file))
+    copy = pickle.loads(pickle.dumps(rules))
+    assert list(copy.reserved_paths.match_segments("/admin")) == ["admin"]
+    assert copy.source == rules.source
@@ -0,0 +1,33 @@
+import pytest
+
+from src.utils.spec_document import SpecDocument
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator
+
+@pytest.fixture
+def swagger_text():
+    return "info:\n  title: API\r\n  version: v1\npaths: {}\n"
+
+def test_lazy_text_and_lines(swagger_text):
+    document = SpecDocument({"info": {}}, raw=swagger_text.encode("utf-8"))
+    assert document.text == swagger_text
+    assert document.line_count == 5
+    assert document.get_line(2) == "  title: API"
+    assert document.line_of_offset(swagger_text.index("version")) == 3
+    assert document.positions.line("/info/version") == 3
+
+def test_document_is_immutable(swagger_text):
+    document = SpecDocument({}, text=swagger_text)
+    with pytest.raises(AttributeError):
+        document.data = {}
+
+def test_wrap_returns_same_document(swagger_text):
+    document = SpecDocument({}, text=swagger_text)
+    assert SpecDocument.wrap(document, "ignoré") is document
+    assert SpecDocument.wrap({"a": 1}, None).text == ""
+
+def test_validators_share_one_document(swagger_text):
+    document = SpecDocument({"info": {"title": "API", "version": "v1"}, "paths": {}}, text=swagger_text)
+    validator = ProjetRulesValidator(document, None)
+    assert validator.document is document
+    assert validator.header_validator.document is document
+    assert validator.special_character_validator.document is document
@@ -1,5 +1,5 @@
 import pytest
-from src.utils.swagger_loader import load_swagger
+from src.utils.swagger_loader import load_swagger, load_swagger_document
 
 @pytest.fixture
 def create_temp_json_file(tmp_path):
@@ -34,3 +34,60 @@ def test_unsupported_file_extension(tmp_path):
     file_path.write_text("Unsupported content")
     with pytest.raises(ValueError, match="Unsupported file format"):
         load_swagger(str(file_path))
+
+def test_load_json_document(create_temp_json_file):
+    valid_json_swagger = '{\n  "swagger": "2.0",\n  "paths": {\n    "/pet": {\n      "get": {}\n    }\n  }\n}'
+    file_path = create_temp_json_file(valid_json_swagger)
+    document = load_swagger_document(file_path)
+    assert document.data == {"swagger": "2.0", "paths": {"/pet": {"get": {}}}}
+    assert document.positions.locate("/paths/~1pet/get") == (5, 7)
+    assert document.source_path == file_path
+
+def test_load_yaml_document(create_temp_yaml_file):
+    valid_yaml_swagger = "swagger: '2.0'\npaths:\n  /pet:\n    get:\n      responses:\n        200:\n          description: ok\n"
+    file_path = create_temp_yaml_file(valid_yaml_swagger)
+    document = load_swagger_document(file_path)
+    assert document.data["paths"]["/pet"]["get"]["responses"][200]["description"] == "ok"
+    assert document.positions.locate("/paths/~1pet/get/responses/200") == (6, 9)
+
+def test_load_invalid_json_document(create_temp_json_file):
+    file_path = create_temp_json_file('{"swagger": "2.0",}')
+    with pytest.raises(ValueError, match="Failed to load Swagger file"):
+        load_swagger_document(file_path)
+
+def test_format_is_detected_from_content(tmp_path):
+    json_in_yml = tmp_path / "swagger.yml"
+    json_in_yml.write_text('\n  {"openapi": "3.0.0", "paths": {}}')
+    document = load_swagger_document(str(json_in_yml))
+    assert document.data == {"openapi": "3.0.0", "paths": {}}
+    assert document.positions.locate("/paths") == (2, 24)
+
+    yaml_in_txt = tmp_path / "swagger.txt"
+    yaml_in_txt.write_text("openapi: 3.0.0\npaths: {}\n")
+    assert load_swagger_document(str(yaml_in_txt)).data["openapi"] == "3.0.0"
+
+def test_flow_style_yaml_is_not_mistaken_for_json(tmp_path, monkeypatch):
+    flow_yaml = "{openapi: 3.0.0, info: {title: t, version: '1'},\n  paths: {}}"
+    expected = {"openapi": "3.0.0", "info": {"title": "t", "version": "1"}, "paths": {}}
+    file_path = tmp_path / "swagger.yaml"
+    file_path.write_text(flow_yaml)
+    document = load_swagger_document(str(file_path))
+    assert document.data == expected
+    assert document.positions.locate("/paths") == (2, 3)
+
+    monkeypatch.setattr("src.utils.swagger_loader.MMAP_THRESHOLD", 16)
+    assert load_swagger_document(str(file_path)).data == expected
+
+    # Un fichier .json reste analysé comme du JSON
+    json_path = tmp_path / "swagger.json"
+    json_path.write_text(flow_yaml)
+    with pytest.raises(ValueError, match="Expecting property name"):
+        load_swagger_document(str(json_path))
+
+def test_large_document_is_memory_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.utils.swagger_loader.MMAP_THRESHOLD", 16)
+    file_path = tmp_path / "swagger.json"
+    file_path.write_bytes(b'\xef\xbb\xbf{"openapi": "3.0.0", "info": {"title": "\xc3\xa9"}}')
+    document = load_swagger_document(str(file_path))
+    assert document.data["info"]["title"] == "é"
+    assert document.text.startswith('{"openapi"')
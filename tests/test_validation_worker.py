@@ -0,0 +1,63 @@
+import pytest
+
+from src.gui.validation_worker import (
+    CANCELLED, DONE, FINDING, OPENAPI_SECTION, PROJET_SECTION, SECTION_DONE, CancellationHooks, ValidationWorker,
+)
+from src.utils.spec_document import SpecDocument
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator, default_rules_config_path
+from src.validators.projet.rule_registry import get_compiled_rules
+
+@pytest.fixture
+def document():
+    return SpecDocument({
+        "openapi": "3.1.0",
+        "info": {"title": "API", "version": "1.0.0"},
+        "paths": {"/admin": {"get": {"responses": {"200": {"description": "ok"}}}}}
+    }, text="")
+
+def drain(worker):
+    worker.join(timeout=30)
+    messages = []
+    while not worker.results.empty():
+        messages.append(worker.results.get_nowait())
+    return messages
+
+def test_worker_streams_findings_then_done(document):
+    worker = ValidationWorker(document, get_compiled_rules(default_rules_config_path()))
+    worker.start()
+    messages = drain(worker)
+
+    assert messages[-1] == (DONE, True, False)
+    assert (SECTION_DONE, OPENAPI_SECTION, True) in messages
+    findings = [message[2] for message in messages if message[0] == FINDING]
+    assert all(message[1] == PROJET_SECTION for message in messages if message[0] == FINDING)
+    assert findings == list(ProjetRulesValidator(document, None).iter_errors())
+
+def test_cancelled_worker_stops(document):
+    worker = ValidationWorker(document, get_compiled_rules(default_rules_config_path()))
+    worker.cancel()
+    worker.start()
+    messages = drain(worker)
+    assert messages[-1] == (CANCELLED,)
+    assert not any(message[0] == FINDING for message in messages)
+
+def test_worker_is_cancelled_during_the_walk():
+    document = SpecDocument({
+        "openapi": "3.1.0",
+        "info": {"title": "API", "version": "1.0.0"},
+        "paths": {f"/items{index}": {"get": {"responses": {"200": {"description": "ok"}}}} for index in range(3)}
+    }, text="")
+    worker = ValidationWorker(document, get_compiled_rules(default_rules_config_path()))
+    visited = []
+
+    def operation_visited(operation):
+        visited.append(operation)
+        worker.cancel()
+        CancellationHooks.operation_visited(worker.hooks, operation)
+    worker.hooks.operation_visited = operation_visited
+    worker.start()
+    messages = drain(worker)
+
+    assert messages[-1] == (CANCELLED,)
+    assert len(visited) == 1
+    assert (SECTION_DONE, PROJET_SECTION, True) not in messages
@@ -0,0 +1,138 @@
+import pytest
+
+from benchmarks.spec_generator import generate_spec
+from src.utils.instrumentation import ValidationStats
+from src.validators.projet.incremental_cache import IncrementalCache
+from src.validators.projet.operation_walker import OperationVisitor, OperationWalker
+from src.validators.projet.projet_rules_validator import VALIDATOR_ORDER, ProjetRulesValidator, validator_rank
+
+class RecordingVisitor(OperationVisitor):
+    def __init__(self):
+        self.visited = []
+
+    def visit_path(self, path, path_item):
+        self.visited.append(("path", path))
+        return ()
+
+    def visit_operation(self, operation):
+        self.visited.append(("operation", operation.method_upper, operation.path))
+        return ()
+
+    def visit_parameter(self, operation, index, parameter):
+        self.visited.append(("parameter", operation.method_upper, index, parameter["name"]))
+        return ()
+
+    def visit_response(self, operation, response_code, response):
+        self.visited.append(("response", operation.method_upper, response_code))
+        return ()
+
+@pytest.fixture
+def swagger_dict():
+    return {
+        "paths": {
+            "/api/v1/pet": {
+                "summary": "Animaux",
+                "parameters": [{"name": "petId", "in": "path"}],
+                "servers": [{"url": "https://example.com"}],
+                "get": {
+                    "parameters": [{"name": "john", "in": "query"}],
+                    "responses": {"200": {"description": "ok"}}
+                },
+                "post": {
+                    "parameters": [{"name": "toto", "in": "header"}]
+                }
+            }
+        }
+    }
+
+def test_walker_skips_non_operation_keys(swagger_dict):
+    visitor = RecordingVisitor()
+    list(OperationWalker([visitor]).walk(swagger_dict))
+    assert visitor.visited == [
+        ("path", "/api/v1/pet"),
+        ("operation", "GET", "/api/v1/pet"),
+        ("parameter", "GET", 0, "john"),
+        ("response", "GET", "200"),
+        ("operation", "POST", "/api/v1/pet"),
+        ("parameter", "POST", 0, "toto"),
+    ]
+
+def test_walker_only_calls_overridden_hooks():
+    class PathOnlyVisitor(OperationVisitor):
+        def visit_path(self, path, path_item):
+            yield path
+
+    walker = OperationWalker([PathOnlyVisitor()])
+    errors = list(walker.walk({"paths": {"/a": {"get": {"parameters": [{"name": "x"}]}}, "/b": {}}}))
+    assert errors == ["/a", "/b"]
+
+def test_projet_rules_reports_each_reserved_word_once(swagger_dict):
+    swagger_dict["info"] = {"title": "API", "version": "v1", "description": "API de test"}
+    validator = ProjetRulesValidator(swagger_dict, "")
+    errors = list(validator.iter_errors())
+    assert sum("contient un mot réservé 'john'" in error for error in errors) == 1
+    assert sum("contient un mot réservé 'toto'" in error for error in errors) == 1
+
+def test_parameter_index_merges_path_and_operation_parameters():
+    swagger_dict = {
+        "paths": {
+            "/api/v1/pet/{petId}": {
+                "parameters": [
+                    {"name": "petId", "in": "path", "required": True},
+                    {"name": "X-Trace", "in": "header", "description": "chemin"},
+                ],
+                "get": {"parameters": [{"name": "x-trace", "in": "header", "description": "opération"}]},
+                "delete": {}
+            }
+        }
+    }
+    _, _, (get, delete) = next(OperationWalker().iter_operations(swagger_dict))
+    assert get.find_parameter("header", "x-trace").parameter["description"] == "opération"
+    assert get.find_parameter("path", "petid").parameter["required"] is True
+    assert delete.find_parameter("header", "x-trace").parameter["description"] == "chemin"
+    assert [entry.parameter["name"] for entry in get.parameters("header")] == ["x-trace"]
+    assert get.find_parameter("query", "x-trace") is None
+    assert get.parameters_pointer() == "/paths/~1api~1v1~1pet~1{petId}/get/parameters"
+    assert delete.parameters_pointer() == "/paths/~1api~1v1~1pet~1{petId}/parameters"
+
+    (header,) = delete.parameters("header")
+    assert header.pointer(delete.resolver, "name") == "/paths/~1api~1v1~1pet~1{petId}/parameters/1/name"
+    # L'index du chemin est partagé par ses opérations
+    assert delete.parameter_index is get.resolver.memoize(("path_parameters", id(delete.path_item)), dict)
+
+def test_path_level_parameters_are_validated_for_each_operation(swagger_dict):
+    swagger_dict["info"] = {"title": "API", "version": "v1", "description": "API de test"}
+    swagger_dict["paths"]["/api/v1/pet"]["parameters"].append({"name": "doe", "in": "query"})
+    findings = [finding for finding in ProjetRulesValidator(swagger_dict, "").iter_findings()
+                if finding.rule_id == "reserved.query_parameter"]
+    assert [(finding.subject, finding.operation) for finding in findings] == [
+        ("doe", ("GET", "/api/v1/pet")), ("john", ("GET", "/api/v1/pet")), ("doe", ("POST", "/api/v1/pet")),
+    ]
+    assert findings[0].pointer == "/paths/~1api~1v1~1pet/parameters/1/name"
+
+@pytest.fixture
+def violating_spec():
+    spec = generate_spec(operations=60, seed=5, violation_rate=0.4)
+    spec["info"]["version"] = "1.0"
+    spec["paths"]["/admin/~toto"] = {"get": {"parameters": [{"name": "john", "in": "query"}]}}
+    return spec
+
+def test_validate_groups_findings_by_validator(violating_spec):
+    validator = ProjetRulesValidator(violating_spec, "")
+    findings = sorted(validator.iter_findings(), key=validator_rank)
+    families = [VALIDATOR_ORDER[validator_rank(finding)] for finding in findings]
+    assert families == sorted(families, key=VALIDATOR_ORDER.index)
+    assert {"reserved.path", "info", "special_character", "header", "response"} <= set(families)
+    assert validator.validate() == (False, "\n".join(finding.render(validator.document) for finding in findings))
+
+def test_findings_are_streamed_during_the_walk(violating_spec):
+    hooks = ValidationStats()
+    findings = ProjetRulesValidator(violating_spec, "", hooks=hooks).iter_findings()
+    first_walk_finding = next(finding for finding in findings if not finding.rule_id.startswith("info."))
+    assert first_walk_finding.operation is not None
+    assert hooks.operations < len(violating_spec["paths"])
+
+    serial = [finding.render() for finding in ProjetRulesValidator(violating_spec, "").iter_findings()]
+    cached = [finding.render() for finding in ProjetRulesValidator(violating_spec, "").iter_findings(IncrementalCache())]
+    observed = [finding.render() for finding in ProjetRulesValidator(violating_spec, "", hooks=ValidationStats()).iter_findings()]
+    assert cached == observed == serial
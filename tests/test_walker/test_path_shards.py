@@ -0,0 +1,46 @@
+import json
+import pytest
+
+from benchmarks.spec_generator import generate_spec, write_spec
+from src.cli.command_line import main
+from src.utils.spec_document import SpecDocument
+from src.validators.projet import path_shards
+from src.validators.projet.operation_walker import OperationWalker
+from src.validators.projet.path_shards import fork_available, shard_bounds
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator
+
+needs_fork = pytest.mark.skipif(not fork_available(), reason="fork indisponible sur cette plateforme")
+
+@pytest.fixture
+def spec():
+    return generate_spec(operations=120, seed=3, violation_rate=0.3)
+
+def test_shard_bounds_cover_paths_contiguously(monkeypatch):
+    monkeypatch.setattr(path_shards, "MIN_PATHS_PER_SHARD", 10)
+    assert shard_bounds(103, 2) == [(0, 13), (13, 26), (26, 39), (39, 52), (52, 65), (65, 78), (78, 91), (91, 103)]
+    assert shard_bounds(15, 4) == []
+    assert shard_bounds(1000, 1) == []
+
+def test_walk_slices_concatenate_to_full_walk(spec):
+    walker = ProjetRulesValidator(spec, "").walker
+    full = list(walker.walk(spec))
+    assert full == list(walker.walk(spec, 0, 7)) + list(walker.walk(spec, 7))
+    assert [path for path, _, _ in OperationWalker().iter_operations(spec, 2, 4)] == list(spec["paths"])[2:4]
+
+@needs_fork
+def test_sharded_findings_are_identical_to_serial(spec, monkeypatch):
+    monkeypatch.setattr(path_shards, "MIN_PATHS_PER_SHARD", 5)
+    serial = list(ProjetRulesValidator(SpecDocument(spec), None).iter_errors())
+    sharded = list(ProjetRulesValidator(SpecDocument(spec), None).iter_errors(jobs=3))
+    assert len(shard_bounds(len(spec["paths"]), 3)) > 2 and len(serial) > 20
+    assert sharded == serial
+
+@needs_fork
+def test_single_file_check_is_sharded(spec, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(path_shards, "MIN_PATHS_PER_SHARD", 5)
+    spec_file = tmp_path / "spec.json"
+    write_spec(spec, str(spec_file))
+    main(["check", str(spec_file), "--skip-openapi", "--jobs", "1"])
+    serial = json.loads(capsys.readouterr().out)
+    main(["check", str(spec_file), "--skip-openapi", "--jobs", "4"])
+    assert json.loads(capsys.readouterr().out) == serial
@@ -0,0 +1,124 @@
+import copy
+import pytest
+
+from src.validators.projet.headers.header_validator import HeaderValidator
+from src.validators.projet.incremental_cache import IncrementalCache
+from src.validators.projet.projet_rules_validator import ProjetRulesValidator
+from src.validators.projet.ref_resolver import RefResolver
+from src.validators.projet.responses.response_validator import ResponseValidator
+
+@pytest.fixture
+def rules():
+    return {
+        "reserved_paths": [],
+        "reserved_headers": ["X-Secret"],
+        "reserved_query_parameters": [],
+        "special_characters": ["~"],
+        "GET": {
+            "headers": [{"name": "Accept", "description": "Format", "required": False, "type": "string",
+                         "x-example": "application/json"}],
+            "responses": [{"response_code": 200, "format": {"type": "object", "properties": {"id": {"type": "integer"}}}}],
+        },
+    }
+
+@pytest.fixture
+def swagger_dict():
+    paths = {
+        f"/api/v1/item{index}": {
+            "get": {
+                "parameters": [{"$ref": "#/components/parameters/Accept"}, {"$ref": "#/components/parameters/Secret"}],
+                "responses": {"200": {"$ref": "#/components/responses/Item"}},
+            }
+        }
+        for index in range(2000)
+    }
+    return {
+        "info": {"title": "api", "version": "v1", "description": "API"},
+        "paths": paths,
+        "components": {
+            "parameters": {
+                "Accept": {"name": "Accept", "in": "header", "description": "Format",
+                           "schema": {"$ref": "#/components/schemas/Text"}},
+                "Secret": {"name": "X-Secret", "in": "header", "schema": {"type": "string"}},
+            },
+            "responses": {
+                "Item": {"description": "ok", "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Item"}}}},
+            },
+            "schemas": {
+                "Text": {"type": "string", "example": "application/json"},
+                "Item": {"type": "object", "properties": {"id": {"$ref": "#/components/schemas/Identifier"}}},
+                "Identifier": {"type": "string"},
+            },
+        },
+    }
+
+def test_resolve_follows_chains_and_stops_on_cycles():
+    resolver = RefResolver({
+        "components": {"schemas": {
+            "A": {"$ref": "#/components/schemas/B"},
+            "B": {"type": "string"},
+            "Loop1": {"$ref": "#/components/schemas/Loop2"},
+            "Loop2": {"$ref": "#/components/schemas/Loop1"},
+            "a/b": {"type": "integer"},
+        }}
+    })
+    assert resolver.resolve({"$ref": "#/components/schemas/A"}) == {"type": "string"}
+    assert resolver.location({"$ref": "#/components/schemas/A"}) == "/components/schemas/B"
+    assert resolver.resolve({"$ref": "#/components/schemas/a~1b"}) == {"type": "integer"}
+
+    loop = {"$ref": "#/components/schemas/Loop1"}
+    assert resolver.resolve(loop) is loop
+    assert resolver.location(loop) is None
+    missing = {"$ref": "#/components/schemas/Missing"}
+    assert resolver.resolve(missing) is missing
+    external = {"$ref": "common.yaml#/components/schemas/B"}
+    assert resolver.resolve(external) is external
+
+def test_dependencies_are_transitive():
+    resolver = RefResolver({
+        "components": {"schemas": {
+            "A": {"properties": {"b": {"$ref": "#/components/schemas/B"}}},
+            "B": {"items": {"$ref": "#/components/schemas/A"}},
+        }}
+    })
+    assert resolver.dependencies({"schema": {"$ref": "#/components/schemas/A"}}) == {
+        "#/components/schemas/A", "#/components/schemas/B"
+    }
+
+def test_referenced_parameters_and_responses_are_validated(swagger_dict, rules):
+    assert HeaderValidator(swagger_dict, "", rules).validate_headers() == []
+
+    errors = ResponseValidator(swagger_dict, "", rules).validate_responses()
+    assert len(errors) == 2000
+    assert errors[0].startswith("Le type du champ 'id' dans la réponse pour le code '200' (type de contenu 'application/json') "
+                                "dans GET /api/v1/item0 est 'string', "
+                                "mais il devrait être 'integer'.")
+
+    reserved = [finding for finding in ProjetRulesValidator(swagger_dict, "", rules=rules).iter_findings()
+                if finding.rule_id == "reserved.header"]
+    assert len(reserved) == 2000
+    assert reserved[0].subject == "X-Secret"
+    assert reserved[0].pointer == "/components/parameters/Secret/name"
+
+def test_shared_component_is_compared_once(swagger_dict, rules, monkeypatch):
+    validator = ResponseValidator(swagger_dict, "", rules)
+    calls = []
+    compare = validator._compare_response_schema
+    monkeypatch.setattr(validator, "_compare_response_schema",
+                        lambda *args: calls.append(args) or compare(*args))
+    assert len(validator.validate_responses()) == 2000
+    assert len(calls) == 1
+
+def test_incremental_cache_tracks_referenced_components(swagger_dict, rules):
+    cache = IncrementalCache(context=rules)
+    list(ProjetRulesValidator(swagger_dict, "", rules=rules).iter_errors(cache))
+    cache.save()
+
+    changed = copy.deepcopy(swagger_dict)
+    changed["components"]["schemas"]["Identifier"]["type"] = "integer"
+    cache.hits = cache.misses = 0
+    errors = list(ProjetRulesValidator(changed, "", rules=rules).iter_errors(cache))
+    # Chaque opération est réévaluée ; seuls les caractères spéciaux des chemins (inchangés) sont repris du cache
+    assert cache.misses == 2000
+    assert errors == list(ProjetRulesValidator(changed, "", rules=rules).iter_errors())
+    assert not any("Le type du champ 'id'" in error for error in errors)